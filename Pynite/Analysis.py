@@ -1,18 +1,19 @@
 from __future__ import annotations  # Allows more recent type hints features
 from typing import TYPE_CHECKING
-from math import isclose
 
-from numpy import array, atleast_2d, zeros, subtract, matmul, divide, seterr, nanmax
+from numpy import array, asarray, atleast_2d, zeros, empty, reshape, subtract, matmul, divide, seterr, nanmax, absolute, flatnonzero, where, cross
 from numpy.linalg import solve
 
 from Pynite.LoadCombo import LoadCombo
+from Pynite.SparsePattern import SparsePattern
 
 if TYPE_CHECKING:
-    from typing import List, Tuple
+    from typing import Dict, List, Tuple
     from Pynite.FEModel3D import FEModel3D
     from numpy import float64
     from numpy.typing import NDArray
-    from scipy.sparse import lil_matrix
+    from scipy.sparse import spmatrix, csr_matrix
+    from Pynite.Solvers import Solver, Factorization, LowRankUpdate
 
 
 def _prepare_model(model: FEModel3D) -> None:
@@ -89,67 +90,95 @@ def _identify_combos(model: FEModel3D, combo_tags: List[str] | None = None) -> L
     return combo_list
 
 
-def _check_stability(model: FEModel3D, K: NDArray[float64]) -> None:
+# The description of each of the 6 degrees of freedom of a node, used to report instabilities
+_directions = ('for translation in the global X direction.',
+               'for translation in the global Y direction.',
+               'for translation in the global Z direction.',
+               'for rotation about the global X axis.',
+               'for rotation about the global Y axis.',
+               'for rotation about the global Z axis.')
+
+
+def _check_stability(model: FEModel3D, K: NDArray[float64] | spmatrix, tol: float = 1e-12) -> None:
     """
-    Identifies nodal instabilities in a model's stiffness matrix.
+    Identifies nodal instabilities in a model's stiffness matrix. A degree of freedom is unstable
+    if it is not supported and its diagonal term, or its whole row, has no stiffness. Terms
+    smaller than `tol` times the largest diagonal term count as zero.
     """
 
-    # Initialize the `unstable` flag to `False`
-    unstable = False
-
-    # Step through each diagonal term in the stiffness matrix
-    for i in range(K.shape[0]):
-        
-        # Determine which node this term belongs to
-        node = [node for node in model.nodes.values() if node.ID == int(i/6)][0]
-
-        # Determine which degree of freedom this term belongs to
-        dof = i%6
-
-        # Check to see if this degree of freedom is supported
-        if dof == 0:
-            supported = node.support_DX
-        elif dof == 1:
-            supported = node.support_DY
-        elif dof == 2:
-            supported = node.support_DZ
-        elif dof == 3:
-            supported = node.support_RX
-        elif dof == 4:
-            supported = node.support_RY
-        elif dof == 5:
-            supported = node.support_RZ
-
-        # Check if the degree of freedom on this diagonal is unstable
-        if isclose(K[i, i], 0) and not supported:
-
-            # Flag the model as unstable
-            unstable = True
-
-            # Identify which direction this instability affects
-            if i%6 == 0:
-                direction = 'for translation in the global X direction.'
-            if i%6 == 1:
-                direction = 'for translation in the global Y direction.'
-            if i%6 == 2:
-                direction = 'for translation in the global Z direction.'
-            if i%6 == 3:
-                direction = 'for rotation about the global X axis.'
-            if i%6 == 4:
-                direction = 'for rotation about the global Y axis.'
-            if i%6 == 5:
-                direction = 'for rotation about the global Z axis.'
-
-            # Print a message to the console
-            print('* Nodal instability detected: node ' + node.name + ' is unstable ' + direction)
-
-    if unstable:
+    # The diagonal and the absolute row sums, for dense and sparse matrices alike
+    if hasattr(K, 'tocsr'):
+        diagonal = absolute(K.diagonal())
+        row_sums = asarray(abs(K).sum(axis=1)).ravel()
+    else:
+        K = asarray(K)
+        diagonal = absolute(K.diagonal())
+        row_sums = absolute(K).sum(axis=1)
+
+    # The supports of each degree of freedom, in the order of the stiffness matrix
+    names = empty(K.shape[0]//6, dtype=object)
+    supported = zeros((K.shape[0]//6, 6), dtype=bool)
+    for node in model.nodes.values():
+        names[node.ID] = node.name
+        supported[node.ID] = (node.support_DX, node.support_DY, node.support_DZ,
+                              node.support_RX, node.support_RY, node.support_RZ)
+
+    zero = tol*diagonal.max() if len(diagonal) > 0 else 0
+    unstable = flatnonzero(((diagonal <= zero) | (row_sums <= zero)) & ~supported.ravel())
+
+    # Print a message to the console for each unstable degree of freedom
+    for i in unstable:
+        print('* Nodal instability detected: node ' + names[i//6] + ' is unstable ' + _directions[i%6])
+
+    if len(unstable) > 0:
         raise Exception('Unstable node(s). See console output for details.')
 
     return
 
 
-def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False, max_iter: int = 30) -> None:
+def _check_mechanism(model: FEModel3D, factorization: Factorization, D1_indices: List[int], tol: float = 1e-10) -> None:
+    """
+    Identifies mechanisms from the pivots of a factorization of `K11`. A mechanism has stiffness
+    at every node, so it passes `_check_stability`, but leaves a pivot of the factorization that
+    is close to zero. Pivots smaller than `tol` times the largest one are reported. Backends that
+    do not provide pivots are not checked.
+    """
+
+    pivots = factorization.pivots
+    if pivots is None or len(pivots) == 0:
+        return
+
+    D1_indices = array(D1_indices, dtype=int)
+    unstable = D1_indices[flatnonzero(pivots <= tol*pivots.max())]
+
+    if len(unstable) == 0:
+        return
+
+    names = {node.ID: node.name for node in model.nodes.values()}
+
+    # Print a message to the console for each degree of freedom the mechanism was found at
+    for i in unstable:
+        print('* Mechanism detected: node ' + names[i//6] + ' is unstable ' + _directions[i%6])
+
+    raise Exception('Mechanism detected. The structure is unstable. See console output for details.')
+
+
+def _check_converged_mechanism(model: FEModel3D, factorization: Factorization | LowRankUpdate, D1_indices: List[int]) -> None:
+    """
+    Identifies mechanisms of the converged active set of a tension/compression-only analysis.
+    Intermediate active sets may be mechanisms the iterations step through, so only the converged
+    one is checked. Updates of a factorization have no pivots of their own, so the converged
+    matrix is factorized again by the same backend in that case.
+    """
+
+    if factorization is not factorization.base:
+        base = factorization.base
+        factorization = base.pattern.factorize(factorization.K11, base.solver)
+
+    _check_mechanism(model, factorization, D1_indices)
+
+
+def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False, max_iter: int = 30, iterative: str | None = None, tol: float = 1e-8, solver: str | Solver = 'superlu') -> Tuple[NDArray[float64] | csr_matrix, NDArray[float64] | csr_matrix]:
     """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material-specific codes. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered by Pynite at this time.
 
     :param model: The finite element model to be solved.
@@ -170,18 +199,25 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
     :type sparse: bool, optional
     :param check_stability: Indicates whether nodal stability should be checked. This slows down the analysis considerably, but can be useful for small models or for debugging. Default is `False`.
     :type check_stability: bool, optional
+    :param iterative: Solves the second step with the iterative solver `'cg'` or `'gmres'`, preconditioned by the factorization of the elastic stiffness matrix from the first step. The elastic stiffness matrix is then factorized only once. If `None` the second step is factorized as well. Only used by the sparse solver. Default is `None`.
+    :type iterative: str, optional
+    :param tol: The relative residual the iterative solver has to reach. Default is 1e-8.
+    :type tol: float, optional
+    :param solver: The sparse solver backend, given by its name in `Solvers.solvers` or as an instance. Default is `'superlu'`.
+    :type solver: str or Solver, optional
     :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
     :raises Exception: Occurs when a model fails to converge.
+    :return: The partitioned stiffness matrices `K21` and `K22` of the last iteration, including the geometric stiffness. Used to calculate the reactions.
+    :rtype: tuple
     """
 
-    # Import `scipy` features if the sparse solver is being used
-    if sparse == True:
-        from scipy.sparse.linalg import spsolve
-
     convergence_TC = False  # Tracks tension/compression-only convergence
     divergence_TC = False   # Tracks tension/compression-only divergence
     iter_count_TC = 1
 
+    # The factorization of the elastic stiffness matrix is kept between tension/compression-only iterations
+    base = None
+
     # Iterate until either T/C convergence or divergence occurs. Perform at least 2 iterations for the P-Delta analysis.
     while convergence_TC == False and divergence_TC == False:
 
@@ -202,13 +238,10 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
                     # Calculate the partitioned initial stiffness matrices. These matrices must be recalculated on each T/C iteration due to tension/compression-only members deactivating or reactivating.
                     if log:
                         print('- Calculating initial stiffness matrix')
-                    K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
-
-                    # The initial stiffness matrices are currently `lil` format which is great for memory, but slow for mathematical operations. They will be converted to `csr` format.
-                    K11 = K11.tocsr()
-                    K12 = K12.tocsr()
-                    K21 = K21.tocsr()
-                    K22 = K22.tocsr()
+                    # The partitioned matrices are built in `csr` format from the sparsity pattern of the model's topology.
+                    K = model.K(combo_name, log, check_stability, sparse)
+                    pattern = SparsePattern.get(K, D1_indices)
+                    K11, K12, K21, K22 = pattern.partition(K)
 
                 # Check if we are ready to calculate the geometric stiffness
                 if solution_step == 2:
@@ -217,12 +250,12 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
                     if log: print('- Calculating geometric stiffness matrix')
                     Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
-                    # The Kg stiffness matrices are currently `lil` format which is great for memory, but slow for mathematical operations. They will be converted to `csr` format. Note that the `+` operator performs matrix addition on `csr` matrices.
+                    # The partitioned Kg matrices are in `csr` format. Note that the `+` operator performs matrix addition on `csr` matrices.
                     if log: print('- Summing initial & geometric stiffness matrices')
-                    K11 = K11 + Kg11.tocsr()
-                    K12 = K12 + Kg12.tocsr()
-                    K21 = K21 + Kg21.tocsr()
-                    K22 = K22 + Kg22.tocsr()
+                    K11 = K11 + Kg11
+                    K12 = K12 + Kg12
+                    K21 = K21 + Kg21
+                    K22 = K22 + Kg22
 
             # Determine if the user has selected a dense solution
             else:
@@ -236,7 +269,7 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
                 if solution_step == 2:
 
                     # After the first iteration, the geometric stiffness matrix will be added to the linear elastic stiffness matrix.
-                    Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
+                    Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
                     K11 = K11 + Kg11
                     K12 = K12 + Kg12
@@ -254,8 +287,28 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
                     # Calculate the displacements, `D1`
                     if sparse == True:
                         # The partitioned stiffness matrix is already in `csr` format. The `@` operator performs matrix multiplication on sparse matrices.
-                        D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                        D1 = D1.reshape(len(D1), 1)
+                        rhs = subtract(subtract(P1, FER1), K12 @ D2)
+
+                        if solution_step == 1:
+                            # Factorize the elastic stiffness matrix, or update the factorization of the previous tension/compression-only iteration
+                            if base is None or base.pattern is not pattern:
+                                elastic = pattern.factorize(K11, solver)
+                            else:
+                                elastic = base.update(K11)
+                            base = elastic.base
+                            D1 = elastic.solve(rhs)
+
+                        elif iterative is None:
+                            D1 = pattern.solve(K11, rhs, solver)
+
+                        else:
+                            # Start from the first step and precondition with the elastic factorization
+                            D1, iterations, residual, direct = _iterative_solve(K11, rhs, elastic, D1, iterative, tol)
+                            model.PDelta_iterations.setdefault(combo_name, []).append((iterations, residual, direct))
+                            if log and direct:
+                                print(f'- {iterative} did not converge in {iterations} iteration(s), solved directly to a relative residual of {residual:.3g}')
+                            elif log:
+                                print(f'- {iterative} converged in {iterations} iteration(s) to a relative residual of {residual:.3g}')
                     else:
                         # The partitioned stiffness matrix is in `csr` format. It will be converted to a 2D dense array for mathematical operations.
                         D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
@@ -285,6 +338,10 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
             if log:
                 print('- Tension/compression-only analysis converged after ' + str(iter_count_TC) + ' iteration(s)')
 
+            # Check the pivots of the elastic stiffness matrix of the converged active set for mechanisms
+            if check_stability and sparse == True and K11.shape != (0, 0):
+                _check_converged_mechanism(model, elastic, D1_indices)
+
         # Check for divergence in the tension/compression-only analysis
         if iter_count_TC > max_iter:
             divergence_TC = True
@@ -293,6 +350,62 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
     # Flag the model as solved
     model.solution = 'P-Delta'
 
+    return K21, K22
+
+
+def _iterative_solve(A: csr_matrix, b: NDArray[float64], preconditioner: Factorization | LowRankUpdate, x0: NDArray[float64], method: str = 'gmres', tol: float = 1e-8) -> Tuple[NDArray[float64], int, float, bool]:
+    """Solves `A x = b` with a preconditioned iterative solver. If the solver does not reach the tolerance the system is factorized and solved directly instead.
+
+    :param A: The matrix, such as the sum of the elastic and the geometric stiffness matrix.
+    :type A: csr_matrix
+    :param b: The right hand side, shaped (n, 1).
+    :type b: ndarray
+    :param preconditioner: A factorization of a matrix close to `A`, such as the elastic stiffness matrix.
+    :type preconditioner: Factorization or LowRankUpdate
+    :param x0: The initial guess, shaped (n, 1).
+    :type x0: ndarray
+    :param method: `'cg'` for conjugate gradients or `'gmres'`. Default is `'gmres'`.
+    :type method: str, optional
+    :param tol: The relative residual to reach. Default is 1e-8.
+    :type tol: float, optional
+    :return: The solution shaped (n, 1), the number of iterations, the relative residual reached and whether the system was solved directly because the tolerance was not reached.
+    :rtype: ndarray, int, float, bool
+    """
+
+    from scipy.sparse.linalg import LinearOperator, cg, gmres, splu
+    from numpy.linalg import norm
+
+    n = A.shape[0]
+    M = LinearOperator((n, n), matvec=lambda x: preconditioner.solve(x.reshape(n)), dtype=float)
+
+    # Count the iterations with the callback
+    iterations = [0]
+    def count(*args):
+        iterations[0] += 1
+
+    if method == 'cg':
+        solver, options = cg, {}
+    elif method == 'gmres':
+        solver, options = gmres, {'callback_type': 'pr_norm'}
+    else:
+        raise ValueError(f"Unknown iterative solver '{method}'. Use 'cg' or 'gmres'.")
+
+    # The tolerance was renamed from `tol` to `rtol` in scipy 1.12
+    try:
+        x, info = solver(A, b.reshape(n), x0=x0.reshape(n), rtol=tol, M=M, callback=count, **options)
+    except TypeError:
+        x, info = solver(A, b.reshape(n), x0=x0.reshape(n), tol=tol, M=M, callback=count, **options)
+
+    # Fall back to a direct solution if the tolerance has not been reached
+    direct = info != 0
+    if direct:
+        x = splu(A.tocsc()).solve(b.reshape(n))
+
+    b_norm = norm(b)
+    residual = norm(b.reshape(n) - A @ x)/b_norm if b_norm > 0 else 0.0
+
+    return x.reshape(n, 1), iterations[0], float(residual), direct
+
 
 def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num: int, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False) -> None:
 
@@ -310,25 +423,23 @@ def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num:
 
             # Calculate the initial stiffness matrix
             if log: print('- Calculating elastic stiffness matrix [Ke]')
-            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
+            K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
 
             # Calculate the geometric stiffness matrix
             # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
             if log: print('- Calculating geometric stiffness matrix [Kg]')
-            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False).tolil(), D1_indices, D2_indices)
+            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
             # Calculate the stiffness reduction matrix
             if log: print('- Calculating plastic reduction matrix [Km]')
-            Km11, Km12, Km21, Km22 = _partition(model, model.Km(combo_name, push_combo, step_num, log, sparse).tolil(), D1_indices, D2_indices)
+            Km11, Km12, Km21, Km22 = _partition(model, model.Km(combo_name, push_combo, step_num, log, sparse), D1_indices, D2_indices)
 
-            # The stiffness matrices are currently `lil` format which is great for
-            # memory, but slow for mathematical operations. They will be converted to
-            # `csr` format. The `+` operator performs matrix addition on `csr`
-            # matrices.
-            K11 = K11.tocsr() + Kg11.tocsr() + Km11.tocsr()
-            K12 = K12.tocsr() + Kg12.tocsr() + Km12.tocsr()
-            K21 = K21.tocsr() + Kg21.tocsr() + Km21.tocsr()
-            K22 = K22.tocsr() + Kg22.tocsr() + Km22.tocsr()
+            # The partitioned stiffness matrices are in `csr` format. The `+` operator
+            # performs matrix addition on `csr` matrices.
+            K11 = K11 + Kg11 + Km11
+            K12 = K12 + Kg12 + Km12
+            K21 = K21 + Kg21 + Km21
+            K22 = K22 + Kg22 + Km22
 
         # Dense solver
         else:
@@ -340,7 +451,7 @@ def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num:
             # Geometric stiffness matrix
             # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
             if log: print('Calculating geometric stiffness matrix [Kg]')
-            Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
+            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
             # Calculate the stiffness reduction matrix
             if log: print('Calculating plastic reduction matrix [Km]')
@@ -362,7 +473,7 @@ def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num:
                 if sparse == True:
                     # The partitioned stiffness matrix is already in `csr` format. The `@`
                     # operator performs matrix multiplication on sparse matrices.
-                    Delta_D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
+                    Delta_D1 = spsolve(K11, subtract(subtract(P1, FER1), K12 @ D2))
                     Delta_D1 = Delta_D1.reshape(len(Delta_D1), 1)
                 else:
                     # The partitioned stiffness matrix is in `csr` format. It will be
@@ -438,20 +549,10 @@ def _unpartition_disp(model: FEModel3D, D1: NDArray[float64], D2: NDArray[float6
     
     D = zeros((len(model.nodes)*6, 1))
 
-    # Step through each node in the model
-    for node in model.nodes.values():
-        
-        # Step through each degree of freedom at the node
-        for i in range(6):
-
-            # Check if the dof is in the list of enforced displacements
-            if node.ID*6 + i in D2_indices:
-                # Get the enforced displacement
-                D[(node.ID*6 + i, 0)] = D2[D2_indices.index(node.ID*6 + i), 0]
-            else:
-                # Get the calculated displacement
-                D[(node.ID*6 + i, 0)] = D1[D1_indices.index(node.ID*6 + i), 0]
-    
+    # Place the enforced and the calculated displacements at their degrees of freedom
+    D[D2_indices, :] = reshape(D2, (len(D2_indices), 1))
+    D[D1_indices, :] = reshape(D1, (len(D1_indices), 1))
+
     # Return the displacement vector
     return D
 
@@ -666,10 +767,14 @@ def _check_TC_convergence(model: FEModel3D, combo_name: str = "Combo 1", log: bo
     return convergence
 
 
-def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] | None = None) -> None:
+def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] | None = None, partitions: Dict[str, Tuple[NDArray[float64] | spmatrix, NDArray[float64] | spmatrix]] | None = None, sparse: bool = True) -> None:
     """
     Calculates reactions internally once the model is solved.
 
+    The forces of the elements at the known displacements are `K21 D1 + K22 D2 + FER2`. The
+    reactions are these forces less the nodal loads `P2`, so every load combination takes one
+    matrix product with the partitioned stiffness matrices of the analysis.
+
     Parameters
     ----------
     model : FEModel3D
@@ -678,6 +783,10 @@ def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] |
         Prints updates to the console if set to True. Default == False.
     combo_tags : string, optional
         A list of tags that will be used to identify which load combinations need their reactions calculated. If set to `None` then all load combinations will have their reactions calculated. Default is `None`.
+    partitions : dict, optional
+        The partitioned stiffness matrices `(K21, K22)` the displacements of each load combination were solved with, by the name of the load combination. The matrices of load combinations that are missing are built again. Default is `None`.
+    sparse : bool, optional
+        Indicates whether missing matrices are built as sparse matrices. Default is True.
     """
 
     # Print a status update to the console
@@ -687,240 +796,56 @@ def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] |
     # Identify which load combinations to evaluate
     combo_list = _identify_combos(model, combo_tags)
 
-    # Calculate the reactions node by node
-    for node in model.nodes.values():
+    if partitions is None:
+        partitions = {}
 
-        # Step through each load combination
-        for combo in combo_list:
-
-            # Initialize reactions for this node and load combination
-            node.RxnFX[combo.name] = 0.0
-            node.RxnFY[combo.name] = 0.0
-            node.RxnFZ[combo.name] = 0.0
-            node.RxnMX[combo.name] = 0.0
-            node.RxnMY[combo.name] = 0.0
-            node.RxnMZ[combo.name] = 0.0
+    D1_indices, D2_indices, _ = _partition_D(model)
 
-            # Determine if the node has any supports
-            if (node.support_DX or node.support_DY or node.support_DZ 
-            or  node.support_RX or node.support_RY or node.support_RZ):
-
-                # Sum the spring end forces at the node
-                for spring in model.springs.values():
+    # The supports and the stiffness of the active nodal springs of each degree of freedom
+    n = len(model.nodes)*6
+    supported = zeros(n, dtype=bool)
+    springs = zeros(n)
+    for node in model.nodes.values():
+        supported[node.ID*6:node.ID*6 + 6] = (node.support_DX, node.support_DY, node.support_DZ,
+                                              node.support_RX, node.support_RY, node.support_RZ)
+        for i, spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ,
+                                    node.spring_RX, node.spring_RY, node.spring_RZ)):
+            if spring[0] is not None and spring[2] == True:
+                springs[node.ID*6 + i] = float(spring[0])
 
-                    if spring.i_node == node and spring.active[combo.name] == True:
+    for combo in combo_list:
 
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        spring_F = spring.F(combo.name)
+        # Get the partitioned stiffness matrices, or build them if the analysis did not pass them
+        if combo.name in partitions:
+            K21, K22 = partitions[combo.name]
+        elif sparse:
+            K = model.K(combo.name, False, False, sparse)
+            K21, K22 = SparsePattern.get(K, D1_indices).partition(K)[2:]
+        else:
+            K21, K22 = _partition(model, model.K(combo.name, False, False, sparse), D1_indices, D2_indices)[2:]
 
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[5, 0]
-
-                    elif spring.j_node == node and spring.active[combo.name] == True:
-
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        spring_F = spring.F(combo.name)
+        D = model._D[combo.name]
+        P = model.P(combo.name)
+        FER = model.FER(combo.name)
 
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[11, 0]
-
-                # Step through each physical member in the model
-                for phys_member in model.members.values():
-
-                    # Sum the sub-member end forces at the node
-                    for member in phys_member.sub_members.values():
+        # The element forces at the known displacements, including the nodal springs
+        F = zeros((n, 1))
+        F[D2_indices] = K21 @ D[D1_indices] + K22 @ D[D2_indices] + FER[D2_indices]
 
-                        if member.i_node == node and phys_member.active[combo.name] == True:
-
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                            member_F = member.F(combo.name)
-
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[0, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[1, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[2, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[3, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[4, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[5, 0]
-
-                        elif member.j_node == node and phys_member.active[combo.name] == True:
-
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                            member_F = member.F(combo.name)
-
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[6, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[7, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[8, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[9, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[10, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[11, 0]
-
-                # Sum the plate forces at the node
-                for plate in model.plates.values():
-
-                    if plate.i_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[5, 0]
-
-                    elif plate.j_node == node:
+        # Supports take the element forces less the nodal loads. The stiffness of the nodal springs
+        # is part of `K22`, so it is removed from the element forces. Nodal springs react to their
+        # own displacement, at supports and free nodes alike.
+        R = where(supported, F[:, 0] - P[:, 0] - springs*D[:, 0], 0) - springs*D[:, 0]
 
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[11, 0]
-
-                    elif plate.m_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[17, 0]
-
-                    elif plate.n_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[23, 0]
-
-                # Sum the quad forces at the node
-                for quad in model.quads.values():
-
-                    if quad.i_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[5, 0]
-
-                    elif quad.j_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[11, 0]
-
-                    elif quad.m_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[17, 0]
-
-                    elif quad.n_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed                    
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[23, 0]
-
-                # Sum the joint loads applied to the node
-                for load in node.NodeLoads:
-
-                    for case, factor in combo.factors.items():
-
-                        if load[2] == case:
-
-                            if load[0] == 'FX' and node.support_DX:
-                                node.RxnFX[combo.name] -= load[1]*factor
-                            elif load[0] == 'FY' and node.support_DY:
-                                node.RxnFY[combo.name] -= load[1]*factor
-                            elif load[0] == 'FZ' and node.support_DZ:
-                                node.RxnFZ[combo.name] -= load[1]*factor
-                            elif load[0] == 'MX' and node.support_RX:
-                                node.RxnMX[combo.name] -= load[1]*factor
-                            elif load[0] == 'MY' and node.support_RY:
-                                node.RxnMY[combo.name] -= load[1]*factor
-                            elif load[0] == 'MZ' and node.support_RZ:
-                                node.RxnMZ[combo.name] -= load[1]*factor
-
-            # Calculate any reactions due to active spring supports at the node
-            if node.spring_DX[0] is not None and node.spring_DX[2] == True:
-                k = float(node.spring_DX[0])
-                DX = node.DX[combo.name]
-                node.RxnFX[combo.name] -= k*DX
-            if node.spring_DY[0] is not None and node.spring_DY[2] == True:
-                k = float(node.spring_DY[0])
-                DY = node.DY[combo.name]
-                node.RxnFY[combo.name] -= k*DY
-            if node.spring_DZ[0] is not None and node.spring_DZ[2] == True:
-                k = float(node.spring_DZ[0])
-                DZ = node.DZ[combo.name]
-                node.RxnFZ[combo.name] -= k*DZ
-            if node.spring_RX[0] is not None and node.spring_RX[2] == True:
-                k = float(node.spring_RX[0])
-                RX = node.RX[combo.name]
-                node.RxnMX[combo.name] -= k*RX
-            if node.spring_RY[0] is not None and node.spring_RY[2] == True:
-                k = float(node.spring_RY[0])
-                RY = node.RY[combo.name]
-                node.RxnMY[combo.name] -= k*RY
-            if node.spring_RZ[0] is not None and node.spring_RZ[2] == True:
-                k = float(node.spring_RZ[0])
-                RZ = node.RZ[combo.name]
-                node.RxnMZ[combo.name] -= k*RZ
+        # Store the reactions to the nodes
+        for node in model.nodes.values():
+            RFX, RFY, RFZ, RMX, RMY, RMZ = R[node.ID*6:node.ID*6 + 6].tolist()
+            node.RxnFX[combo.name] = RFX
+            node.RxnFY[combo.name] = RFY
+            node.RxnFZ[combo.name] = RFZ
+            node.RxnMX[combo.name] = RMX
+            node.RxnMY[combo.name] = RMY
+            node.RxnMZ[combo.name] = RMZ
 
 
 def _check_statics(model: FEModel3D, combo_tags: List[str] | None = None) -> None:
@@ -953,58 +878,28 @@ def _check_statics(model: FEModel3D, combo_tags: List[str] | None = None) -> Non
             if any(tag in combo.combo_tags for tag in combo_tags):
                 combo_list.append(combo)
 
+    # The coordinates of the nodes, in the order of the global vectors
+    XYZ = zeros((len(model.nodes), 3))
+    for node in model.nodes.values():
+        XYZ[node.ID] = (node.X, node.Y, node.Z)
+
     # Step through each load combination
     for combo in combo_list:
 
-        # Initialize force and moment summations to zero
-        SumFX, SumFY, SumFZ = 0.0, 0.0, 0.0
-        SumMX, SumMY, SumMZ = 0.0, 0.0, 0.0
-        SumRFX, SumRFY, SumRFZ = 0.0, 0.0, 0.0
-        SumRMX, SumRMY, SumRMZ = 0.0, 0.0, 0.0
+        # Get the nodal forces from the global force vector and the global fixed end reaction vector
+        F = (model.P(combo.name) - model.FER(combo.name)).reshape(-1, 6)
 
-        # Get the global force vector and the global fixed end reaction vector
-        P = model.P(combo.name)
-        FER = model.FER(combo.name)
-
-        # Step through each node and sum its forces
+        # Get the nodal reactions
+        R = zeros((len(model.nodes), 6))
         for node in model.nodes.values():
+            R[node.ID] = (node.RxnFX[combo.name], node.RxnFY[combo.name], node.RxnFZ[combo.name],
+                          node.RxnMX[combo.name], node.RxnMY[combo.name], node.RxnMZ[combo.name])
 
-            # Get the node's coordinates
-            X = node.X
-            Y = node.Y
-            Z = node.Z
-
-            # Get the nodal forces
-            FX = P[node.ID*6+0][0] - FER[node.ID*6+0][0]
-            FY = P[node.ID*6+1][0] - FER[node.ID*6+1][0]
-            FZ = P[node.ID*6+2][0] - FER[node.ID*6+2][0]
-            MX = P[node.ID*6+3][0] - FER[node.ID*6+3][0]
-            MY = P[node.ID*6+4][0] - FER[node.ID*6+4][0]
-            MZ = P[node.ID*6+5][0] - FER[node.ID*6+5][0]
-
-            # Get the nodal reactions
-            RFX = node.RxnFX[combo.name]
-            RFY = node.RxnFY[combo.name]
-            RFZ = node.RxnFZ[combo.name]
-            RMX = node.RxnMX[combo.name]
-            RMY = node.RxnMY[combo.name]
-            RMZ = node.RxnMZ[combo.name]
-
-            # Sum the global forces
-            SumFX += FX
-            SumFY += FY
-            SumFZ += FZ
-            SumMX += MX - FY*Z + FZ*Y
-            SumMY += MY + FX*Z - FZ*X
-            SumMZ += MZ - FX*Y + FY*X
-
-            # Sum the global reactions
-            SumRFX += RFX
-            SumRFY += RFY
-            SumRFZ += RFZ
-            SumRMX += RMX - RFY*Z + RFZ*Y
-            SumRMY += RMY + RFX*Z - RFZ*X
-            SumRMZ += RMZ - RFX*Y + RFY*X 
+        # Sum the global forces and reactions, and their moments about the origin
+        SumFX, SumFY, SumFZ = F[:, :3].sum(axis=0)
+        SumMX, SumMY, SumMZ = (F[:, 3:] + cross(XYZ, F[:, :3])).sum(axis=0)
+        SumRFX, SumRFY, SumRFZ = R[:, :3].sum(axis=0)
+        SumRMX, SumRMY, SumRMZ = (R[:, 3:] + cross(XYZ, R[:, :3])).sum(axis=0)
 
         # Add the results to the table
         statics_table.add_row([combo.name, '{:.3g}'.format(SumFX), '{:.3g}'.format(SumRFX),
@@ -1115,16 +1010,16 @@ def _partition_D(model: FEModel3D) -> Tuple[List[int], List[int], NDArray[float6
     return D1_indices, D2_indices, D2
 
 
-def _partition(model: FEModel3D, unp_matrix: NDArray[float64] | lil_matrix, D1_indices: List[int], D2_indices: List[int]) -> Tuple[NDArray[float64], NDArray[float64]] | Tuple[NDArray[float64], NDArray[float64], NDArray[float64], NDArray[float64]]:
+def _partition(model: FEModel3D, unp_matrix: NDArray[float64] | spmatrix, D1_indices: List[int], D2_indices: List[int]) -> Tuple[NDArray[float64], NDArray[float64]] | Tuple[NDArray[float64], NDArray[float64], NDArray[float64], NDArray[float64]]:
     """Partitions a matrix (or vector) into submatrices (or subvectors) based on degree of freedom boundary conditions.
 
-    :param unp_matrix: The unpartitioned matrix (or vector) to be partitioned.
-    :type unp_matrix: ndarray or lil_matrix
+    :param unp_matrix: The unpartitioned matrix (or vector) to be partitioned. Sparse matrices can be given in any scipy format.
+    :type unp_matrix: ndarray or spmatrix
     :param D1_indices: A list of the indices for degrees of freedom that have unknown displacements.
     :type D1_indices: list
     :param D2_indices: A list of the indices for degrees of freedom that have known displacements.
     :type D2_indices: list
-    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions.
+    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions. Sparse submatrices are returned in `csr` format.
     :rtype: array, array, array, array
     """
 
@@ -1136,7 +1031,19 @@ def _partition(model: FEModel3D, unp_matrix: NDArray[float64] | lil_matrix, D1_i
         m1 = unp_matrix[D1_indices, :]
         m2 = unp_matrix[D2_indices, :]
         return m1, m2
-    # 2D matrices
+    # Sparse 2D matrices
+    elif hasattr(unp_matrix, 'tocsr'):
+        # Select the rows from the `csr` format and the columns from the `csc` format. Both are
+        # compressed in the direction being sliced, so no intermediate `lil` matrix is needed.
+        unp_matrix = unp_matrix.tocsr()
+        rows1 = unp_matrix[D1_indices, :].tocsc()
+        rows2 = unp_matrix[D2_indices, :].tocsc()
+        m11 = rows1[:, D1_indices].tocsr()
+        m12 = rows1[:, D2_indices].tocsr()
+        m21 = rows2[:, D1_indices].tocsr()
+        m22 = rows2[:, D2_indices].tocsr()
+        return m11, m12, m21, m22
+    # Dense 2D matrices
     else:
         # Partition the matrix into 4 submatrices
         m11 = unp_matrix[D1_indices, :][:, D1_indices]
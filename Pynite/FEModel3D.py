@@ -3,12 +3,14 @@
 from __future__ import annotations  # Allows more recent type hints features
 from typing import TYPE_CHECKING, Literal
 
-from numpy import array, zeros, matmul, subtract
+from numpy import array, zeros, matmul, subtract, hstack, arange, newaxis, broadcast_to, concatenate, add
+from numpy import linspace, repeat, cumsum, searchsorted
 from numpy.linalg import solve
 
 from Pynite.Node3D import Node3D
 from Pynite.Material import Material
 from Pynite.Section import Section, SteelSection
+from Pynite.Member3D import Member3D
 from Pynite.PhysMember import PhysMember
 from Pynite.Spring3D import Spring3D
 from Pynite.Quad3D import Quad3D
@@ -16,6 +18,7 @@ from Pynite.Plate3D import Plate3D
 from Pynite.LoadCombo import LoadCombo
 from Pynite.Mesh import Mesh, RectangleMesh, AnnulusMesh, FrustrumMesh, CylinderMesh
 from Pynite.ShearWall import ShearWall
+from Pynite.SparsePattern import SparsePattern
 from Pynite import Analysis
 
 if TYPE_CHECKING:
@@ -51,6 +54,7 @@ class FEModel3D():
         self._D: Dict[str, NDArray[float64]] = {}      # A dictionary of the model's nodal displacements by load combination
 
         self.solution: str | None = None  # Indicates the solution type for the latest run of the model
+        self.PDelta_iterations: Dict[str, list] = {}   # Iteration counts, residuals and direct fallbacks of the iterative P-Delta solver by load combination
 
     @property
     def load_cases(self) -> List[str]:
@@ -1335,9 +1339,9 @@ class FEModel3D():
         # Flag the model as unsolved
         self.solution = None
 
-    def K(self, combo_name='Combo 1', log=False, check_stability=True, sparse=True):
+    def K(self, combo_name='Combo 1', log=False, check_stability=True, sparse=True, vectorized=True):
         """Returns the model's global stiffness matrix. The stiffness matrix will be returned in
-           scipy's sparse lil format, which reduces memory usage and can be easily converted to
+           scipy's sparse coo format, which reduces memory usage and can be easily converted to
            other formats.
 
         :param combo_name: The load combination to get the stiffness matrix for. Defaults to 'Combo 1'.
@@ -1350,6 +1354,41 @@ class FEModel3D():
         :param sparse: Returns a sparse matrix if set to True, and a dense matrix otherwise.
                        Defaults to True.
         :type sparse: bool, optional
+        :param vectorized: Assembles the sparse matrix from stacked element stiffness matrices in
+                           a single step if set to True. Otherwise the terms are placed element by
+                           element, which is kept as a reference. Only used if `sparse` is True.
+                           Defaults to True.
+        :type vectorized: bool, optional
+        :return: The global stiffness matrix for the structure.
+        :rtype: ndarray or coo_matrix
+        """
+
+        if sparse == True and vectorized == True:
+            K = self._K_vectorized(combo_name, log)
+        else:
+            K = self._K_reference(combo_name, log, sparse)
+
+        # Check that there are no nodal instabilities
+        if check_stability:
+            if log: print('- Checking nodal stability')
+            if sparse: Analysis._check_stability(self, K.tocsr())
+            else: Analysis._check_stability(self, K)
+
+        # Return the global stiffness matrix
+        return K
+
+    def _K_reference(self, combo_name='Combo 1', log=False, sparse=True):
+        """Assembles the global stiffness matrix term by term, looping over every element and
+           degree of freedom. This is the original assembly procedure. It is kept as a reference
+           for `_K_vectorized` and is used for dense matrices.
+
+        :param combo_name: The load combination to get the stiffness matrix for. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param log: Prints updates to the console if set to True. Defaults to False.
+        :type log: bool, optional
+        :param sparse: Returns a sparse matrix if set to True, and a dense matrix otherwise.
+                       Defaults to True.
+        :type sparse: bool, optional
         :return: The global stiffness matrix for the structure.
         :rtype: ndarray or coo_matrix
         """
@@ -1644,11 +1683,101 @@ class FEModel3D():
             data = array(data)
             K = coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
 
-        # Check that there are no nodal instabilities
-        if check_stability:
-            if log: print('- Checking nodal stability')
-            if sparse: Analysis._check_stability(self, K.tocsr())
-            else: Analysis._check_stability(self, K)
+        # Return the global stiffness matrix
+        return K
+
+    def _K_vectorized(self, combo_name='Combo 1', log=False):
+        """Assembles the global stiffness matrix in scipy's sparse `coo` format. The stiffness
+           matrices of each element type are stacked into one array, the global indices of all
+           their terms are computed at once, and the matrix is built in a single call.
+           Deactivated tension/compression-only elements and springs keep their terms as zeros,
+           so the sparsity pattern stays the same between tension/compression-only iterations.
+
+        :param combo_name: The load combination to get the stiffness matrix for. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param log: Prints updates to the console if set to True. Defaults to False.
+        :type log: bool, optional
+        :return: The global stiffness matrix for the structure.
+        :rtype: coo_matrix
+        """
+
+        from scipy.sparse import coo_matrix
+
+        # Lists of row indices, column indices and terms for each group of elements
+        row = []
+        col = []
+        data = []
+
+        def add_terms(node_IDs, element_K, active=None):
+            """Adds the terms of stacked element stiffness matrices.
+
+            :param node_IDs: The IDs of the element nodes, shaped (n_elements, n_nodes).
+            :param element_K: The global element stiffness matrices, shaped (n_elements, 6*n_nodes, 6*n_nodes).
+            :param active: Whether each element is active. The terms of inactive elements are added as zeros.
+            """
+
+            if len(node_IDs) == 0:
+                return
+
+            # Global degree of freedom for each term of the element matrices
+            dofs = (array(node_IDs)[:, :, newaxis]*6 + arange(6)).reshape(len(node_IDs), -1)
+            n_dofs = dofs.shape[1]
+
+            element_K = array(element_K, dtype=float)
+            if active is not None:
+                element_K = element_K*array(active, dtype=float)[:, newaxis, newaxis]
+
+            row.append(broadcast_to(dofs[:, :, newaxis], (len(node_IDs), n_dofs, n_dofs)).ravel())
+            col.append(broadcast_to(dofs[:, newaxis, :], (len(node_IDs), n_dofs, n_dofs)).ravel())
+            data.append(element_K.ravel())
+
+        # Add stiffness terms for each nodal spring in the model
+        if log: print('- Adding nodal spring support stiffness terms to global stiffness matrix')
+        spring_dofs = []
+        spring_terms = []
+        for node in self.nodes.values():
+            for i, spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ,
+                                        node.spring_RX, node.spring_RY, node.spring_RZ)):
+
+                # Check for a spring support. Inactive ones are added as zeros.
+                if spring[0] is not None:
+                    spring_dofs.append(node.ID*6 + i)
+                    spring_terms.append(float(spring[0]) if spring[2] == True else 0.0)
+
+        row.append(array(spring_dofs, dtype=int))
+        col.append(array(spring_dofs, dtype=int))
+        data.append(array(spring_terms, dtype=float))
+
+        # Add stiffness terms for each spring in the model
+        if log: print('- Adding spring stiffness terms to global stiffness matrix')
+        springs = list(self.springs.values())
+        add_terms([[spring.i_node.ID, spring.j_node.ID] for spring in springs],
+                  [spring.K() for spring in springs],
+                  [spring.active[combo_name] == True for spring in springs])
+
+        # Add stiffness terms for each physical member in the model
+        if log: print('- Adding member stiffness terms to global stiffness matrix')
+        members = [(phys_member.active[combo_name] == True, member) for phys_member in self.members.values()
+                   for member in phys_member.sub_members.values()]
+        add_terms([[member.i_node.ID, member.j_node.ID] for _, member in members],
+                  Member3D.K_batch([member for _, member in members]),
+                  [active for active, _ in members])
+
+        # Add stiffness terms for each quadrilateral in the model
+        if log: print('- Adding quadrilateral stiffness terms to global stiffness matrix')
+        quads = list(self.quads.values())
+        add_terms([[quad.i_node.ID, quad.j_node.ID, quad.m_node.ID, quad.n_node.ID] for quad in quads],
+                  Quad3D.K_batch(quads))
+
+        # Add stiffness terms for each plate in the model
+        if log: print('- Adding plate stiffness terms to global stiffness matrix')
+        plates = list(self.plates.values())
+        add_terms([[plate.i_node.ID, plate.j_node.ID, plate.m_node.ID, plate.n_node.ID] for plate in plates],
+                  [plate.K() for plate in plates])
+
+        # Build the matrix in one step. The `coo_matrix` sums values at the same (i, j) index.
+        n = len(self.nodes)*6
+        K = coo_matrix((concatenate(data), (concatenate(row), concatenate(col))), shape=(n, n))
 
         # Return the global stiffness matrix
         return K
@@ -1669,11 +1798,12 @@ class FEModel3D():
         """
 
         if sparse == True:
-            # Initialize a zero matrix to hold all the stiffness terms. The matrix will be stored as a scipy sparse `lil_matrix`. This matrix format has several advantages. It uses less memory if the matrix is sparse, supports slicing, and can be converted to other formats (sparse or dense) later on for mathematical operations.
-            from scipy.sparse import lil_matrix
-            Kg = lil_matrix((len(self.nodes)*6, len(self.nodes)*6))
+            # The geometric stiffness matrix will be stored as a scipy `coo_matrix`. The terms are collected in three lists and the `coo_matrix` sums values at the same (i, j) index when it is converted to another format.
+            row = []
+            col = []
+            data = []
         else:
-            Kg = zeros(len(self.nodes)*6, len(self.nodes)*6)
+            Kg = zeros((len(self.nodes)*6, len(self.nodes)*6))
 
         # Add stiffness terms for each physical member in the model
         if log:
@@ -1728,7 +1858,16 @@ class FEModel3D():
                                 n = member.j_node.ID*6 + (b-6)
 
                             # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                            Kg[m, n] += member_Kg[(a, b)]
+                            if sparse == True:
+                                row.append(m)
+                                col.append(n)
+                                data.append(member_Kg[a, b])
+                            else:
+                                Kg[m, n] += member_Kg[(a, b)]
+
+        if sparse == True:
+            from scipy.sparse import coo_matrix
+            Kg = coo_matrix((array(data, dtype=float), (array(row, dtype=int), array(col, dtype=int))), shape=(len(self.nodes)*6, len(self.nodes)*6))
 
         # Return the global geometric stiffness matrix
         return Kg
@@ -1833,32 +1972,29 @@ class FEModel3D():
         
         # Initialize a zero vector to hold all the terms
         FER = zeros((len(self.nodes) * 6, 1))
-        
-        # Step through each physical member in the model
-        for phys_member in self.members.values():
-            
-            # Step through each sub-member and add terms
-            for member in phys_member.sub_members.values():
 
-                # Get the member's global fixed end reaction vector
-                # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                member_FER = member.FER(combo_name)
+        def add_terms(node_IDs, element_FER):
+            """Adds the terms of stacked element fixed end reaction vectors.
 
-                # Step through each term in the member's fixed end reaction vector
-                # 'a' below is the row index in the member's fixed end reaction vector
-                # 'm' below is the corresponding row index in the global fixed end reaction vector
-                for a in range(12):
-                    
-                    # Determine if index 'a' is related to the i-node or j-node
-                    if a < 6:
-                        # Find the corresponding index 'm' in the global fixed end reaction vector
-                        m = member.i_node.ID * 6 + a
-                    else:
-                        # Find the corresponding index 'm' in the global fixed end reaction vector
-                        m = member.j_node.ID * 6 + (a - 6)
-                    
-                    # Now that 'm' is known, place the term in the global fixed end reaction vector
-                    FER[m, 0] += member_FER[a, 0]
+            :param node_IDs: The IDs of the element nodes, shaped (n_elements, n_nodes).
+            :param element_FER: The global element fixed end reaction vectors, shaped (n_elements, 6*n_nodes).
+            """
+
+            if len(node_IDs) == 0:
+                return
+
+            # Global degree of freedom for each term of the element vectors. `add.at` sums the
+            # terms of elements sharing a node.
+            dofs = (array(node_IDs)[:, :, newaxis]*6 + arange(6)).ravel()
+            add.at(FER[:, 0], dofs, element_FER.ravel())
+
+        # Add the terms of all sub-members in the model. Only members with loads have fixed end
+        # reactions.
+        members = [member for phys_member in self.members.values() for member in phys_member.sub_members.values()
+                   if member.PtLoads or member.DistLoads]
+        T = Member3D.T_batch(members)
+        add_terms([[member.i_node.ID, member.j_node.ID] for member in members],
+                  (T.transpose(0, 2, 1) @ Member3D.fer_batch(members, combo_name)[:, :, newaxis])[:, :, 0])
         
         # Add terms for each rectangle in the model
         for plate in self.plates.values():
@@ -1890,33 +2026,10 @@ class FEModel3D():
                 FER[m, 0] += plate_FER[a, 0]
 
         # Add terms for each quadrilateral in the model
-        for quad in self.quads.values():
-            
-            # Get the quadrilateral's global fixed end reaction vector
-            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-            quad_FER = quad.FER(combo_name)
-
-            # Step through each term in the quadrilateral's fixed end reaction vector
-            # 'a' below is the row index in the quadrilateral's fixed end reaction vector
-            # 'm' below is the corresponding row index in the global fixed end reaction vector
-            for a in range(24):
-                
-                # Determine if index 'a' is related to the i-node, j-node, m-node, or n-node
-                if a < 6:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.i_node.ID*6 + a
-                elif a < 12:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.j_node.ID*6 + (a - 6)
-                elif a < 18:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.m_node.ID*6 + (a - 12)
-                else:
-                    # Find the corresponding index 'm' in the global fixed end reaction vector
-                    m = quad.n_node.ID*6 + (a - 18)
-                
-                # Now that 'm' is known, place the term in the global fixed end reaction vector
-                FER[m, 0] += quad_FER[a, 0]
+        quads = [quad for quad in self.quads.values() if quad.pressures]
+        T = Quad3D.T_batch(quads)
+        add_terms([[quad.i_node.ID, quad.j_node.ID, quad.m_node.ID, quad.n_node.ID] for quad in quads],
+                  (T.transpose(0, 2, 1) @ Quad3D.fer_batch(quads, combo_name)[:, :, newaxis])[:, :, 0])
 
         # Return the global fixed end reaction vector
         return FER
@@ -2098,7 +2211,7 @@ class FEModel3D():
     #     # Flag the model as solved
     #     self.solution = 'Linear TC'
 
-    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None):
+    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None, solver='superlu'):
         """Performs first-order static analysis. This analysis procedure is much faster since it only assembles the global stiffness matrix once, rather than once for each load combination. It is not appropriate when non-linear behavior such as tension/compression only analysis or P-Delta analysis are required.
 
         :param log: Prints the analysis log to the console if set to True. Default is False.
@@ -2109,6 +2222,8 @@ class FEModel3D():
         :type check_statics: bool, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
+        :param solver: The sparse solver backend, given by its name in `Solvers.solvers` (`'superlu'`, `'cholmod'`, `'cg'` or `'auto'`) or as an instance from `Solvers.get`. Only used by the sparse solver. Default is `'superlu'`.
+        :type solver: str or Solver, optional
         :raises Exception: Occurs when a singular stiffness matrix is found. This indicates an unstable structure has been modeled.
         """
 
@@ -2117,10 +2232,6 @@ class FEModel3D():
             print('| Analyzing: Linear |')
             print('+-------------------+')
         
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         Analysis._prepare_model(self)
 
@@ -2131,7 +2242,10 @@ class FEModel3D():
         # Note that for linear analysis the stiffness matrix can be obtained for any load combination, as it's the same for all of them
         combo_name = list(self.load_combos.keys())[0]
         if sparse == True:
-            K11, K12, K21, K22 = Analysis._partition(self, self.K(combo_name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
+            # Models with the same topology share the sparsity pattern of the partitioned matrices
+            K = self.K(combo_name, log, check_stability, sparse)
+            pattern = SparsePattern.get(K, D1_indices)
+            K11, K12, K21, K22 = pattern.partition(K)
         else:
             K11, K12, K21, K22 = Analysis._partition(self, self.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
 
@@ -2161,23 +2275,26 @@ class FEModel3D():
                 try:
                     # Calculate the unknown displacements D1
                     if sparse == True:
-                        # The partitioned stiffness matrix is in `lil` format, which is great
-                        # for memory, but slow for mathematical operations. The stiffness
-                        # matrix will be converted to `csr` format for mathematical operations.
-                        # The `@` operator performs matrix multiplication on sparse matrices.
-                        D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                        D1 = D1.reshape(len(D1), 1)
+                        # The partitioned stiffness matrix is in `csr` format. The `@` operator
+                        # performs matrix multiplication on sparse matrices. The pattern reuses
+                        # the ordering of previous models with the same topology.
+                        factorization = pattern.factorize(K11, solver)
+                        D1 = factorization.solve(subtract(subtract(P1, FER1), K12 @ D2))
                     else:
                         D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
                 except:
                     # Return out of the method if 'K' is singular and provide an error message
                     raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
 
+                # Check the pivots of the factorization for mechanisms
+                if check_stability and sparse == True:
+                    Analysis._check_mechanism(self, factorization, D1_indices)
+
             # Store the calculated displacements to the model and the nodes in the model
             Analysis._store_displacements(self, D1, D2, D1_indices, D2_indices, combo)
 
-        # Calculate reactions
-        Analysis._calc_reactions(self, log, combo_tags)
+        # Calculate reactions. All load combinations share the same stiffness matrix.
+        Analysis._calc_reactions(self, log, combo_tags, {combo.name: (K21, K22) for combo in combo_list}, sparse)
 
         if log:
             print('')
@@ -2191,7 +2308,150 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Linear'
 
-    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0, num_steps=1):
+    @staticmethod
+    def analyze_linear_batch(models, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None, solver='superlu'):
+        """Performs first-order static analysis on several models at once. Models with identical partitioned stiffness matrices, such as the frames of an animation where only the loads change, share a single factorization of ``K11``. The load vectors of all their load combinations are then solved together as one multi right hand side solve. Each model ends up in the same state as after calling `analyze_linear` on it.
+
+        :param models: The models to analyze.
+        :type models: list
+        :param log: Prints the analysis log to the console if set to True. Default is False.
+        :type log: bool, optional
+        :param check_stability: When set to True, checks the stiffness matrix of each model for any unstable degrees of freedom and reports them back to the console. Defaults to True.
+        :type check_stability: bool, optional
+        :param check_statics: When set to True, causes a statics check to be performed. Defaults to False.
+        :type check_statics: bool, optional
+        :param sparse: Indicates whether the sparse solver should be used. Default is True.
+        :type sparse: bool, optional
+        :param solver: The sparse solver backend, given by its name in `Solvers.solvers` (`'superlu'`, `'cholmod'`, `'cg'` or `'auto'`) or as an instance from `Solvers.get`. Only used by the sparse solver. Default is `'superlu'`.
+        :type solver: str or Solver, optional
+        :raises Exception: Occurs when the stiffness matrix of a model is singular or has a mechanism. This indicates an unstable structure has been modeled. The exception is raised after all other models have been solved. Models that could not be solved keep `solution` set to `None`.
+        :return: The number of factorizations that were performed.
+        :rtype: int
+        """
+
+        if log:
+            print('+-------------------------+')
+            print('| Analyzing: Linear Batch |')
+            print('+-------------------------+')
+
+        # Group the models by their partitioned stiffness matrix
+        groups = {}
+        partitions = {}
+        for model in models:
+
+            # Prepare the model for analysis
+            Analysis._prepare_model(model)
+
+            # Get the auxiliary list used to determine how the matrices will be partitioned
+            D1_indices, D2_indices, D2 = Analysis._partition_D(model)
+
+            # Get the partitioned global stiffness matrix. As in `analyze_linear` any load combination can be used.
+            combo_name = list(model.load_combos.keys())[0]
+            if sparse == True:
+                # The partitioned matrices of models with the same topology share one structure
+                K = model.K(combo_name, log, check_stability, sparse)
+                pattern = SparsePattern.get(K, D1_indices)
+                K11, K12, K21, K22 = pattern.partition(K)
+                key = (array(D1_indices).tobytes(), K11.indptr.tobytes(), K11.indices.tobytes(), K11.data.tobytes())
+            else:
+                pattern = None
+                K11, K12, K21, K22 = Analysis._partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+                key = (array(D1_indices).tobytes(), K11.tobytes())
+
+            groups.setdefault(key, []).append((model, pattern, K11, K12, D1_indices, D2_indices, D2))
+            partitions[model] = (K21, K22)
+
+        # The number of factorizations, and the errors of the models that could not be solved
+        factorizations = 0
+        failed = []
+        unsolved = set()
+
+        # Solve each group with a single factorization
+        for group in groups.values():
+
+            pattern, K11 = group[0][1], group[0][2]
+
+            # Assemble the right hand sides of every model and load combination in the group
+            rhs = []
+            columns = []
+            for model, _, _, K12, D1_indices, D2_indices, D2 in group:
+                for combo in Analysis._identify_combos(model, combo_tags):
+
+                    # Get the partitioned global fixed end reaction vector and nodal force vector
+                    FER1, FER2 = Analysis._partition(model, model.FER(combo.name), D1_indices, D2_indices)
+                    P1, P2 = Analysis._partition(model, model.P(combo.name), D1_indices, D2_indices)
+
+                    if sparse == True:
+                        rhs.append(subtract(subtract(P1, FER1), K12 @ D2))
+                    else:
+                        rhs.append(subtract(subtract(P1, FER1), matmul(K12, D2)))
+
+                    columns.append((model, combo, D1_indices, D2_indices, D2))
+
+            if log:
+                print('- Solving ' + str(len(columns)) + ' load vectors with one factorization')
+
+            if K11.shape == (0, 0):
+                # All displacements are known, so D1 is an empty vector
+                D1 = zeros((0, len(columns)))
+            else:
+                factorizations += 1
+                try:
+                    try:
+                        if sparse == True:
+                            factorization = pattern.factorize(K11, solver)
+                            D1 = factorization.solve(hstack(rhs))
+                        else:
+                            D1 = solve(K11, hstack(rhs))
+                    except:
+                        # Return out of the method if 'K' is singular and provide an error message
+                        raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+                    # Check the pivots of the factorization for mechanisms
+                    if check_stability and sparse == True:
+                        Analysis._check_mechanism(group[0][0], factorization, group[0][4])
+
+                except Exception as error:
+
+                    # The models of the group share the same stiffness matrix, so all of them are unstable. The
+                    # other groups are still solved.
+                    for model, *_ in group:
+                        model.solution = None
+                        unsolved.add(model)
+                        failed.append(error)
+
+                    continue
+
+            # Store the calculated displacements to the models and their nodes
+            for i, (model, combo, D1_indices, D2_indices, D2) in enumerate(columns):
+                Analysis._store_displacements(model, D1[:, i:i+1], D2, D1_indices, D2_indices, combo)
+
+        for model in models:
+
+            if model in unsolved:
+                continue
+
+            # Calculate reactions
+            Analysis._calc_reactions(model, log, combo_tags, dict.fromkeys(model.load_combos, partitions[model]), sparse)
+
+            # Check statics if requested
+            if check_statics == True:
+                Analysis._check_statics(model, combo_tags)
+
+            # Flag the model as solved
+            model.solution = 'Linear'
+
+        if log:
+            print('')
+            print('- Analysis complete')
+            print('')
+
+        if failed:
+            raise Exception(f'{len(failed)} of {len(models)} models could not be solved. The first error was: {failed[0]}')
+
+        return factorizations
+
+    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0, num_steps=1, solver='superlu'):
         """
         Performs a first-order elastic analysis of the model.
 
@@ -2217,6 +2477,8 @@ class FEModel3D():
             Tolerance used to determine convergence for members in tension/compression-only analysis (default: 0).
         num_steps : int, optional
             Number of load increments for applying load combinations. Use more steps for better convergence in highly nonlinear cases (default: 1).
+        solver : str or Solver, optional
+            The sparse solver backend, given by its name in `Solvers.solvers` ('superlu', 'cholmod', 'cg' or 'auto') or as an instance from `Solvers.get`. Only used by the sparse solver (default: 'superlu').
 
         Raises
         ------
@@ -2235,10 +2497,6 @@ class FEModel3D():
             print('| Analyzing |')
             print('+-----------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         Analysis._prepare_model(self)
 
@@ -2251,6 +2509,14 @@ class FEModel3D():
         # Calculate the incremental enforced displacement vector
         Delta_D2 = D2/num_steps
 
+        # The factorization of the stiffness matrix is kept between iterations, load steps and load
+        # combinations. Deactivated elements are applied to it as updates.
+        base = None
+        Delta_D1 = None
+
+        # The partitioned stiffness matrices each load combination has converged with
+        partitions = {}
+
         # Step through each load combination
         for combo in combo_list:
 
@@ -2293,7 +2559,10 @@ class FEModel3D():
 
                     # Get the partitioned global stiffness matrix K11, K12, K21, K22
                     if sparse == True:
-                        K11, K12, K21, K22 = Analysis._partition(self, self.K(combo.name, log, check_stability, sparse).tolil(), D1_indices, D2_indices)
+                        # Deactivated members are zeros in `K`, so all iterations share one pattern
+                        K = self.K(combo.name, log, check_stability, sparse)
+                        pattern = SparsePattern.get(K, D1_indices)
+                        K11, K12, K21, K22 = pattern.partition(K)
                     else:
                         K11, K12, K21, K22 = Analysis._partition(self, self.K(combo.name, log, check_stability, sparse), D1_indices, D2_indices)
 
@@ -2304,9 +2573,21 @@ class FEModel3D():
                         try:
                             # Calculate the unknown displacements Delta_D1
                             if sparse == True:
-                                # The partitioned stiffness matrix is in `lil` format, which is great for memory, but slow for mathematical operations. The stiffness matrix will be converted to `csr` format for mathematical operations. The `@` operator performs matrix multiplication on sparse matrices.
-                                Delta_D1 = spsolve(K11.tocsr(), subtract(subtract(Delta_P1, Delta_FER1), K12.tocsr() @ Delta_D2))
-                                Delta_D1 = Delta_D1.reshape(len(Delta_D1), 1)
+                                # The partitioned stiffness matrix is in `csr` format. The `@` operator performs matrix multiplication on sparse matrices.
+                                rhs = subtract(subtract(Delta_P1, Delta_FER1), K12 @ Delta_D2)
+
+                                # Factorize the first stiffness matrix. Later ones are solved as updates of it, or factorized again with the same ordering if too much has changed.
+                                if base is None or base.pattern is not pattern:
+                                    factorization = pattern.factorize(K11, solver)
+                                else:
+                                    factorization = base.update(K11)
+                                base = factorization.base
+
+                                # Start from the displacements of the previous iteration and solve for the correction
+                                if Delta_D1 is None or len(Delta_D1) != K11.shape[0]:
+                                    Delta_D1 = factorization.solve(rhs)
+                                else:
+                                    Delta_D1 = Delta_D1 + factorization.solve(rhs - K11 @ Delta_D1)
                             else:
                                 Delta_D1 = solve(K11, subtract(subtract(Delta_P1, Delta_FER1), matmul(K12, Delta_D2)))
                         except:
@@ -2331,14 +2612,20 @@ class FEModel3D():
                         Analysis._sum_displacements(self, -Delta_D1, -Delta_D2, D1_indices, D2_indices, combo)
 
                     else:
+                        # Check the pivots of the active set the load combination has converged with for mechanisms
+                        if check_stability and sparse == True and load_step == num_steps and K11.shape != (0, 0):
+                            Analysis._check_converged_mechanism(self, factorization, D1_indices)
+
                         # Move on to the next load step
                         load_step += 1
 
                     # Keep track of the number of tension/compression only iterations
                     iter_count += 1
 
+            partitions[combo.name] = (K21, K22)
+
         # Calculate reactions
-        Analysis._calc_reactions(self, log, combo_tags)
+        Analysis._calc_reactions(self, log, combo_tags, partitions, sparse)
 
         if log:
             print('')
@@ -2352,7 +2639,7 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Nonlinear TC'
 
-    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None):
+    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None, iterative=None, tol=1e-8, solver='superlu'):
         """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material specific codes. The analysis is iterative and takes longer to solve. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered.
 
         :param log: Prints updates to the console if set to True. Default is False.
@@ -2363,6 +2650,12 @@ class FEModel3D():
         :type max_iter: int, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
+        :param iterative: Set to `'cg'` or `'gmres'` to factorize only the elastic stiffness matrix and to add the geometric stiffness with a preconditioned iterative solver. The iteration counts, the residuals and whether a step did not converge and was solved directly are stored in `PDelta_iterations`. Only used by the sparse solver. Default is `None`.
+        :type iterative: str, optional
+        :param tol: The relative residual the iterative solver has to reach. A larger tolerance is faster and less accurate. Default is 1e-8.
+        :type tol: float, optional
+        :param solver: The sparse solver backend, given by its name in `Solvers.solvers` (`'superlu'`, `'cholmod'`, `'cg'` or `'auto'`) or as an instance from `Solvers.get`. Only used by the sparse solver. Default is `'superlu'`.
+        :type solver: str or Solver, optional
         :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
         :raises Exception: Occurs when a model fails to converge.
         """
@@ -2372,10 +2665,6 @@ class FEModel3D():
             print('| Analyzing: P-Delta |')
             print('+--------------------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         Analysis._prepare_model(self)
 
@@ -2385,6 +2674,12 @@ class FEModel3D():
         # Identify which load combinations have the tags the user has given
         combo_list = Analysis._identify_combos(self, combo_tags)
 
+        # Iteration counts and residuals of the iterative solver for each load combination
+        self.PDelta_iterations = {}
+
+        # The partitioned stiffness matrices, including the geometric stiffness, of each load combination
+        partitions = {}
+
         # Step through each load combination
         for combo in combo_list:
 
@@ -2395,10 +2690,10 @@ class FEModel3D():
             P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
 
             # Run the P-Delta analysis for this load combination
-            Analysis._PDelta(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter)
+            partitions[combo.name] = Analysis._PDelta(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter, iterative, tol, solver)
 
         # Calculate reactions
-        Analysis._calc_reactions(self, log, combo_tags)
+        Analysis._calc_reactions(self, log, combo_tags, partitions, sparse)
 
         if log:
             print('')
@@ -2521,6 +2816,57 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Pushover'
 
+    def member_results(self, combo_name='Combo 1', n_points=11):
+        """Returns the internal forces and deflections of all members at evenly spaced locations
+        along each member with one call.
+
+        Members without point loads and with distributed loads over their full length only are one
+        mathematically continuous segment. Their results are calculated for all of these members
+        together from the stacked end forces and distributed loads. Other members are evaluated
+        segment by segment with `PhysMember.results`.
+
+        :param combo_name: The name of the load combination to get the results for. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param n_points: The number of locations along each member, including both ends. Defaults to 11.
+        :type n_points: int, optional
+        :return: The results in the order of `members`, shaped (n_members, 9, n_points). The rows are the
+                 components of `Member3D.result_components`.
+        :rtype: NDArray[float64]
+        """
+
+        results = zeros((len(self.members), len(Member3D.result_components), n_points))
+        stations = linspace(0, 1, n_points)
+
+        # Gather the continuous sub-members, the sub-member of each location and the location in the
+        # sub-member's local coordinates
+        sub_members, index, x_array, rows = [], [], [], []
+        for m, member in enumerate(self.members.values()):
+
+            subs = list(member.sub_members.values())
+            if not all(sub._continuous() for sub in subs):
+                results[m] = member.results(member.L()*stations, combo_name)
+                continue
+
+            if len(subs) == 1:
+                index.append(repeat(len(sub_members), n_points))
+                x_array.append(subs[0].L()*stations)
+            else:
+                # Find the sub-member of each location the way `PhysMember.find_member` does
+                x_ends = cumsum([sub.L() for sub in subs])
+                x_phys = x_ends[-1]*stations
+                i = searchsorted(x_ends, x_phys, side='right').clip(0, len(subs) - 1)
+                index.append(len(sub_members) + i)
+                x_array.append(x_phys - x_ends[i] + array([sub.L() for sub in subs])[i])
+
+            sub_members.extend(subs)
+            rows.append(m)
+
+        if rows:
+            stacked = Member3D._results_batch(sub_members, concatenate(index), concatenate(x_array), combo_name)
+            results[rows] = stacked.reshape(len(Member3D.result_components), len(rows), n_points).transpose(1, 0, 2)
+
+        return results
+
     def unique_name(self, dictionary, prefix):
         """Returns the next available unique name for a dictionary of objects.
 
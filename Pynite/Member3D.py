@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Literal, Union, List
 from math import isclose
 
 from numpy import array, zeros, add, subtract, matmul, insert, dot, cross, divide, count_nonzero, concatenate
-from numpy import linspace, vstack, hstack, allclose, radians, sin, cos
+from numpy import linspace, vstack, hstack, allclose, radians, sin, cos, newaxis, maximum, where, stack, searchsorted, unique
 from numpy.linalg import inv, pinv, norm
 
 import Pynite.FixedEndReactions
@@ -768,6 +768,315 @@ class Member3D():
         # Return the global displacement vector
         return D
 
+    @staticmethod
+    def _condense_batch(members: List[Member3D], k_unc: NDArray[float64], fer_unc: Optional[NDArray[float64]] = None):
+        """
+        Applies the end releases of each member to stacked uncondensed matrices. Members sharing
+        the same release pattern are condensed together.
+
+        :param members: The members the matrices belong to.
+        :type members: list
+        :param k_unc: The uncondensed local stiffness matrices, shaped (n_members, 12, 12).
+        :type k_unc: NDArray[float64]
+        :param fer_unc: The uncondensed local fixed end reaction vectors, shaped (n_members, 12).
+                        Defaults to None.
+        :type fer_unc: NDArray[float64], optional
+        :return: The condensed (and expanded) matrices, or vectors if `fer_unc` is given.
+        :rtype: NDArray[float64]
+        """
+
+        # Group the members by their release pattern
+        groups = {}
+        for n, member in enumerate(members):
+            releases = tuple(bool(DOF) for DOF in member.Releases)
+            if any(releases):
+                groups.setdefault(releases, []).append(n)
+
+        result = array(k_unc if fer_unc is None else fer_unc, dtype=float)
+
+        for releases, rows in groups.items():
+
+            rows = array(rows)
+            R1 = array([i for i in range(12) if not releases[i]])
+            R2 = array([i for i in range(12) if releases[i]])
+
+            # Partition the matrices of the group
+            k12 = k_unc[rows][:, R1][:, :, R2]
+            k22_inv = inv(k_unc[rows][:, R2][:, :, R2])
+
+            if fer_unc is None:
+                k11 = k_unc[rows][:, R1][:, :, R1]
+                k21 = k_unc[rows][:, R2][:, :, R1]
+
+                # Condense and expand the local stiffness matrices
+                condensed = zeros((len(rows), 12, 12))
+                condensed[:, R1[:, newaxis], R1] = k11 - k12 @ k22_inv @ k21
+            else:
+                fer1 = fer_unc[rows][:, R1]
+                fer2 = fer_unc[rows][:, R2]
+
+                # Condense and expand the local fixed end reaction vectors
+                condensed = zeros((len(rows), 12))
+                condensed[:, R1] = fer1 - (k12 @ k22_inv @ fer2[:, :, newaxis])[:, :, 0]
+
+            result[rows] = condensed
+
+        return result
+
+    @staticmethod
+    def k_batch(members: List[Member3D]) -> NDArray[float64]:
+        """
+        Returns the condensed (and expanded) local stiffness matrices for a list of members.
+
+        :param members: The members to build the matrices for.
+        :type members: list
+        :return: The local stiffness matrices, shaped (n_members, 12, 12).
+        :rtype: NDArray[float64]
+        """
+
+        return Member3D._condense_batch(members, Member3D._k_unc_batch(members))
+
+    @staticmethod
+    def _k_unc_batch(members: List[Member3D]) -> NDArray[float64]:
+        """
+        Returns the uncondensed local stiffness matrices for a list of members.
+
+        :param members: The members to build the matrices for.
+        :type members: list
+        :return: The uncondensed local stiffness matrices, shaped (n_members, 12, 12).
+        :rtype: NDArray[float64]
+        """
+
+        # Get the properties needed to form the local stiffness matrices
+        E = array([member.material.E for member in members], dtype=float)
+        G = array([member.material.G for member in members], dtype=float)
+        Iy = array([member.section.Iy for member in members], dtype=float)
+        Iz = array([member.section.Iz for member in members], dtype=float)
+        J = array([member.section.J for member in members], dtype=float)
+        A = array([member.section.A for member in members], dtype=float)
+        L = array([member.L() for member in members], dtype=float)
+
+        # Terms of the uncondensed local stiffness matrix
+        a = A*E/L
+        t = G*J/L
+        z12, z6, z4, z2 = 12*E*Iz/L**3, 6*E*Iz/L**2, 4*E*Iz/L, 2*E*Iz/L
+        y12, y6, y4, y2 = 12*E*Iy/L**3, 6*E*Iy/L**2, 4*E*Iy/L, 2*E*Iy/L
+
+        k = zeros((len(members), 12, 12))
+
+        # Axial and torsional terms
+        for i, j, term in ((0, 0, a), (0, 6, -a), (6, 6, a), (3, 3, t), (3, 9, -t), (9, 9, t)):
+            k[:, i, j] = term
+            k[:, j, i] = term
+
+        # Bending about the local z-axis
+        for i, j, term in ((1, 1, z12), (1, 5, z6), (1, 7, -z12), (1, 11, z6), (5, 5, z4), (5, 7, -z6),
+                           (5, 11, z2), (7, 7, z12), (7, 11, -z6), (11, 11, z4)):
+            k[:, i, j] = term
+            k[:, j, i] = term
+
+        # Bending about the local y-axis
+        for i, j, term in ((2, 2, y12), (2, 4, -y6), (2, 8, -y12), (2, 10, -y6), (4, 4, y4), (4, 8, y6),
+                           (4, 10, y2), (8, 8, y12), (8, 10, y6), (10, 10, y4)):
+            k[:, i, j] = term
+            k[:, j, i] = term
+
+        return k
+
+    @staticmethod
+    def T_batch(members: List[Member3D]) -> NDArray[float64]:
+        """
+        Returns the transformation matrices for a list of members. The local axes follow the same
+        rules as `T()` for vertical, horizontal and inclined members, and for rotated members.
+
+        :param members: The members to build the matrices for.
+        :type members: list
+        :return: The transformation matrices, shaped (n_members, 12, 12).
+        :rtype: NDArray[float64]
+        """
+
+        n = len(members)
+
+        # Get the global coordinates for the two ends
+        Pi = array([[member.i_node.X, member.i_node.Y, member.i_node.Z] for member in members], dtype=float).reshape(n, 3)
+        Pj = array([[member.j_node.X, member.j_node.Y, member.j_node.Z] for member in members], dtype=float).reshape(n, 3)
+
+        # Same test as `math.isclose` with its default tolerance
+        def close(a, b):
+            return abs(a - b) <= 1e-9*maximum(abs(a), abs(b))
+
+        # Calculate the direction cosines for the local x-axis
+        L = ((Pj - Pi)**2).sum(axis=1)**0.5
+        x = (Pj - Pi)/L[:, newaxis]
+        upward = Pj[:, 1] > Pi[:, 1]
+
+        vertical = close(Pi[:, 0], Pj[:, 0]) & close(Pi[:, 2], Pj[:, 2])
+        horizontal = ~vertical & close(Pi[:, 1], Pj[:, 1])
+        inclined = ~vertical & ~horizontal
+
+        y = zeros((n, 3))
+        z = zeros((n, 3))
+
+        # Vertical members keep the local y-axis in the XY plane
+        y[vertical, 0] = where(upward[vertical], -1.0, 1.0)
+        z[vertical, 2] = 1.0
+
+        # Horizontal members keep the local y-axis vertical
+        y[horizontal, 1] = 1.0
+        z[horizontal] = cross(x[horizontal], y[horizontal])
+        z[horizontal] /= norm(z[horizontal], axis=1)[:, newaxis]
+
+        # Inclined members use the projection of x on the global XZ plane
+        proj = (Pj - Pi)[inclined]*array([1.0, 0.0, 1.0])
+        z[inclined] = where(upward[inclined][:, newaxis], cross(proj, x[inclined]), cross(x[inclined], proj))
+        z[inclined] /= norm(z[inclined], axis=1)[:, newaxis]
+        y[inclined] = cross(z[inclined], x[inclined])
+        y[inclined] /= norm(y[inclined], axis=1)[:, newaxis]
+
+        # Rotate y and z about x using the Rodrigues formula
+        rotation = array([member.rotation for member in members], dtype=float).reshape(n)
+        rotated = rotation != 0.0
+        if rotated.any():
+            theta = radians(rotation[rotated])[:, newaxis]
+            c = cos(theta)
+            s = sin(theta)
+            u = x[rotated]
+            for v in (y, z):
+                w = v[rotated]
+                w = w*c + cross(u, w)*s + u*(u*w).sum(axis=1)[:, newaxis]*(1 - c)
+                v[rotated] = w/norm(w, axis=1)[:, newaxis]
+
+        # Create the direction cosines matrices
+        dirCos = stack((x, y, z), axis=1)
+
+        # Build the transformation matrices
+        transMatrix = zeros((n, 12, 12))
+        for i in range(0, 12, 3):
+            transMatrix[:, i:i+3, i:i+3] = dirCos
+
+        return transMatrix
+
+    @staticmethod
+    def K_batch(members: List[Member3D], T: Optional[NDArray[float64]] = None) -> NDArray[float64]:
+        """
+        Returns the global elastic stiffness matrices for a list of members.
+
+        :param members: The members to build the matrices for.
+        :type members: list
+        :param T: The transformation matrices, if they are already known. Defaults to None.
+        :type T: NDArray[float64], optional
+        :return: The global stiffness matrices, shaped (n_members, 12, 12).
+        :rtype: NDArray[float64]
+        """
+
+        if T is None:
+            T = Member3D.T_batch(members)
+
+        # The transformation matrices are orthogonal, so their transpose is their inverse
+        return T.transpose(0, 2, 1) @ Member3D.k_batch(members) @ T
+
+    @staticmethod
+    def fer_batch(members: List[Member3D], combo_name: str = 'Combo 1') -> NDArray[float64]:
+        """
+        Returns the condensed (and expanded) local fixed end reaction vectors for a list of members.
+
+        :param members: The members to build the vectors for.
+        :type members: list
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :return: The local fixed end reaction vectors, shaped (n_members, 12).
+        :rtype: NDArray[float64]
+        """
+
+        fer_unc = Member3D._fer_unc_batch(members, combo_name)
+
+        return Member3D._condense_batch(members, Member3D._k_unc_batch(members), fer_unc)
+
+    @staticmethod
+    def _fer_unc_batch(members: List[Member3D], combo_name: str = 'Combo 1') -> NDArray[float64]:
+        """
+        Returns the uncondensed local fixed end reaction vectors for a list of members.
+
+        :param members: The members to build the vectors for.
+        :type members: list
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :return: The uncondensed local fixed end reaction vectors, shaped (n_members, 12).
+        :rtype: NDArray[float64]
+        """
+
+        # Only members with loads have fixed end reactions
+        fer_unc = zeros((len(members), 12))
+        for n, member in enumerate(members):
+            if member.PtLoads or member.DistLoads:
+                fer_unc[n] = member._fer_unc(combo_name)[:, 0]
+
+        return fer_unc
+
+    @staticmethod
+    def d_batch(members: List[Member3D], combo_name: str = 'Combo 1', T: Optional[NDArray[float64]] = None) -> NDArray[float64]:
+        """
+        Returns the local displacement vectors for a list of members of a solved model.
+
+        :param members: The members to get the displacements for.
+        :type members: list
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param T: The transformation matrices, if they are already known. Defaults to None.
+        :type T: NDArray[float64], optional
+        :return: The local displacement vectors, shaped (n_members, 12).
+        :rtype: NDArray[float64]
+        """
+
+        if T is None:
+            T = Member3D.T_batch(members)
+
+        # Read in the global displacements from the nodes
+        D = zeros((len(members), 12))
+        for n, member in enumerate(members):
+            for i, node in ((0, member.i_node), (6, member.j_node)):
+                D[n, i:i+6] = (node.DX[combo_name], node.DY[combo_name], node.DZ[combo_name],
+                               node.RX[combo_name], node.RY[combo_name], node.RZ[combo_name])
+
+            # Apply axial displacements only if the member is active
+            if member.active[combo_name] == False:
+                D[n, 0] = 0
+                D[n, 6] = 0
+
+        return (T @ D[:, :, newaxis])[:, :, 0]
+
+    @staticmethod
+    def f_batch(members: List[Member3D], combo_name: str = 'Combo 1', T: Optional[NDArray[float64]] = None, d: Optional[NDArray[float64]] = None) -> NDArray[float64]:
+        """
+        Returns the local end force vectors for a list of members of a solved model.
+
+        :param members: The members to get the end forces for.
+        :type members: list
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param T: The transformation matrices, if they are already known. Defaults to None.
+        :type T: NDArray[float64], optional
+        :param d: The local displacement vectors from `d_batch`, if they are already known. Defaults to None.
+        :type d: NDArray[float64], optional
+        :return: The local end force vectors, shaped (n_members, 12).
+        :rtype: NDArray[float64]
+        """
+
+        # Calculate the local displacement and end force vectors
+        if d is None:
+            d = Member3D.d_batch(members, combo_name, T)
+        f = (Member3D.k_batch(members) @ d[:, :, newaxis])[:, :, 0] + Member3D.fer_batch(members, combo_name)
+
+        # Add the geometric stiffness terms after a P-Delta analysis
+        if len(members) and members[0].model.solution == 'P-Delta':
+            for n, member in enumerate(members):
+
+                # Back-calculate the axial force on the member from the axial strain
+                P = (d[n, 6] - d[n, 0])*member.section.A*member.material.E/member.L()
+                f[n] += member.kg(P) @ d[n]
+
+        return f
+
     def shear(self, Direction: Literal['Fy', 'Fz'], x: float, combo_name: str = 'Combo 1') -> float:
         """
         Returns the shear at a point along the member's length.
@@ -2221,6 +2530,175 @@ class Member3D():
             deflections = self._extract_vector_results(self.SegmentsY, x_array, 'deflection')[1]
             return vstack((x_array, deflections - (dzi + (dzj-dzi)/L*x_array)))
 
+    # The rows of the array returned by `results`
+    result_components = ('axial', 'Fy', 'Fz', 'My', 'Mz', 'torque', 'dx', 'dy', 'dz')
+
+    def results(self, x_array: NDArray[float64], combo_name: str = 'Combo 1') -> NDArray[float64]:
+        """
+        Returns all internal forces and deflections at the given locations with one call.
+
+        The rows are the components in `result_components`: the axial force, the shears `Fy`
+        and `Fz`, the moments `My` and `Mz`, the torque and the deflections `dx`, `dy` and `dz`.
+        They match `axial`, `shear`, `moment`, `torque` and `deflection` at each location.
+
+        Parameters
+        ----------
+        x_array : array
+            The locations in local member coordinates (between 0 and L), in any order.
+        combo_name : string
+            The name of the load combination to get the results for (not the load combination itself).
+
+        Returns
+        -------
+        NDArray[float64]
+            An array of shape (9, len(x_array)). All results are 0 if the member is inactive.
+        """
+
+        x_array = array(x_array, dtype=float).ravel()
+        results = zeros((len(self.result_components), len(x_array)))
+
+        # Only calculate results if the member is currently active
+        if not self.active[combo_name]:
+            return results
+
+        # Segment the member if necessary
+        if self._solved_combo is None or combo_name != self._solved_combo.name:
+            self._segment_member(combo_name)
+            self._solved_combo = self.model.load_combos[combo_name]
+
+        # Determine if a P-Delta analysis has been run
+        P_delta = self.model.solution == 'P-Delta' or self.model.solution == 'Pushover'
+
+        # Find the segment of each location. As in `axial` a location at the start of a segment
+        # belongs to it, and the end of the member belongs to the last segment.
+        x1 = array([segment.x1 for segment in self.SegmentsZ])
+        index = searchsorted(x1.round(10), x_array.round(10), side='right') - 1
+        index = index.clip(0, len(x1) - 1)
+
+        for i in unique(index):
+
+            on = index == i
+            x = x_array[on] - x1[i]
+            segment_z, segment_y, segment_x = self.SegmentsZ[i], self.SegmentsY[i], self.SegmentsX[i]
+
+            results[0, on] = segment_z.axial(x)
+            results[1, on] = segment_z.Shear(x)
+            results[2, on] = segment_y.Shear(x)
+            results[3, on] = segment_y.moment(x, P_delta)
+            results[4, on] = segment_z.moment(x, P_delta)
+            results[5, on] = segment_x.T1
+            results[6, on] = segment_z.axial_deflection(x)
+            results[7, on] = segment_z.deflection(x, P_delta)
+            results[8, on] = segment_y.deflection(x)
+
+        return results
+
+    def _continuous(self) -> bool:
+        """
+        Returns whether the member is a single mathematically continuous segment, which is the case
+        without point loads and with distributed loads over the full length only.
+        """
+
+        if self.PtLoads:
+            return False
+
+        ends = (0, round(self.L(), 10))
+        return all(round(load[3], 10) in ends and round(load[4], 10) in ends for load in self.DistLoads)
+
+    @staticmethod
+    def _results_batch(members: List[Member3D], index: NDArray, x_array: NDArray[float64], combo_name: str = 'Combo 1', T: Optional[NDArray[float64]] = None) -> NDArray[float64]:
+        """
+        Returns the internal forces and deflections of a list of continuous members (see
+        `_continuous`) at once. The segment of every member is built from the stacked end forces,
+        displacements and distributed loads, and the segment equations are evaluated for all
+        locations together.
+
+        :param members: The members, which all have to be continuous.
+        :type members: list
+        :param index: The member of each location, as index into `members`.
+        :type index: NDArray
+        :param x_array: The locations in local member coordinates.
+        :type x_array: NDArray[float64]
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param T: The transformation matrices, if they are already known. Defaults to None.
+        :type T: NDArray[float64], optional
+        :return: The rows of `result_components` at each location, shaped (9, len(x_array)).
+        :rtype: NDArray[float64]
+        """
+
+        results = zeros((len(Member3D.result_components), len(x_array)))
+        if len(members) == 0:
+            return results
+
+        if T is None:
+            T = Member3D.T_batch(members)
+
+        model = members[0].model
+        combo = model.load_combos[combo_name]
+        P_delta = model.solution == 'P-Delta' or model.solution == 'Pushover'
+
+        # Get the stacked end forces, fixed end reactions and displacements
+        d = Member3D.d_batch(members, combo_name, T)
+        f = Member3D.f_batch(members, combo_name, T, d)
+        fer = Member3D._fer_unc_batch(members, combo_name)
+
+        E = array([member.material.E for member in members], dtype=float)
+        A = array([member.section.A for member in members], dtype=float)
+        Iy = array([member.section.Iy for member in members], dtype=float)
+        Iz = array([member.section.Iz for member in members], dtype=float)
+        L = array([member.L() for member in members], dtype=float)
+
+        # Slopes at the start of the members by slope-deflection, as in `_segment_member`
+        theta1z = 1/3*((f[:, 5] - fer[:, 5])*L/(E*Iz) - (f[:, 11] - fer[:, 11])*L/(2*E*Iz) + 3*(d[:, 7] - d[:, 1])/L)
+        theta1y = -1/3*((-f[:, 4] + fer[:, 4])*L/(E*Iy) - (-f[:, 10] + fer[:, 10])*L/(2*E*Iy) + 3*(d[:, 8] - d[:, 2])/L)
+
+        # The distributed loads of the load combination, as local x, y and z intensities at the
+        # start and the end of each member
+        rows = [(n, load[0], factor*load[1], factor*load[2], load[3], load[4])
+                for n, member in enumerate(members) for load in member.DistLoads
+                for factor in (combo.factors.get(load[5]),) if factor is not None]
+        w = zeros((len(members), 3, 2))
+        if rows:
+            n, direction, w1, w2, x1, x2 = (array(column) for column in zip(*rows))
+            w2 = (w2 - w1)/(x2 - x1)*(L[n] - x1) + w1
+            axis = array(['xyz'.index(name[1].lower()) for name in direction])
+            local = array([name[1].islower() for name in direction])
+
+            # Local loads act along their axis, global loads are transformed to local components
+            add.at(w, (n[local], axis[local]), stack((w1[local], w2[local]), axis=1))
+            add.at(w, n[~local], T[n[~local], 0:3, axis[~local]][:, :, newaxis]*stack((w1[~local], w2[~local]), axis=1)[:, newaxis, :])
+
+        def segment(segment_type, **terms):
+            """Returns a segment holding the terms of the member of each location."""
+            new_segment = segment_type()
+            new_segment.x1 = zeros(len(index))
+            new_segment.x2 = L[index]
+            for name, term in terms.items():
+                setattr(new_segment, name, term[index])
+            return new_segment
+
+        segment_z = segment(BeamSegZ, EI=E*Iz, EA=E*A, P1=f[:, 0], V1=f[:, 1], M1=f[:, 5], w1=w[:, 1, 0], w2=w[:, 1, 1],
+                            p1=w[:, 0, 0], p2=w[:, 0, 1], theta1=theta1z, delta1=d[:, 1], delta_x1=d[:, 0])
+        segment_y = segment(BeamSegY, EI=E*Iy, EA=E*A, P1=f[:, 0], V1=f[:, 2], M1=f[:, 4], w1=w[:, 2, 0], w2=w[:, 2, 1],
+                            p1=w[:, 0, 0], p2=w[:, 0, 1], theta1=theta1y, delta1=d[:, 2], delta_x1=d[:, 0])
+
+        results[0] = segment_z.axial(x_array)
+        results[1] = segment_z.Shear(x_array)
+        results[2] = segment_y.Shear(x_array)
+        results[3] = segment_y.moment(x_array, P_delta)
+        results[4] = segment_z.moment(x_array, P_delta)
+        results[5] = f[index, 3]
+        results[6] = segment_z.axial_deflection(x_array)
+        results[7] = segment_z.deflection(x_array, P_delta)
+        results[8] = segment_y.deflection(x_array)
+
+        # Inactive members have no results
+        active = array([member.active[combo_name] for member in members], dtype=bool)
+        results[:, ~active[index]] = 0
+
+        return results
+
     def _segment_member(self, combo_name='Combo 1'):
         """
         Divides the element up into mathematically continuous segments along each axis
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from numpy import float64
     from numpy.typing import NDArray
 
-from numpy import array, dot, linspace, hstack, empty
+from numpy import array, dot, linspace, hstack, empty, cumsum, searchsorted, unique
 from numpy.linalg import norm
 from math import isclose, acos
 
@@ -972,6 +972,39 @@ class PhysMember(Member3D):
         # Return the results
         return d_array2
 
+    def results(self, x_array: NDArray[float64], combo_name: str = 'Combo 1') -> NDArray[float64]:
+        """
+        Returns all internal forces and deflections at the given locations with one call. The
+        locations are passed to the sub-members they lie on.
+
+        Parameters
+        ----------
+        x_array : array
+            The locations in local member coordinates (between 0 and L), in any order.
+        combo_name : string
+            The name of the load combination to get the results for (not the load combination itself).
+
+        Returns
+        -------
+        NDArray[float64]
+            An array of shape (9, len(x_array)) with the rows of `Member3D.result_components`.
+        """
+
+        x_array = array(x_array, dtype=float).ravel()
+        results = empty((len(self.result_components), len(x_array)))
+
+        # Find the sub-member of each location the way `find_member` does
+        sub_members = list(self.sub_members.values())
+        x_ends = cumsum([member.L() for member in sub_members])
+        index = searchsorted(x_ends, x_array, side='right').clip(0, len(sub_members) - 1)
+
+        for i in unique(index):
+            on = index == i
+            x_o = x_ends[i] - sub_members[i].L()
+            results[:, on] = sub_members[i].results(x_array[on] - x_o, combo_name)
+
+        return results
+
     def find_member(self, x: float) -> Tuple[Member3D, float]:
         """
         Returns the sub-member that the physical member's local point 'x' lies on, and 'x' modified for that sub-member's local coordinate system.
@@ -945,6 +945,326 @@ class Quad3D():
         
         # Return the transformation matrix.
         return T
+
+    # Gauss points used for numerical integration, in the order used by `k_b()` and `k_m()`
+    _gauss_points = ((-1/3**0.5, -1/3**0.5), (1/3**0.5, -1/3**0.5), (1/3**0.5, 1/3**0.5), (-1/3**0.5, 1/3**0.5))
+
+    @staticmethod
+    def _B_batch(quads: List[Quad3D]) -> dict:
+        """
+        Returns the strain-displacement matrices, the Jacobian determinants and the stress-strain
+        matrices for a list of quads at all four gauss points.
+
+        :param quads: The quads to build the matrices for.
+        :type quads: list
+        :return: A dictionary of stacked arrays. The B-matrices are shaped (n_quads, 4, rows, columns),
+                 the Jacobian determinants (n_quads, 4).
+        :rtype: dict
+        """
+
+        n = len(quads)
+
+        # Get the global coordinates for each node
+        P = np.array([[[node.X, node.Y, node.Z] for node in (quad.i_node, quad.j_node, quad.m_node, quad.n_node)]
+                      for quad in quads], dtype=float).reshape(n, 4, 3)
+
+        # Calculate the local (x, y) coordinates for each node, see `_local_coords()`
+        vectors = P - P[:, :1, :]
+        x_axis = vectors[:, 1]
+        z_axis = np.cross(x_axis, vectors[:, 2])
+        y_axis = np.cross(z_axis, x_axis)
+        x_axis = x_axis/norm(x_axis, axis=1)[:, np.newaxis]
+        y_axis = y_axis/norm(y_axis, axis=1)[:, np.newaxis]
+        xy = np.stack((np.einsum('nij,nj->ni', vectors, x_axis), np.einsum('nij,nj->ni', vectors, y_axis)), axis=2)
+
+        # Length and direction cosines of each side (k = 5, 6, 7, 8)
+        sides = np.roll(xy, -1, axis=1) - xy
+        L_k = norm(sides, axis=2)
+        C = sides[:, :, 0]/L_k
+        S = sides[:, :, 1]/L_k
+
+        # Material properties
+        E = np.array([quad.E for quad in quads], dtype=float)
+        nu = np.array([quad.nu for quad in quads], dtype=float)
+        t = np.array([quad.t for quad in quads], dtype=float)
+        kx_mod = np.array([quad.kx_mod for quad in quads], dtype=float)
+        ky_mod = np.array([quad.ky_mod for quad in quads], dtype=float)
+
+        # Equation 74
+        kappa = 5/6
+        phi = 2/(kappa*(1 - nu[:, np.newaxis]))*(t[:, np.newaxis]/L_k)**2
+
+        # [A_u] matrix for each quad
+        A_u = np.zeros((n, 4, 12))
+        for k in range(4):
+            a, b = 3*k, 3*((k + 1) % 4)
+            A_u[:, k, a] = -1/L_k[:, k]
+            A_u[:, k, a + 1] = C[:, k]/2
+            A_u[:, k, a + 2] = S[:, k]/2
+            A_u[:, k, b] = 1/L_k[:, k]
+            A_u[:, k, b + 1] = C[:, k]/2
+            A_u[:, k, b + 2] = S[:, k]/2
+
+        # [A_Delta_inv_DKMQ] @ [A_u] and [A_gamma] @ [A_phi_Delta] @ [A_u], as diagonal scalings
+        A_Delta_A_u = (-3/2/(1 + phi))[:, :, np.newaxis]*A_u
+        A_gamma = L_k/2*np.array([1, 1, -1, -1])
+        A_gamma_A_u = (A_gamma*phi/(1 + phi))[:, :, np.newaxis]*A_u
+
+        detJ = np.zeros((n, 4))
+        B_b = np.zeros((n, 4, 3, 12))
+        B_s = np.zeros((n, 4, 2, 12))
+        B_m = np.zeros((n, 4, 3, 8))
+
+        for g, (xi, eta) in enumerate(Quad3D._gauss_points):
+
+            # Derivatives of the bilinear interpolation functions
+            dN = 1/4*np.array([[eta - 1, -eta + 1, eta + 1, -eta - 1],
+                               [xi - 1,  -xi - 1,  xi + 1,  -xi + 1 ]])
+
+            # Derivatives of the quadratic interpolation functions
+            dP = np.array([[xi*(eta - 1), -0.5*(eta - 1)*(eta + 1), -xi*(eta + 1), 0.5*(eta - 1)*(eta + 1)],
+                           [0.5*(xi - 1)*(xi + 1), -eta*(xi + 1), -0.5*(xi - 1)*(xi + 1), eta*(xi - 1)]])
+
+            # Equation 44
+            N_gamma = np.array([[1/2*(1 - eta),       0,      1/2*(1 + eta),       0     ],
+                                [     0,        1/2*(1 + xi),       0,       1/2*(1 - xi)]])
+
+            # Jacobian matrix, its determinant and its inverse
+            J = dN @ xy
+            detJ[:, g] = J[:, 0, 0]*J[:, 1, 1] - J[:, 0, 1]*J[:, 1, 0]
+            J_inv = inv(J)
+
+            # Derivatives with respect to x and y
+            Nxy = J_inv @ dN
+            Pxy = J_inv @ dP
+
+            # Bending [B_b] = [B_b_beta] + [B_b_Delta_beta] @ [A_Delta_inv_DKMQ] @ [A_u]
+            B_b[:, g, 0, 1::3] = Nxy[:, 0]
+            B_b[:, g, 1, 2::3] = Nxy[:, 1]
+            B_b[:, g, 2, 1::3] = Nxy[:, 1]
+            B_b[:, g, 2, 2::3] = Nxy[:, 0]
+            B_b_Delta_beta = np.stack((Pxy[:, 0]*C, Pxy[:, 1]*S, Pxy[:, 1]*C + Pxy[:, 0]*S), axis=1)
+            B_b[:, g] += B_b_Delta_beta @ A_Delta_A_u
+
+            # Shear [B_s]
+            B_s[:, g] = J_inv @ N_gamma @ A_gamma_A_u
+
+            # Membrane [B_m]
+            B_m[:, g, 0, 0::2] = Nxy[:, 0]
+            B_m[:, g, 1, 1::2] = Nxy[:, 1]
+            B_m[:, g, 2, 0::2] = Nxy[:, 1]
+            B_m[:, g, 2, 1::2] = Nxy[:, 0]
+
+        # Stress-strain matrices, see `Hb()`, `Hs()` and `Cm()`
+        Hb = (E*t**3/(12*(1 - nu**2)))[:, np.newaxis, np.newaxis]*np.stack((
+            np.stack((np.ones(n), nu, np.zeros(n)), axis=1),
+            np.stack((nu, np.ones(n), np.zeros(n)), axis=1),
+            np.stack((np.zeros(n), np.zeros(n), (1 - nu)/2), axis=1)), axis=1)
+        Hs = (E*t*kappa/(2*(1 + nu)))[:, np.newaxis, np.newaxis]*np.eye(2)
+        Ex = E*kx_mod
+        Ey = E*ky_mod
+        G = E/(2*(1 + nu))
+        Cm = (1/(1 - nu*nu))[:, np.newaxis, np.newaxis]*np.stack((
+            np.stack((Ex, nu*Ex, np.zeros(n)), axis=1),
+            np.stack((nu*Ey, Ey, np.zeros(n)), axis=1),
+            np.stack((np.zeros(n), np.zeros(n), (1 - nu*nu)*G), axis=1)), axis=1)
+
+        return {'detJ': detJ, 'B_b': B_b, 'B_s': B_s, 'B_m': B_m, 'Hb': Hb, 'Hs': Hs, 'Cm': Cm, 't': t}
+
+    @staticmethod
+    def k_batch(quads: List[Quad3D], B: Optional[dict] = None) -> NDArray[float64]:
+        """
+        Returns the local stiffness matrices for a list of quads, combining bending, shear,
+        membrane and drilling terms the same way as `k()`.
+
+        :param quads: The quads to build the matrices for.
+        :type quads: list
+        :param B: The result of `_B_batch()`, if it is already known. Defaults to None.
+        :type B: dict, optional
+        :return: The local stiffness matrices, shaped (n_quads, 24, 24).
+        :rtype: NDArray[float64]
+        """
+
+        n = len(quads)
+        if B is None:
+            B = Quad3D._B_batch(quads)
+
+        detJ = B['detJ'][:, :, np.newaxis, np.newaxis]
+
+        # Bending and shear stiffness (see `k_b()`)
+        B_b, B_s = B['B_b'], B['B_s']
+        k = ((B_b.transpose(0, 1, 3, 2) @ B['Hb'][:, np.newaxis] @ B_b)*detJ).sum(axis=1)
+        k += ((B_s.transpose(0, 1, 3, 2) @ B['Hs'][:, np.newaxis] @ B_s)*detJ).sum(axis=1)
+
+        # Drilling stiffness as 1/1000 of the smallest rotational diagonal term
+        rotations = [1, 2, 4, 5, 7, 8, 10, 11]
+        k_rz = abs(k[:, rotations, rotations]).min(axis=1)/1000
+
+        # Expand the bending matrices, see `k_b()`
+        m = np.array([2*i + 2 if i % 3 == 0 else (2*i + 1 if i % 3 == 1 else 2*i) for i in range(12)])
+        k_b = np.zeros((n, 24, 24))
+        k_b[:, m[:, np.newaxis], m] = k
+        for i in (5, 11, 17, 23):
+            k_b[:, i, i] = k_rz
+        k_b[:, [4, 10, 16, 22], :] *= -1
+        k_b[:, :, [4, 10, 16, 22]] *= -1
+        k_b[:, [3, 4, 9, 10, 15, 16, 21, 22], :] = k_b[:, [4, 3, 10, 9, 16, 15, 22, 21], :]
+        k_b[:, :, [3, 4, 9, 10, 15, 16, 21, 22]] = k_b[:, :, [4, 3, 10, 9, 16, 15, 22, 21]]
+
+        # Membrane stiffness (see `k_m()`)
+        if (B['detJ'] <= 0).any():
+            for quad in np.array(quads, dtype=object)[(B['detJ'] <= 0).any(axis=1)]:
+                warnings.warn(f'The Jacobian matrix for quad element {quad.name} is less than or equal to zero, indicating the element is invalid or badly distorted.')
+
+        B_m = B['B_m']
+        k = B['t'][:, np.newaxis, np.newaxis]*((B_m.transpose(0, 1, 3, 2) @ B['Cm'][:, np.newaxis] @ B_m)*detJ).sum(axis=1)
+
+        # Expand the membrane matrices
+        m = np.array([3*i if i % 2 == 0 else 3*i - 2 for i in range(8)])
+        k_b[:, m[:, np.newaxis], m] += k
+
+        return k_b
+
+    @staticmethod
+    def T_batch(quads: List[Quad3D]) -> NDArray[float64]:
+        """
+        Returns the coordinate transformation matrices for a list of quads.
+
+        :param quads: The quads to build the matrices for.
+        :type quads: list
+        :return: The transformation matrices, shaped (n_quads, 24, 24).
+        :rtype: NDArray[float64]
+        """
+
+        n = len(quads)
+
+        Pi = np.array([[quad.i_node.X, quad.i_node.Y, quad.i_node.Z] for quad in quads], dtype=float).reshape(n, 3)
+        Pj = np.array([[quad.j_node.X, quad.j_node.Y, quad.j_node.Z] for quad in quads], dtype=float).reshape(n, 3)
+        Pn = np.array([[quad.n_node.X, quad.n_node.Y, quad.n_node.Z] for quad in quads], dtype=float).reshape(n, 3)
+
+        # The local x-axis runs from the i-node to the j-node, the local z-axis is perpendicular
+        # to the plate and the local y-axis is in the plane of the plate
+        x = (Pj - Pi)/norm(Pj - Pi, axis=1)[:, np.newaxis]
+        z = np.cross(x, Pn - Pi)
+        z = z/norm(z, axis=1)[:, np.newaxis]
+        y = np.cross(z, x)
+        y = y/norm(y, axis=1)[:, np.newaxis]
+
+        dir_cos = np.stack((x, y, z), axis=1)
+
+        T = np.zeros((n, 24, 24))
+        for i in range(0, 24, 3):
+            T[:, i:i+3, i:i+3] = dir_cos
+
+        return T
+
+    @staticmethod
+    def K_batch(quads: List[Quad3D], T: Optional[NDArray[float64]] = None) -> NDArray[float64]:
+        """
+        Returns the global stiffness matrices for a list of quads.
+
+        :param quads: The quads to build the matrices for.
+        :type quads: list
+        :param T: The transformation matrices, if they are already known. Defaults to None.
+        :type T: NDArray[float64], optional
+        :return: The global stiffness matrices, shaped (n_quads, 24, 24).
+        :rtype: NDArray[float64]
+        """
+
+        if T is None:
+            T = Quad3D.T_batch(quads)
+
+        # The transformation matrices are orthogonal, so their transpose is their inverse
+        return T.transpose(0, 2, 1) @ Quad3D.k_batch(quads) @ T
+
+    @staticmethod
+    def fer_batch(quads: List[Quad3D], combo_name: str = 'Combo 1', B: Optional[dict] = None) -> NDArray[float64]:
+        """
+        Returns the local fixed end reaction vectors for a list of quads.
+
+        :param quads: The quads to build the vectors for.
+        :type quads: list
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :param B: The result of `_B_batch()`, if it is already known. Defaults to None.
+        :type B: dict, optional
+        :return: The local fixed end reaction vectors, shaped (n_quads, 24).
+        :rtype: NDArray[float64]
+        """
+
+        fer = np.zeros((len(quads), 24))
+        if len(quads) == 0:
+            return fer
+
+        if B is None:
+            B = Quad3D._B_batch(quads)
+
+        # Sum the factored surface pressures of each quad
+        combo = quads[0].model.load_combos[combo_name]
+        p = np.zeros(len(quads))
+        for n, quad in enumerate(quads):
+            for case, factor in combo.factors.items():
+                for pressure in quad.pressures:
+                    if pressure[1] == case:
+                        p[n] -= factor*pressure[0]
+
+        # Interpolation functions at each gauss point
+        Hw = np.array([[1/4*(1 - xi)*(1 - eta), 1/4*(1 + xi)*(1 - eta), 1/4*(1 + xi)*(1 + eta), 1/4*(1 - xi)*(1 + eta)]
+                       for xi, eta in Quad3D._gauss_points])
+
+        # The pressures act on the z-deflection terms, which expand to rows 2, 8, 14 and 20
+        fer[:, 2::6] = p[:, np.newaxis]*(B['detJ'] @ Hw)
+
+        return fer
+
+    @staticmethod
+    def results_batch(quads: List[Quad3D], xi: float = 0.0, eta: float = 0.0, combo_name: str = 'Combo 1') -> NDArray[float64]:
+        """
+        Returns the internal shears, moments and membrane stresses at a point of each quad of a
+        solved model, in each quad's local coordinate system.
+
+        :param quads: The quads to get results for.
+        :type quads: list
+        :param xi: The xi-coordinate. Defaults to 0.
+        :type xi: float, optional
+        :param eta: The eta-coordinate. Defaults to 0.
+        :type eta: float, optional
+        :param combo_name: The name of the load combination. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :return: The results [Qx, Qy, Mx, My, Mxy, Sx, Sy, Txy], shaped (n_quads, 8).
+        :rtype: NDArray[float64]
+        """
+
+        n = len(quads)
+        B = Quad3D._B_batch(quads)
+
+        # Get the local displacement vectors
+        D = np.zeros((n, 24))
+        for q, quad in enumerate(quads):
+            for i, node in enumerate((quad.i_node, quad.j_node, quad.m_node, quad.n_node)):
+                D[q, 6*i:6*i+6] = (node.DX[combo_name], node.DY[combo_name], node.DZ[combo_name],
+                                   node.RX[combo_name], node.RY[combo_name], node.RZ[combo_name])
+        d = (Quad3D.T_batch(quads) @ D[:, :, np.newaxis])[:, :, 0]
+
+        # Correct the sign convention for x-axis rotation and swap the local x and y for bending,
+        # see `shear()` and `moment()`
+        d_b = d.copy()
+        d_b[:, [3, 9, 15, 21]] *= -1
+        d_b = d_b[:, [2, 4, 3, 8, 10, 9, 14, 16, 15, 20, 22, 21]][:, np.newaxis, :, np.newaxis]
+        d_m = d[:, [0, 1, 6, 7, 12, 13, 18, 19]][:, np.newaxis, :, np.newaxis]
+
+        # Extrapolate from the gauss points to the requested location
+        gp = 1/3**0.5
+        xi_ex = xi/gp
+        eta_ex = eta/gp
+        H = 1/4*np.array([(1 - xi_ex)*(1 - eta_ex), (1 + xi_ex)*(1 - eta_ex), (1 + xi_ex)*(1 + eta_ex), (1 - xi_ex)*(1 + eta_ex)])
+
+        # Calculate the internal shears, moments and stresses at each gauss point
+        q = (B['Hs'][:, np.newaxis] @ B['B_s'] @ d_b)[:, :, :, 0]
+        m = (B['Hb'][:, np.newaxis] @ B['B_b'] @ d_b)[:, :, :, 0]
+        s = (B['Cm'][:, np.newaxis] @ B['B_m'] @ d_m)[:, :, :, 0]
+
+        return np.concatenate((H @ q, H @ m, H @ s), axis=1)
     
     # def T(self):
     #     """
@@ -1030,6 +1350,9 @@ class Quad3D():
         Internal shear force per unit length of the quad element: [[Qx], [Qy]]
         """
 
+        # Update the local coordinate system
+        self._local_coords()
+
         # Get the plate's local displacement vector
         d = self.d(combo_name)
                 
@@ -1108,6 +1431,9 @@ class Quad3D():
         Internal moment per unit length of the quad element: [[Mx], [My], [Mxy]]
         """
 
+        # Update the local coordinate system
+        self._local_coords()
+
         # Get the plate's local displacement vector
         d = self.d(combo_name)
 
@@ -1176,6 +1502,9 @@ class Quad3D():
 
     def membrane(self, xi:float=0, eta: float=0, local:bool=True, combo_name:str='Combo 1') -> NDArray[float64]:
 
+        # Update the local coordinate system
+        self._local_coords()
+
         # Get the plate's local displacement vector. Slice out terms not related to membrane stresses.
         d = self.d(combo_name)[[0, 1, 6, 7, 12, 13, 18, 19], :]
 
@@ -0,0 +1,458 @@
+from __future__ import annotations # Allows more recent type hints features
+from typing import TYPE_CHECKING
+from abc import ABC, abstractmethod
+from time import perf_counter
+
+from numpy import zeros, empty, ones, identity, arange, argsort, unique, concatenate, absolute
+from numpy.linalg import solve
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, List
+    from numpy import float64
+    from numpy.typing import NDArray
+    from scipy.sparse import csr_matrix
+    from Pynite.SparsePattern import SparsePattern
+
+
+class Solver(ABC):
+    """The base class of the sparse solver backends. A backend factorizes the partitioned
+    stiffness matrix `K11` and returns a `Factorization` that solves for any right hand side.
+    Backends are registered by name in `solvers` with the `register` decorator.
+    """
+
+    # The name the backend is registered with
+    name = None
+
+    @staticmethod
+    def available() -> bool:
+        """Returns whether the libraries the backend needs are installed.
+        """
+        return True
+
+    @abstractmethod
+    def factorize(self, K11: csr_matrix, pattern: SparsePattern | None = None) -> Factorization:
+        """Factorizes `K11`.
+
+        :param K11: The partitioned stiffness matrix of the unknown displacements.
+        :type K11: csr_matrix
+        :param pattern: The pattern `K11` was built with. The analysis the backend kept with it, such as the fill-reducing ordering, is reused if given.
+        :type pattern: SparsePattern, optional
+        :return: The factorization.
+        :rtype: Factorization
+        """
+
+
+# The registered solver backends by name
+solvers: Dict[str, type] = {}
+
+
+def register(cls: type) -> type:
+    """Registers a solver backend under its name. Can be used as a class decorator.
+    """
+
+    solvers[cls.name] = cls
+    return cls
+
+
+def available() -> List[str]:
+    """Returns the names of the registered backends that can be used with the installed libraries.
+    """
+
+    return [name for name, cls in solvers.items() if cls.available()]
+
+
+def get(solver: str | Solver = 'superlu', **options) -> Solver:
+    """Returns a solver backend.
+
+    :param solver: The name of a registered backend, or a backend instance which is returned as it is. Defaults to `'superlu'`.
+    :type solver: str or Solver, optional
+    :param options: Options passed to the backend, such as `permc_spec` for `'superlu'`.
+    :raises ValueError: Occurs when no backend is registered under the name.
+    :raises ImportError: Occurs when the libraries of the backend are not installed.
+    :return: The backend.
+    :rtype: Solver
+    """
+
+    if isinstance(solver, Solver):
+        return solver
+
+    if solver not in solvers:
+        raise ValueError(f"Unknown solver '{solver}'. Available solvers are {available()}.")
+
+    if not solvers[solver].available():
+        raise ImportError(f"The libraries of the solver '{solver}' are not installed.")
+
+    return solvers[solver](**options)
+
+
+@register
+class SuperLUSolver(Solver):
+    """Sparse LU decomposition by SuperLU from `scipy`. With the default `'MMD_AT_PLUS_A'` ordering
+    the symmetric fill-reducing ordering of the first model is kept by its pattern, and later models
+    are factorized with it instead of ordering them again. SuperLU still makes the symbolic and the
+    numeric factorization for each model.
+    """
+
+    name = 'superlu'
+
+    def __init__(self, permc_spec: str = 'MMD_AT_PLUS_A') -> None:
+        """
+        :param permc_spec: The column permutation of SuperLU: `'MMD_AT_PLUS_A'`, `'COLAMD'`, `'MMD_ATA'` or `'NATURAL'`. Defaults to `'MMD_AT_PLUS_A'`.
+        :type permc_spec: str, optional
+        """
+        self.permc_spec = permc_spec
+
+    def factorize(self, K11: csr_matrix, pattern: SparsePattern | None = None) -> Factorization:
+
+        from scipy.sparse import csr_matrix, csc_matrix
+        from scipy.sparse.linalg import splu
+
+        # Only the symmetric ordering can be kept. It is applied to the rows and the columns.
+        if pattern is None or self.permc_spec != 'MMD_AT_PLUS_A':
+            lu = splu(K11.tocsc(), permc_spec=self.permc_spec)
+            return Factorization(lu.solve, K11, pattern, self, self.pivots(lu))
+
+        symbolic = pattern.symbolic.get(self.name)
+
+        if symbolic is None:
+
+            # The stiffness matrix is symmetric. Order it by the minimum degree of K^T + K and
+            # remember the ordering for the next models.
+            lu = splu(K11.tocsc(), permc_spec='MMD_AT_PLUS_A')
+            order = argsort(lu.perm_c)
+
+            # Map the values of `K11` to its reordered `csc` structure. The values are the position
+            # of each term plus 1 so that none of them is dropped as a zero.
+            K11p = csr_matrix((arange(1, K11.nnz + 1, dtype=float), K11.indices, K11.indptr), shape=K11.shape)
+            K11p = K11p[order][:, order].tocsc()
+            pattern.symbolic[self.name] = (order, K11p.data.astype(int) - 1, K11p.indices, K11p.indptr)
+
+            return Factorization(lu.solve, K11, pattern, self, self.pivots(lu))
+
+        # Reorder the values and factorize with the kept ordering
+        order, order_map, p_indices, p_indptr = symbolic
+        K11p = csc_matrix((K11.data[order_map], p_indices, p_indptr), shape=K11.shape)
+        lu = splu(K11p, permc_spec='NATURAL')
+
+        def reordered_solve(b):
+            x = empty(b.shape)
+            x[order] = lu.solve(b[order])
+            return x
+
+        pivots = empty(K11.shape[0])
+        pivots[order] = self.pivots(lu)
+
+        return Factorization(reordered_solve, K11, pattern, self, pivots)
+
+    @staticmethod
+    def pivots(lu) -> NDArray[float64]:
+        """Returns the magnitude of the pivot of each column of a SuperLU factorization. SuperLU
+        factorizes `Pr A Pc = L U`, so column `i` of `A` is pivoted by `U[perm_c[i], perm_c[i]]`.
+        """
+        return absolute(lu.U.diagonal())[lu.perm_c]
+
+
+@register
+class CholeskySolver(Solver):
+    """Sparse Cholesky decomposition by CHOLMOD from the optional `scikit-sparse` package. The
+    stiffness matrix has to be symmetric and positive definite. The symbolic analysis of the first
+    model is kept by its pattern.
+    """
+
+    name = 'cholmod'
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import sksparse.cholmod
+            return True
+        except ImportError:
+            return False
+
+    def factorize(self, K11: csr_matrix, pattern: SparsePattern | None = None) -> Factorization:
+
+        from sksparse.cholmod import analyze, cholesky
+
+        if pattern is None:
+            factor = cholesky(K11.tocsc())
+
+        else:
+            if self.name not in pattern.symbolic:
+                pattern.symbolic[self.name] = analyze(K11.tocsc())
+            factor = pattern.symbolic[self.name].cholesky(K11.tocsc())
+
+        # The diagonal of the LDL' factorization is in the order of the fill-reducing permutation
+        pivots = empty(K11.shape[0])
+        pivots[factor.P()] = absolute(factor.D())
+
+        return Factorization(factor.solve_A, K11, pattern, self, pivots)
+
+
+@register
+class CGSolver(Solver):
+    """Conjugate gradients preconditioned by an incomplete LU decomposition from `scipy`, for
+    symmetric positive definite stiffness matrices. Right hand sides the solver does not converge
+    for are solved directly with SuperLU.
+
+    Conjugate gradients have no pivots. If the pivots are asked for, as by the mechanism check of
+    an analysis with `check_stability`, `K11` is factorized directly with SuperLU as well, and the
+    following right hand sides are solved with it. Turn `check_stability` off to solve with
+    conjugate gradients only.
+    """
+
+    name = 'cg'
+
+    def __init__(self, tol: float = 1e-10, drop_tol: float = 1e-5, max_iter: int | None = None) -> None:
+        """
+        :param tol: The relative residual to reach. Defaults to 1e-10.
+        :type tol: float, optional
+        :param drop_tol: The drop tolerance of the incomplete LU decomposition. Defaults to 1e-5.
+        :type drop_tol: float, optional
+        :param max_iter: The maximum number of iterations. Defaults to the `scipy` default.
+        :type max_iter: int, optional
+        """
+        self.tol = tol
+        self.drop_tol = drop_tol
+        self.max_iter = max_iter
+
+    def factorize(self, K11: csr_matrix, pattern: SparsePattern | None = None) -> Factorization:
+
+        from scipy.sparse.linalg import LinearOperator, cg, spilu, splu
+
+        A = K11.tocsc()
+        n = A.shape[0]
+        ilu = spilu(A, drop_tol=self.drop_tol)
+        M = LinearOperator((n, n), matvec=ilu.solve, dtype=float)
+
+        # A direct factorization, only made if a right hand side does not converge or the pivots are needed
+        direct = []
+
+        def direct_lu():
+            if not direct:
+                direct.append(splu(A))
+            return direct[0]
+
+        def pivots():
+            try:
+                return SuperLUSolver.pivots(direct_lu())
+            except RuntimeError:
+                raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+        def solve_column(b):
+
+            # Once the direct factorization has been made it is cheaper than the iterations
+            if direct:
+                return direct[0].solve(b)
+
+            # The tolerance was renamed from `tol` to `rtol` in scipy 1.12
+            try:
+                x, info = cg(A, b, rtol=self.tol, M=M, maxiter=self.max_iter)
+            except TypeError:
+                x, info = cg(A, b, tol=self.tol, M=M, maxiter=self.max_iter)
+
+            if info != 0:
+                x = direct_lu().solve(b)
+
+            return x
+
+        def cg_solve(b):
+            if b.ndim == 1:
+                return solve_column(b)
+
+            x = empty(b.shape)
+            for i in range(b.shape[1]):
+                x[:, i] = solve_column(b[:, i])
+            return x
+
+        return Factorization(cg_solve, K11, pattern, self, pivots)
+
+
+@register
+class AutoSolver(Solver):
+    """Times the available backends on the first model of each size and uses the fastest one for
+    all models of that size. Sizes are grouped by powers of 2 of the number of unknown
+    displacements. The pivots are part of the timing, as backends without pivots of their own
+    have to factorize again for the mechanism check of `check_stability`.
+    """
+
+    name = 'auto'
+
+    # The backends that are compared
+    candidates = ['superlu', 'cholmod', 'cg']
+
+    def __init__(self, with_pivots: bool = True) -> None:
+        """
+        :param with_pivots: Whether the pivots are included in the timing. Set to `False` if the models are analyzed without `check_stability`. Defaults to `True`.
+        :type with_pivots: bool, optional
+        """
+
+        self.with_pivots = with_pivots
+
+        # The fastest backend found for each size. Keep the instance to reuse the choices.
+        self.choices: Dict[int, str] = {}
+
+    def factorize(self, K11: csr_matrix, pattern: SparsePattern | None = None) -> Factorization:
+
+        size = K11.shape[0].bit_length()
+
+        if size in self.choices:
+            return get(self.choices[size]).factorize(K11, pattern)
+
+        # Import scipy before timing, otherwise the first backend would be timed with the import
+        import scipy.sparse.linalg
+
+        # Time a factorization and a solution with each backend
+        fastest = None
+        b = ones(K11.shape[0])
+        for name in self.candidates:
+
+            if name not in solvers or not solvers[name].available():
+                continue
+
+            try:
+                start = perf_counter()
+                factorization = get(name).factorize(K11, pattern)
+                factorization.solve(b)
+                if self.with_pivots:
+                    # Backends making the pivots on demand are timed with them
+                    factorization.pivots
+                elapsed = perf_counter() - start
+            except Exception:
+                continue
+
+            if fastest is None or elapsed < fastest[0]:
+                fastest = (elapsed, name, factorization)
+
+        if fastest is None:
+            raise ValueError('None of the solvers could factorize the stiffness matrix.')
+
+        self.choices[size] = fastest[1]
+
+        return fastest[2]
+
+
+class Factorization():
+    """A factorization of a partitioned stiffness matrix `K11` by a solver backend.
+    """
+
+    def __init__(self, solve: Callable, K11: csr_matrix, pattern: SparsePattern | None = None, solver: Solver | None = None, pivots: NDArray[float64] | Callable | None = None) -> None:
+        """
+        :param solve: A function solving `K11 x = b` for `b` shaped (n,), (n, 1) or (n, m).
+        :type solve: function
+        :param K11: The factorized matrix.
+        :type K11: csr_matrix
+        :param pattern: The pattern `K11` was built with, if any.
+        :type pattern: SparsePattern, optional
+        :param solver: The backend that made the factorization.
+        :type solver: Solver, optional
+        :param pivots: The magnitude of the pivot of each degree of freedom, for backends that provide them. Used to detect mechanisms. May be a function returning them, which is called when they are first needed.
+        :type pivots: ndarray or function, optional
+        """
+
+        self._solve = solve
+        self.K11 = K11
+        self.pattern = pattern
+        self.solver = solver
+        self._pivots = pivots
+
+        # A factorization is the base of the updates it is solving
+        self.base = self
+
+    @property
+    def pivots(self) -> NDArray[float64] | None:
+        """The magnitude of the pivot of each degree of freedom, or `None` if the backend does not
+        provide them.
+        """
+
+        if callable(self._pivots):
+            self._pivots = self._pivots()
+
+        return self._pivots
+
+    def solve(self, b: NDArray[float64]) -> NDArray[float64]:
+        """Solves `K11 x = b`.
+
+        :param b: The right hand side(s), shaped (n,), (n, 1) or (n, m).
+        :type b: ndarray
+        :return: The solution, shaped like `b`.
+        :rtype: ndarray
+        """
+
+        return self._solve(b)
+
+    def update(self, K11: csr_matrix, max_rank: int = 120) -> Factorization | LowRankUpdate:
+        """Returns a solver for a changed `K11`, such as after tension/compression-only elements
+        have been deactivated. If only a few degrees of freedom are affected the change is applied
+        as a low-rank update of this factorization. Otherwise `K11` is factorized again by the same
+        backend, reusing the analysis kept with the pattern.
+
+        :param K11: The changed matrix.
+        :type K11: csr_matrix
+        :param max_rank: The largest number of affected degrees of freedom handled as an update.
+                         No more than a tenth of the degrees of freedom are handled as an update.
+                         Defaults to 120.
+        :type max_rank: int, optional
+        :return: A solver for the changed matrix.
+        :rtype: Factorization or LowRankUpdate
+        """
+
+        change = (K11 - self.K11).tocoo()
+        change.eliminate_zeros()
+        J = unique(concatenate((change.row, change.col)))
+
+        if len(J) > min(max_rank, K11.shape[0]//10):
+            return get(self.solver).factorize(K11, self.pattern)
+
+        return LowRankUpdate(self, K11, J)
+
+
+class LowRankUpdate():
+    """Solves with a changed matrix `K11 + dK` by the Sherman-Morrison-Woodbury formula, using
+    the factorization of `K11`. The change `dK` only affects the degrees of freedom `J`:
+
+    (K11 + E dK E^T)^-1 = K11^-1 - K11^-1 E (I + dK E^T K11^-1 E)^-1 dK E^T K11^-1
+
+    where `E` selects the columns `J`.
+    """
+
+    def __init__(self, base: Factorization, K11: csr_matrix, J: NDArray) -> None:
+        """
+        :param base: The factorization of the unchanged matrix.
+        :type base: Factorization
+        :param K11: The changed matrix.
+        :type K11: csr_matrix
+        :param J: The degrees of freedom affected by the change.
+        :type J: ndarray
+        """
+
+        self.base = base
+        self.K11 = K11
+        self.J = J
+
+        if len(J) == 0:
+            return
+
+        # Columns of the inverse of the unchanged matrix for the affected degrees of freedom
+        E = zeros((K11.shape[0], len(J)))
+        E[J, arange(len(J))] = 1.0
+        self.G = base.solve(E)
+
+        # The dense change and the small matrix of the formula
+        self.dK = (K11 - base.K11).tocsr()[J][:, J].toarray()
+        self.M = identity(len(J)) + self.dK @ self.G[J]
+
+    def solve(self, b: NDArray[float64]) -> NDArray[float64]:
+        """Solves `(K11 + dK) x = b`.
+
+        :param b: The right hand side(s), shaped (n,), (n, 1) or (n, m).
+        :type b: ndarray
+        :return: The solution, shaped like `b`.
+        :rtype: ndarray
+        """
+
+        y = self.base.solve(b)
+
+        if len(self.J) == 0:
+            return y
+
+        return y - self.G @ solve(self.M, self.dK @ y[self.J])
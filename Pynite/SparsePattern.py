@@ -0,0 +1,176 @@
+from __future__ import annotations # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+from numpy import array, ones, empty, arange, nonzero, unique, bincount, cumsum, concatenate, array_equal
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+    from scipy.sparse import coo_matrix, csr_matrix
+    from Pynite.Solvers import Solver, Factorization
+
+
+class SparsePattern():
+    """Stores the sparsity pattern of a partitioned global stiffness matrix.
+
+    Frames of an animation or the individuals of a genetic algorithm usually share the same nodes,
+    elements and supports. Only coordinates and sections change, so the position of every term in
+    the partitioned matrices stays the same. The pattern maps the terms of the assembled `coo`
+    matrix to the `csr` structure of `K11`, `K12`, `K21` and `K22` once. Later models with the same
+    topology only refill the values. The analysis of `K11` by the solver backend is kept as well,
+    the fill-reducing ordering for SuperLU and the symbolic factorization for CHOLMOD.
+    """
+
+    # Recently used patterns, keyed by the topology they were built for
+    _cache: Dict[tuple, SparsePattern] = {}
+
+    # The number of patterns kept in the cache
+    max_cached = 8
+
+    def __init__(self, row: NDArray, col: NDArray, n: int, D1_indices: List[int]) -> None:
+        """Builds the pattern for the terms of a global stiffness matrix.
+
+        :param row: The row index of each term of the unpartitioned `coo` matrix.
+        :type row: ndarray
+        :param col: The column index of each term of the unpartitioned `coo` matrix.
+        :type col: ndarray
+        :param n: The number of degrees of freedom in the model.
+        :type n: int
+        :param D1_indices: A list of the indices for degrees of freedom that have unknown displacements.
+        :type D1_indices: list
+        """
+
+        # Degrees of freedom with known displacements are all the others
+        is_D2 = ones(n, dtype=bool)
+        is_D2[array(D1_indices, dtype=int)] = False
+        D1 = nonzero(~is_D2)[0]
+        D2 = nonzero(is_D2)[0]
+        sizes = (len(D1), len(D2))
+
+        # Position of each degree of freedom within its partition
+        local = empty(n, dtype=int)
+        local[D1] = arange(len(D1))
+        local[D2] = arange(len(D2))
+
+        # Partition of the row and column of each term
+        row_D2 = is_D2[row]
+        col_D2 = is_D2[col]
+
+        # For each submatrix: which terms belong to it, where they are summed, and its structure
+        self.blocks = []
+        for a, b in ((0, 0), (0, 1), (1, 0), (1, 1)):
+
+            terms = nonzero((row_D2 == a) & (col_D2 == b))[0]
+
+            # Terms at the same position are summed like `coo_matrix` does. Sorting the positions
+            # row by row gives the `csr` order.
+            position = local[row[terms]]*sizes[b] + local[col[terms]]
+            positions, target = unique(position, return_inverse=True)
+
+            rows = positions // max(sizes[b], 1)
+            indptr = concatenate(([0], cumsum(bincount(rows, minlength=sizes[a]))))
+            indices = positions % max(sizes[b], 1)
+
+            self.blocks.append((terms, target.ravel(), indptr, indices, (sizes[a], sizes[b])))
+
+        # Analyses of `K11` by the solver backends, such as fill-reducing orderings or symbolic
+        # factorizations. They are found by the first factorization.
+        self.symbolic = {}
+
+    @staticmethod
+    def get(K: coo_matrix, D1_indices: List[int]) -> SparsePattern:
+        """Returns the pattern for a global stiffness matrix. The pattern is taken from the cache if
+        a matrix with the same terms and partition has been seen before. Otherwise it is built and
+        added to the cache.
+
+        :param K: The unpartitioned global stiffness matrix, as returned by `FEModel3D.K`.
+        :type K: coo_matrix
+        :param D1_indices: A list of the indices for degrees of freedom that have unknown displacements.
+        :type D1_indices: list
+        :return: The sparsity pattern.
+        :rtype: SparsePattern
+        """
+
+        key = (K.shape[0], array(D1_indices, dtype=int).tobytes(), K.row.tobytes(), K.col.tobytes())
+
+        cache = SparsePattern._cache
+        pattern = cache.pop(key, None)
+        if pattern is None:
+            pattern = SparsePattern(K.row, K.col, K.shape[0], D1_indices)
+
+            # Forget the least recently used pattern
+            if len(cache) >= SparsePattern.max_cached:
+                del cache[next(iter(cache))]
+
+        # Reinsert the pattern as the most recently used one
+        cache[key] = pattern
+
+        return pattern
+
+    def partition(self, K: coo_matrix) -> Tuple[csr_matrix, csr_matrix, csr_matrix, csr_matrix]:
+        """Partitions a global stiffness matrix with this pattern into 4 submatrices.
+
+        :param K: The unpartitioned global stiffness matrix, as returned by `FEModel3D.K`.
+        :type K: coo_matrix
+        :return: The submatrices `K11`, `K12`, `K21` and `K22` in `csr` format.
+        :rtype: csr_matrix, csr_matrix, csr_matrix, csr_matrix
+        """
+
+        from scipy.sparse import csr_matrix
+
+        submatrices = []
+        for terms, target, indptr, indices, shape in self.blocks:
+
+            # Sum the values into the positions of the precomputed structure
+            data = bincount(target, weights=K.data[terms], minlength=len(indices))
+
+            m = csr_matrix((data, indices, indptr), shape=shape)
+            m.has_sorted_indices = True
+            submatrices.append(m)
+
+        return tuple(submatrices)
+
+    def solve(self, K11: csr_matrix, b: NDArray[float64], solver: str | Solver = 'superlu') -> NDArray[float64]:
+        """Solves `K11 x = b` with a new factorization of `K11`.
+
+        :param K11: The partitioned stiffness matrix of the unknown displacements.
+        :type K11: csr_matrix
+        :param b: The right hand side(s), shaped (n, 1) or (n, m).
+        :type b: ndarray
+        :param solver: The name of a solver in `Solvers.solvers`, or a solver instance. Defaults to `'superlu'`.
+        :type solver: str or Solver, optional
+        :return: The solution, shaped like `b`.
+        :rtype: ndarray
+        """
+
+        return self.factorize(K11, solver).solve(b)
+
+    def factorize(self, K11: csr_matrix, solver: str | Solver = 'superlu') -> Factorization:
+        """Factorizes `K11` with a solver backend. If `K11` has the structure of this pattern the
+        backend reuses its analysis from previous models, such as the fill-reducing ordering.
+
+        :param K11: The partitioned stiffness matrix of the unknown displacements.
+        :type K11: csr_matrix
+        :param solver: The name of a solver in `Solvers.solvers`, or a solver instance. Defaults to `'superlu'`.
+        :type solver: str or Solver, optional
+        :return: The factorization.
+        :rtype: Factorization
+        """
+
+        from Pynite import Solvers
+
+        # Matrices with another structure, such as `K11` with added geometric stiffness terms, are
+        # factorized without the pattern
+        if self.matches(K11):
+            return Solvers.get(solver).factorize(K11, self)
+        else:
+            return Solvers.get(solver).factorize(K11)
+
+    def matches(self, K11: csr_matrix) -> bool:
+        """Checks if a matrix has the structure of `K11` of this pattern.
+        """
+
+        indptr, indices, shape = self.blocks[0][2], self.blocks[0][3], self.blocks[0][4]
+
+        return K11.shape == shape and array_equal(K11.indptr, indptr) and array_equal(K11.indices, indices)
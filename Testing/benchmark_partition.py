@@ -0,0 +1,95 @@
+# coding-utf8
+"""
+Compare the partitioning of the global stiffness matrix through lil_matrix
+with the partitioning in compressed formats used by Analysis._partition
+and by the cached SparsePattern.
+
+Run from the folder of the addon:
+python Testing/benchmark_partition.py [grid size]
+A grid size of 30 gives a frame with about 11k degrees of freedom.
+"""
+import os
+import sys
+from time import perf_counter
+
+currentdir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(currentdir))
+
+from numpy import abs as np_abs
+from Pynite import FEModel3D, Analysis
+from Pynite.SparsePattern import SparsePattern
+
+def grid_frame(n):
+	"""
+	Create a frame of n x n columns with beams in both directions.
+	:param n: Needs the amount of columns per side as int.
+	:return model: Returns the prepared FEModel3D.
+	"""
+	model = FEModel3D()
+	model.add_material("steel", 210e6, 81e6, 0.3, 78.5)
+	model.add_section("tube", 0.002, 3e-6, 3e-6, 6e-6)
+
+	for x in range(n):
+		for y in range(n):
+			model.add_node("b_" + str(x) + "_" + str(y), x, y, 0)
+			model.add_node("t_" + str(x) + "_" + str(y), x, y, 3)
+			model.def_support("b_" + str(x) + "_" + str(y), True, True, True, True, True, True)
+			model.add_member("c_" + str(x) + "_" + str(y), "b_" + str(x) + "_" + str(y), "t_" + str(x) + "_" + str(y), "steel", "tube")
+
+			if x > 0:
+				model.add_member("x_" + str(x) + "_" + str(y), "t_" + str(x-1) + "_" + str(y), "t_" + str(x) + "_" + str(y), "steel", "tube")
+			if y > 0:
+				model.add_member("y_" + str(x) + "_" + str(y), "t_" + str(x) + "_" + str(y-1), "t_" + str(x) + "_" + str(y), "steel", "tube")
+
+	Analysis._prepare_model(model)
+	return model
+
+def lil_path(K, D1_indices, D2_indices):
+	"""
+	The former path: convert to lil, partition and convert back to csr.
+	"""
+	K = K.tolil()
+	K11 = K[D1_indices, :][:, D1_indices].tocsr()
+	K12 = K[D1_indices, :][:, D2_indices].tocsr()
+	K21 = K[D2_indices, :][:, D1_indices].tocsr()
+	K22 = K[D2_indices, :][:, D2_indices].tocsr()
+	return K11, K12, K21, K22
+
+def measure(function, repeat=3):
+	"""
+	Run the function several times.
+	:return: Returns the fastest time in seconds and the last result.
+	"""
+	best = None
+	for i in range(repeat):
+		start = perf_counter()
+		result = function()
+		elapsed = perf_counter() - start
+		if best is None or elapsed < best:
+			best = elapsed
+	return best, result
+
+if __name__ == "__main__":
+	n = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+	model = grid_frame(n)
+	D1_indices, D2_indices, D2 = Analysis._partition_D(model)
+	K = model.K(check_stability=False)
+	print("degrees of freedom:", K.shape[0], "| unknown:", len(D1_indices))
+
+	t_lil, reference = measure(lambda: lil_path(K, D1_indices, D2_indices))
+	t_csr, compressed = measure(lambda: Analysis._partition(model, K, D1_indices, D2_indices))
+
+	# the first call builds the pattern, the following calls are refilling it
+	SparsePattern._cache.clear()
+	t_build, _ = measure(lambda: SparsePattern.get(K, D1_indices), repeat=1)
+	pattern = SparsePattern.get(K, D1_indices)
+	t_refill, refilled = measure(lambda: pattern.partition(K))
+
+	for a, b, c in zip(reference, compressed, refilled):
+		assert np_abs(a - b).max() < 1e-9 and np_abs(a - c).max() < 1e-9
+
+	print("lil partition:          {:8.4f} s".format(t_lil))
+	print("csr/csc partition:      {:8.4f} s".format(t_csr))
+	print("pattern build:          {:8.4f} s".format(t_build))
+	print("pattern refill:         {:8.4f} s".format(t_refill))
@@ -252,6 +252,49 @@ class phaenotyp_properties(PropertyGroup):
 			default = True
 		)
 
+		solver: EnumProperty(
+			name = "solver",
+			description = "Sparse solver for the stiffness matrix",
+			items = [
+					("superlu", "SuperLU (choose this if unsure)", "Sparse LU decomposition of scipy"),
+					("cholmod", "Cholesky", "Sparse Cholesky decomposition, needs scikit-sparse"),
+					("cg", "Conjugate gradient", "Preconditioned conjugate gradient, for very large structures. Checking for mechanisms needs a direct factorization as well"),
+					("auto", "Auto", "Time the available solvers once and take the fastest one")
+					],
+			default = "superlu"
+			)
+
+		permc_spec: EnumProperty(
+			name = "permc_spec",
+			description = "Fill-reducing ordering of SuperLU",
+			items = [
+					("MMD_AT_PLUS_A", "Minimum degree (choose this if unsure)", "Symmetric ordering, is reused for the following frames"),
+					("COLAMD", "COLAMD", "Approximate minimum degree of the columns"),
+					("MMD_ATA", "Minimum degree of AT*A", ""),
+					("NATURAL", "Natural", "No reordering")
+					],
+			default = "MMD_AT_PLUS_A"
+			)
+
+		pdelta_solver: EnumProperty(
+			name = "pdelta_solver",
+			description = "Solver for the geometric stiffness of second order",
+			items = [
+					("gmres", "GMRES (choose this if unsure)", "Iterative, preconditioned with the factorized elastic stiffness"),
+					("cg", "Conjugate gradient", "Iterative, for symmetric stiffness only"),
+					("direct", "Direct", "Factorize the whole stiffness in every iteration")
+					],
+			default = "gmres"
+			)
+
+		pdelta_tol: IntProperty(
+			name = "pdelta_tol",
+			description = "Relative residual of the iterative solver as power of ten",
+			default = -8,
+			min = -14,
+			max = -2
+			)
+
 		calculation_type: EnumProperty(
 			name = "calculation_type",
 			description = "Calculation types",
@@ -2583,6 +2626,14 @@ def undo(scene):
 			operators.reset()
 			bpy.ops.ed.undo_push()
 
+@persistent
+def load(dummy):
+	'''
+	Is stopping mp and freeing the template of PyNite if a file is opened.
+	The template belongs to the structure of the file that was open before.
+	'''
+	calculation.stop_daemon()
+
 def register():
 	'''
 	Register all blender specific stuff.
@@ -2594,6 +2645,7 @@ def register():
 	bpy.types.Scene.phaenotyp = PointerProperty(type=phaenotyp_properties)
 	bpy.app.handlers.frame_change_post.append(update_post)
 	bpy.app.handlers.undo_pre.append(undo)
+	bpy.app.handlers.load_post.append(load)
 	
 	# handle lists in panel
 	# based on code by sinestesia and support by Gorgious
@@ -2637,6 +2689,7 @@ def unregister():
 	del bpy.types.Scene.phaenotyp
 	bpy.app.handlers.frame_change_post.remove(update_post)
 	bpy.app.handlers.undo_pre.remove(undo)
+	bpy.app.handlers.load_post.remove(load)
 	
 	# handle lists in panel
 	# based on code by sinestesia and support by Gorgious
@@ -2658,6 +2711,9 @@ def unregister():
 	bpy.utils.unregister_class(LIST_OT_delete_item)
 	bpy.utils.unregister_class(LIST_OT_move_item)
 	
+	# stop the solver if running
+	calculation.stop_daemon()
+	
 	# for jobs
 	bpy.utils.unregister_class(phaenotyp_jobs)
 	
@@ -97,6 +97,7 @@ def create_data():
 		"nodes": {},
 		"members": {},
 		"quads": {},
+		"topology": {},
 		"frames": {},
 		"loads_v": {},
 		"loads_e": {},
@@ -9,15 +9,29 @@ sys.path.append(path_addons)
 from Pynite import FEModel3D
 from Pynite.Section import Section
 
-from numpy import array, empty, append, poly1d, polyfit, linalg, zeros, intersect1d, arctan, sin, cos
-from phaenotyp import basics, material, geometry
-from math import sqrt, tanh, pi, degrees, radians, atan2
+from numpy import array, linalg, zeros, intersect1d
+import numpy as np
+from phaenotyp import basics, material, geometry, mp
+from math import sqrt, tanh, pi, atan2, isnan
 
 from subprocess import Popen, PIPE
 import pickle
+import json
 import gc
 gc.disable()
 
+# persistent process of mp.py, started with the first run_mp
+daemon = None
+
+# location of the models of the running batch, None if no batch is running
+batch_location = None
+
+# pickled template of the structure for PyNite and its location for mp
+template = None
+
+# the template is only created again if the structure was changed
+template_changed = True
+
 def check_scipy():
 	"""
 	Checking if scipy is available and is setting the value to data.
@@ -50,10 +64,158 @@ def replace_data(entry):
 	data[key] = {}
 	data[key] = value
 
+def template_pn():
+	'''
+	Is creating the model of the structure for PyNite without the values of
+	the frames. Nodes are placed at zero, sections, angles and thickness are
+	zero and no loads are added. The values are passed as patch of each
+	frame from prepare_fea_pn.
+	:return model: FEModel3D function of PyNite
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+
+	supports = data["supports"]
+	members = data["members"]
+	quads = data["quads"]
+
+	# index of the topology, created when members or quads are set
+	topology = data.get("topology")
+	if not topology:
+		topology = geometry.topology(data["structure"], members, quads)
+		data["topology"] = topology
+
+	model = FEModel3D()
+
+	for mat in material.library:
+		name = mat[0]
+		E = mat[2]
+		G = mat[3]
+		nu = None # replace later
+		rho = None # replace later
+		model.add_material(name, E, G, nu, rho)
+
+	# add nodes only if needed for the model
+	for vertex_id in topology["nodes"]:
+		model.add_node(str(vertex_id), 0, 0, 0)
+
+	# define support
+	for id, support in supports.items():
+		# flip z und y
+		model.def_support(id, support[0], support[2], support[1], support[3], support[5], support[4])
+
+	# create members
+	for id, member in members.items():
+		node_0 = str(member["vertex_0_id"])
+		node_1 = str(member["vertex_1_id"])
+
+		if member["member_type"] == "full":
+			tension_only = False
+			comp_only = False
+
+		if member["member_type"] == "tension_only":
+			tension_only = True
+			comp_only = False
+
+		if member["member_type"] == "comp_only":
+			tension_only = False
+			comp_only = True
+
+		# create a section for every member
+		# the id is similar to the member id
+		section = Section(model, id, A=0, Iy=0, Iz=0, J=0)
+		model.sections[id] = section
+
+		model.add_member(
+			id,	node_0, node_1,
+			member["material_name"], id,
+			0,
+			tension_only=tension_only,
+			comp_only=comp_only
+		)
+
+		# release Moments
+		if phaenotyp.type_of_joints == "release_moments":
+			model.def_releases(id,
+				False, False, False, False, True, True,
+				False, False, False, False, True, True)
+
+	# create quads
+	for id, quad in quads.items():
+		E = quad["E"]
+		G = quad["G"]
+		nu = quad["nu"]
+		rho = quad["rho"]
+
+		# unique name of the material trough parameters
+		material_name = (
+			"material_" +
+			"E" + "_" +
+			"G" + "_" +
+			"nu" +  "_" +
+			"rho")
+
+		if material_name not in model.materials:
+			model.add_material(material_name, E, G, nu, rho)
+
+		vertex_ids = quad["vertices_ids_structure"]
+
+		v_0 = str(vertex_ids[0])
+		v_1 = str(vertex_ids[1])
+		v_2 = str(vertex_ids[2])
+		v_3 = str(vertex_ids[3])
+
+		model.add_quad(id, v_0, v_1, v_2, v_3, 0, material_name, kx_mod=1.0, ky_mod=1.0)
+
+	return model
+
+def pass_template_pn():
+	'''
+	Is passing the template of the structure to mp. The template is only
+	created again if the structure was changed since the last batch,
+	otherwise the workers keep using the one they have read allready.
+	:return location: Location of the template from mp.write_bytes.
+	'''
+	global template, template_changed
+
+	if template is None or template_changed:
+		pickled = pickle.dumps(template_pn(), protocol=pickle.HIGHEST_PROTOCOL)
+
+		if template is None or template[0] != pickled:
+			release_template()
+			template = [pickled, mp.write_bytes(pickled, mp.unique_name())]
+
+		template_changed = False
+
+	return template[1]
+
+def invalidate_template():
+	'''
+	Is creating the template again with the next batch.
+	Is called if supports, members or quads are set and with reset.
+	'''
+	global template_changed
+
+	template_changed = True
+
+def release_template():
+	'''
+	Is freeing the template passed to mp.
+	'''
+	global template
+
+	if template is not None:
+		mp.release_payload(template[1])
+		template = None
+
 def prepare_fea_pn(frame):
 	'''
 	Is preparing the calculaton of the current frame for for PyNite.
-	:return model: FEModel3D function of PyNite
+	Only the values of the frame are collected, the model is created
+	by mp from the template of template_pn.
+	:return patch: Dict with coordinates of the nodes, sections and angles
+	of the members, thickness of the quads and all loads of the frame.
 	'''
 	scene = bpy.context.scene
 	phaenotyp = scene.phaenotyp
@@ -67,25 +229,32 @@ def prepare_fea_pn(frame):
 	loads_e = data["loads_e"]
 	loads_f = data["loads_f"]
 
+	# index of the topology, created when members or quads are set
+	topology = data.get("topology")
+	if not topology:
+		topology = geometry.topology(data["structure"], members, quads)
+		data["topology"] = topology
+
+	edges_ids = topology["edges"]
+
 	bpy.context.scene.frame_current = frame
-	bpy.context.view_layer.update()
 
 	geometry.update_geometry_pre()
 
-	model = FEModel3D()
 	basics.timer.start()
 
 	psf_members = phaenotyp.psf_members
 	psf_quads = phaenotyp.psf_quads
 	psf_loads = phaenotyp.psf_loads
 
-	for mat in material.library:
-		name = mat[0]
-		E = mat[2]
-		G = mat[3]
-		nu = None # replace later
-		rho = None # replace later
-		model.add_material(name, E, G, nu, rho)
+	# values of the frame in the order of the template
+	sections = []
+	angles = []
+	thickness = []
+
+	# loads as arguments of add_node_load and add_member_dist_load
+	node_loads = []
+	member_loads = []
 
 	# apply chromosome if available
 	individuals = data.get("individuals")
@@ -95,14 +264,7 @@ def prepare_fea_pn(frame):
 		geometry.set_shape_keys(shape_keys, chromosome)
 
 	# get absolute position of vertex (when using shape-keys, animation et cetera)
-	dg = bpy.context.evaluated_depsgraph_get()
-	obj = data["structure"].evaluated_get(dg)
-
-	mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
-
-	vertices = mesh.vertices
-	edges = mesh.edges
-	faces = mesh.polygons
+	positions, faces = geometry.vertex_positions(data["structure"])
 
 	# to be collected:
 	data["frames"][str(frame)] = {}
@@ -114,107 +276,35 @@ def prepare_fea_pn(frame):
 	frame_span = 0
 	frame_cantilever = 0
 
-	# like suggested here by Gorgious and CodeManX:
-	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-	mat = obj.matrix_world
-
-	# add nodes from vertices
-	for vertex in vertices:
-		vertex_id = vertex.index
-		name = str(vertex_id)
-
-		# like suggested here by Gorgious and CodeManX:
-		# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-		v = mat @ vertex.co
-
-		# apply to all vertices to work for edges and faces also
-		vertex.co = v
-		
-		# flip z und y
-		x = v[0] * 100 # convert to cm for calculation
-		y = v[2] * 100 # convert to cm for calculation
-		z = v[1] * 100 # convert to cm for calculation
-
-		# only create Node if needed for the model
-		create = False
-		for member_id, member in members.items():
-			if vertex_id in [member["vertex_0_id"], member["vertex_1_id"]]:
-				create = True
-				break
+	# flip z und y and convert to cm for calculation
+	points = (positions[:, [0, 2, 1]] * 100).tolist()
 
-		for quad_id, quad in quads.items():
-			if vertex_id in quad["vertices_ids_structure"]:
-				create = True
-				break
-
-		if create:
-			model.add_node(name, x,y,z)
-
-	# define support
-	for id, support in supports.items():
-		# flip z und y
-		model.def_support(id, support[0], support[2], support[1], support[3], support[5], support[4])
+	# nodes only if needed for the model
+	nodes = [points[vertex_id] for vertex_id in topology["nodes"]]
 
 	# create members
 	for id, member in members.items():
 		vertex_0_id = member["vertex_0_id"]
 		vertex_1_id = member["vertex_1_id"]
 
-		v_0 = vertices[vertex_0_id].co
-		v_1 = vertices[vertex_1_id].co
+		v_0 = positions[vertex_0_id]
+		v_1 = positions[vertex_1_id]
 
 		# save initial_positions to mix with deflection
 		initial_positions = []
 		for i in range(11):
 			position = (v_0*(i) + v_1*(10-i))*0.1
-			x = position[0]
-			y = position[1]
-			z = position[2]
-			initial_positions.append([x,y,z])
+			initial_positions.append(position.tolist())
 		member["initial_positions"][str(frame)] = initial_positions
 
-		node_0 = str(vertex_0_id)
-		node_1 = str(vertex_1_id)
-		material_name = member["material_name"]
-
-		if member["member_type"] == "full":
-			tension_only = False
-			comp_only = False
-
-		if member["member_type"] == "tension_only":
-			tension_only = True
-			comp_only = False
-
-		if member["member_type"] == "comp_only":
-			tension_only = False
-			comp_only = True
-
-		# create a section for every member
-		# the id is similar to the member id
-		section = Section(
-			model, id,
-			A = member["A"][str(frame)],
-			Iz = member["Iy"][str(frame)], # flip x und y
-			Iy = member["Iz"][str(frame)], # flip x und y
-			J = member["J"][str(frame)])
-
-		model.sections[id] = section
-		
-		angle = member["angle"][str(frame)]
-				 
-		model.add_member(
-			id,	node_0, node_1,
-			member["material_name"], id,
-			angle,
-			tension_only=tension_only,
-			comp_only=comp_only
-		)
+		# section of the member as A, Iy, Iz and J
+		sections.append((
+			member["A"][str(frame)],
+			member["Iz"][str(frame)], # flip x und y
+			member["Iy"][str(frame)], # flip x und y
+			member["J"][str(frame)]))
 
-		# release Moments
-		if phaenotyp.type_of_joints == "release_moments":
-			model.def_releases(id,
-				False, False, False, False, True, True,
-				False, False, False, False, True, True)
+		angles.append(member["angle"][str(frame)])
 
 		# add self weight
 		weight_A = member["weight_A"][str(frame)]
@@ -222,10 +312,10 @@ def prepare_fea_pn(frame):
 
 		# add self weight as distributed load
 		# flip z und y
-		model.add_member_dist_load(id, "FY", kN*psf_members, kN*psf_members)
+		member_loads.append((id, "FY", kN*psf_members, kN*psf_members))
 
 		# calculate lenght of parts (maybe usefull later ...)
-		length = (v_0 - v_1).length
+		length = float(linalg.norm(v_0 - v_1))
 		frame_length += length
 
 		# calculate and add weight to overall weight of structure
@@ -238,41 +328,16 @@ def prepare_fea_pn(frame):
 
 	# create quads
 	for id, quad in quads.items():
-		E = quad["E"]
-		G = quad["G"]
-		nu = quad["nu"]
 		rho = quad["rho"]
 
-		# unique name of the material trough parameters
-		material_name = (
-			"material_" +
-			"E" + "_" +
-			"G" + "_" +
-			"nu" +  "_" +
-			"rho")
-
-		if material_name not in model.materials:
-			model.add_material(material_name, E, G, nu, rho)
-
 		vertex_ids = quad["vertices_ids_structure"]
 
 		# get thickness of frame or first
 		t = quad["thickness"].get(str(frame))
-
-		v_0 = str(vertex_ids[0])
-		v_1 = str(vertex_ids[1])
-		v_2 = str(vertex_ids[2])
-		v_3 = str(vertex_ids[3])
-
-		model.add_quad(id, v_0, v_1, v_2, v_3, t, material_name, kx_mod=1.0, ky_mod=1.0)
+		thickness.append(t)
 
 		# save position before to morph with deflection afterwards
-		initial_positions = [
-			vertices[vertex_ids[0]].co,
-			vertices[vertex_ids[1]].co,
-			vertices[vertex_ids[2]].co,
-			vertices[vertex_ids[3]].co,
-			]
+		initial_positions = positions[list(vertex_ids)].tolist()
 		quad["initial_positions"][str(frame)] = initial_positions
 
 		# self weight
@@ -285,7 +350,7 @@ def prepare_fea_pn(frame):
 			# area * thickness * density * 0.25 (to distribute to all four faces) - for gravity
 			z = weight * (-0.25)
 			# flip z und y
-			model.add_node_load(vertex_id, 'FY', z * 0.00000981 * psf_quads) # to cm and force
+			node_loads.append((vertex_id, 'FY', z * 0.00000981 * psf_quads)) # to cm and force
 
 		quad["area"][str(frame)] = area # in m²
 		quad["weight_A"][str(frame)] = t * weight_A
@@ -296,25 +361,25 @@ def prepare_fea_pn(frame):
 	# add loads
 	for id, load in loads_v.items():
 		# flip z und y
-		model.add_node_load(id, 'FX', load[0] * psf_loads)
-		model.add_node_load(id, 'FY', load[2] * psf_loads)
-		model.add_node_load(id, 'FZ', load[1] * psf_loads)
+		node_loads.append((id, 'FX', load[0] * psf_loads))
+		node_loads.append((id, 'FY', load[2] * psf_loads))
+		node_loads.append((id, 'FZ', load[1] * psf_loads))
 		
 		# flip z und y
-		model.add_node_load(id, 'MX', load[3] * psf_loads)
-		model.add_node_load(id, 'MY', load[5] * psf_loads)
-		model.add_node_load(id, 'MZ', load[4] * psf_loads)
+		node_loads.append((id, 'MX', load[3] * psf_loads))
+		node_loads.append((id, 'MY', load[5] * psf_loads))
+		node_loads.append((id, 'MZ', load[4] * psf_loads))
 
 	for id, load in loads_e.items():
 		# flip z und y
-		model.add_member_dist_load(id, 'FX', load[0]*0.01 * psf_loads, load[0]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'FY', load[2]*0.01 * psf_loads, load[2]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'FZ', load[1]*0.01 * psf_loads, load[1]*0.01 * psf_loads) # m to cm
+		member_loads.append((id, 'FX', load[0]*0.01 * psf_loads, load[0]*0.01 * psf_loads)) # m to cm
+		member_loads.append((id, 'FY', load[2]*0.01 * psf_loads, load[2]*0.01 * psf_loads)) # m to cm
+		member_loads.append((id, 'FZ', load[1]*0.01 * psf_loads, load[1]*0.01 * psf_loads)) # m to cm
 		
 		# flip z und y
-		model.add_member_dist_load(id, 'Fx', load[3]*0.01 * psf_loads, load[3]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'Fy', load[5]*0.01 * psf_loads, load[5]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'Fz', load[4]*0.01 * psf_loads, load[4]*0.01 * psf_loads) # m to cm
+		member_loads.append((id, 'Fx', load[3]*0.01 * psf_loads, load[3]*0.01 * psf_loads)) # m to cm
+		member_loads.append((id, 'Fy', load[5]*0.01 * psf_loads, load[5]*0.01 * psf_loads)) # m to cm
+		member_loads.append((id, 'Fz', load[4]*0.01 * psf_loads, load[4]*0.01 * psf_loads)) # m to cm
 
 	for id, load in loads_f.items():
 		# apply force to quad if a quad is available
@@ -331,7 +396,7 @@ def prepare_fea_pn(frame):
 			load_projected = load[1]
 			load_area_z = load[2]
 
-			area_projected = geometry.area_projected(face, vertices)
+			area_projected = geometry.area_projected(face, positions)
 
 			# a quad is available to apply forces to
 			for vertex_id in quads[id]["vertices_ids_structure"]:
@@ -353,9 +418,9 @@ def prepare_fea_pn(frame):
 				z += area_load * 0.25 # divided by four points of each quad
 				
 				# flip z und y
-				model.add_node_load(vertex_id, 'FX', x * psf_loads) # to cm
-				model.add_node_load(vertex_id, 'FY', z * psf_loads) # to cm
-				model.add_node_load(vertex_id, 'FZ', y * psf_loads) # to cm
+				node_loads.append((vertex_id, 'FX', x * psf_loads)) # to cm
+				node_loads.append((vertex_id, 'FY', z * psf_loads)) # to cm
+				node_loads.append((vertex_id, 'FZ', y * psf_loads)) # to cm
 
 		# apply force to members
 		else:
@@ -370,9 +435,9 @@ def prepare_fea_pn(frame):
 			load_projected = load[1]
 			load_area_z = load[2]
 
-			area_projected = geometry.area_projected(face, vertices)
+			area_projected = geometry.area_projected(face, positions)
 
-			distances, perimeter = geometry.perimeter(edge_keys, vertices)
+			distances, perimeter = geometry.perimeter(edge_keys, positions)
 
 			# define loads for each edge
 			edge_load_normal = []
@@ -399,11 +464,7 @@ def prepare_fea_pn(frame):
 			# i is the id within the class (0, 1, 3 and maybe more)
 			# edge_id is the id of the edge in the mesh -> the member
 			for i, edge_key in enumerate(edge_keys):
-				# get name <---------------------------------------- maybe better method?
-				for edge in edges:
-					if edge.vertices[0] in edge_key:
-						if edge.vertices[1] in edge_key:
-							name = str(edge.index)
+				name = str(edges_ids[str(edge_key[0]) + "_" + str(edge_key[1])])
 
 				# edge_load_normal <--------------------------------- to be tested / checked
 				x = edge_load_normal[i] * normal[0]
@@ -411,36 +472,45 @@ def prepare_fea_pn(frame):
 				z = edge_load_normal[i] * normal[2]
 				
 				# flip z und y
-				model.add_member_dist_load(name, 'FX', x, x)
-				model.add_member_dist_load(name, 'FY', z, z)
-				model.add_member_dist_load(name, 'FZ', y, y)
+				member_loads.append((name, 'FX', x, x))
+				member_loads.append((name, 'FY', z, z))
+				member_loads.append((name, 'FZ', y, y))
 
 				# edge_load_projected
 				z = edge_load_projected[i]
 				# flip z und y
-				model.add_member_dist_load(name, 'FY', z, z)
+				member_loads.append((name, 'FY', z, z))
 
 				# edge_load_area_z
 				z = edge_load_area_z[i]
 				# flip z und y
-				model.add_member_dist_load(name, 'FY', z, z)
+				member_loads.append((name, 'FY', z, z))
 
 	# store frame based data
-	data["frames"][str(frame)]["volume"] = geometry.volume(mesh)
-	data["frames"][str(frame)]["area"] = geometry.area(faces)
+	data["frames"][str(frame)]["volume"] = geometry.volume(positions, faces)
+	data["frames"][str(frame)]["area"] = geometry.area_of_faces(positions, faces)
 	data["frames"][str(frame)]["length"] = frame_length
 	data["frames"][str(frame)]["weight"] = frame_weight
-	data["frames"][str(frame)]["rise"] = geometry.rise(vertices)
-	data["frames"][str(frame)]["span"] = geometry.span(vertices, supports)
-	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(vertices, supports)
+	data["frames"][str(frame)]["rise"] = geometry.rise(positions)
+	data["frames"][str(frame)]["span"] = geometry.span(positions, supports)
+	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(positions, supports)
 
 	# get duration
 	text = calculation_type + " preparation for frame " + str(frame) + " done"
 	text +=  basics.timer.stop()
 	basics.print_data(text)
 
-	# created a model object of PyNite and add to dict
-	basics.models[frame] = model
+	# values to create the model of PyNite from the template
+	patch = {
+		"nodes": nodes,
+		"sections": sections,
+		"angles": angles,
+		"thickness": thickness,
+		"node_loads": node_loads,
+		"member_loads": member_loads
+		}
+
+	basics.models[frame] = patch
 
 def prepare_fea_fd(frame):
 	'''
@@ -453,7 +523,6 @@ def prepare_fea_fd(frame):
 	data = scene["<Phaenotyp>"]
 
 	bpy.context.scene.frame_current = frame
-	bpy.context.view_layer.update()
 
 	geometry.update_geometry_pre()
 
@@ -462,6 +531,14 @@ def prepare_fea_fd(frame):
 	psf_members = phaenotyp.psf_members
 	psf_loads = phaenotyp.psf_loads
 
+	# index of the topology, created when members are set
+	topology = data.get("topology")
+	if not topology:
+		topology = geometry.topology(data["structure"], data["members"], data["quads"])
+		data["topology"] = topology
+
+	edges_ids = topology["edges"]
+
 	# apply chromosome if available
 	individuals = data.get("individuals")
 	if individuals:
@@ -470,14 +547,7 @@ def prepare_fea_fd(frame):
 		geometry.set_shape_keys(shape_keys, chromosome)
 
 	# get absolute position of vertex (when using shape-keys, animation et cetera)
-	dg = bpy.context.evaluated_depsgraph_get()
-	obj = data["structure"].evaluated_get(dg)
-
-	mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
-
-	vertices = mesh.vertices
-	edges = mesh.edges
-	faces = mesh.polygons
+	positions, faces = geometry.vertex_positions(data["structure"])
 
 	# to be collected:
 	data["frames"][str(frame)] = {}
@@ -491,31 +561,11 @@ def prepare_fea_fd(frame):
 
 	# to sum up loads
 	forces = []
-	for i in range(len(vertices)):
+	for i in range(len(positions)):
 		forces.append(array([0.0, 0.0, 0.0]))
 
-	# like suggested here by Gorgious and CodeManX:
-	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-	mat = obj.matrix_world
-
 	# add nodes from vertices
-	points = []
-	for vertex in vertices:
-		# like suggested here by Gorgious and CodeManX:
-		# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-		v = mat @ vertex.co
-
-		# apply to all vertices to work for edges and faces also
-		vertex.co = v
-
-		x = v[0] * 100 # convert to cm for calculation
-		y = v[1] * 100 # convert to cm for calculation
-		z = v[2] * 100 # convert to cm for calculation
-
-		pos = [x,y,z]
-		points.append(pos)
-
-	points_array = array(points)
+	points_array = positions * 100 # convert to cm for calculation
 
 	# define support
 	fixed = []
@@ -537,16 +587,11 @@ def prepare_fea_fd(frame):
 		key = [vertex_0_id, vertex_1_id]
 		keys.append(key)
 
-		v_0 = vertices[vertex_0_id].co
-		v_1 = vertices[vertex_1_id].co
+		v_0 = positions[vertex_0_id]
+		v_1 = positions[vertex_1_id]
 
 		# save initial_positions to mix with deflection
-		initial_positions = []
-		for position in [v_0, v_1]:
-			x = position[0]
-			y = position[1]
-			z = position[2]
-			initial_positions.append([x,y,z])
+		initial_positions = [v_0.tolist(), v_1.tolist()]
 		member["initial_positions"][str(frame)] = initial_positions
 
 		# add self weight
@@ -554,7 +599,7 @@ def prepare_fea_fd(frame):
 		kN = weight_A * -0.0000981
 
 		# calculate lenght of parts (maybe usefull later ...)
-		length = (v_0 - v_1).length
+		length = float(linalg.norm(v_0 - v_1))
 		frame_length += length
 
 		# calculate and add weight to overall weight of structure
@@ -603,8 +648,8 @@ def prepare_fea_fd(frame):
 		load_projected = load[1]
 		load_area_z = load[2]
 
-		area_projected = geometry.area_projected(face, vertices)
-		distances, perimeter = geometry.perimeter(edge_keys, vertices)
+		area_projected = geometry.area_projected(face, positions)
+		distances, perimeter = geometry.perimeter(edge_keys, positions)
 
 		# define loads for each edge
 		edge_load_normal = []
@@ -631,10 +676,7 @@ def prepare_fea_fd(frame):
 		# i is the id within the class (0, 1, 3 and maybe more)
 		# edge_id is the id of the edge in the mesh -> the member
 		for i, edge_key in enumerate(edge_keys):
-			for edge in edges:
-				if edge.vertices[0] in edge_key:
-					if edge.vertices[1] in edge_key:
-						id = edge.index
+			id = edges_ids[str(edge_key[0]) + "_" + str(edge_key[1])]
 
 			x = edge_load_normal[i] * normal[0]
 			y = edge_load_normal[i] * normal[1]
@@ -673,13 +715,13 @@ def prepare_fea_fd(frame):
 	forces_array = array(forces)
 
 	# store frame based data
-	data["frames"][str(frame)]["volume"] = geometry.volume(mesh)
-	data["frames"][str(frame)]["area"] = geometry.area(faces)
+	data["frames"][str(frame)]["volume"] = geometry.volume(positions, faces)
+	data["frames"][str(frame)]["area"] = geometry.area_of_faces(positions, faces)
 	data["frames"][str(frame)]["length"] = frame_length
 	data["frames"][str(frame)]["weight"] = frame_weight
-	data["frames"][str(frame)]["rise"] = geometry.rise(vertices)
-	data["frames"][str(frame)]["span"] = geometry.span(vertices, supports)
-	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(vertices, supports)
+	data["frames"][str(frame)]["rise"] = geometry.rise(positions)
+	data["frames"][str(frame)]["span"] = geometry.span(positions, supports)
+	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(positions, supports)
 
 	# get duration
 	text = calculation_type + " preparation for frame " + str(frame) + " done"
@@ -690,1362 +732,654 @@ def prepare_fea_fd(frame):
 	model = [points_array, supports_ids, edges_array, forces_array]
 	basics.models[str(frame)] = model
 
-def run_mp(models):
+def start_daemon():
 	'''
-	Is calculating the given models, pickles them for mp.
-	:param models: Needs a list of models from any prepare_fea as dict with frame as key.
-	:return models: Returns the calculated models as dict with the frame as key.
+	Is starting mp.py as long living process with a pool of workers.
+	The process is kept alive to avoid the startup of python, the import
+	of PyNite and the creation of the pool for every generation or step.
+	:return daemon: Returns the running process.
 	'''
-	# get pathes
+	global daemon
+
+	# reuse the running process
+	if daemon is not None and daemon.poll() is None:
+		return daemon
+
 	path_addons = os.path.dirname(__file__) # path to the folder of addons
 	path_script = path_addons + "/mp.py"
 	path_python = sys.executable # path to bundled python
-	path_blend = bpy.data.filepath # path to stored blender file
-	directory_blend = os.path.dirname(path_blend) # directory of blender file
-	name_blend = bpy.path.basename(path_blend) # name of file
 
-	# pickle models to file
-	path_export = directory_blend + "/Phaenotyp-export_mp.p"
-	export_models = open(path_export, 'wb')
-	pickle.dump(models, export_models)
-	export_models.close()
+	task = [path_python, path_script]
+	daemon = Popen(task, stdin=PIPE, stdout=PIPE, bufsize=1, universal_newlines=True)
+	basics.print_data("mp daemon started")
 
-	# scipy_available to pass forward
-	if bpy.context.scene["<Phaenotyp>"]["scipy_available"]:
-		scipy_available = "True" # as string
-	else:
-		scipy_available = "False" # as string
-
-	# calculation_type
-	scene = bpy.context.scene
-	phaenotyp = scene.phaenotyp
-	calculation_type = phaenotyp.calculation_type
-
-	task = [path_python, path_script, directory_blend, scipy_available, calculation_type]
-	# feedback from python like suggested from Markus Amalthea Magnuson and user3759376 here
-	# https://stackoverflow.com/questions/4417546/constantly-print-subprocess-output-while-process-is-running
-	p = Popen(task, stdout=PIPE, bufsize=1)
-	lines_iterator = iter(p.stdout.readline, b"")
-	while p.poll() is None:
-		for line in lines_iterator:
-			nline = line.rstrip()
-			#print(nline.decode("utf8"), end = "\r\n",flush =True) # yield line
+	return daemon
 
-	# get models back from mp
-	path_import = directory_blend + "/Phaenotyp-return_mp.p"
-	file = open(path_import, 'rb')
-	imported_models = pickle.load(file)
-	file.close()
-
-	basics.feas = imported_models
-
-def interweave_results_pn(frame):
+def stop_daemon():
 	'''
-	Function to integrate the results of PyNite.
-	:param feas: Feas as dict with frame as key.
-	:param members: Pass the members from <Phaenotyp>
+	Is stopping the process of mp.py if running.
 	'''
-	scene = bpy.context.scene
-	data = scene["<Phaenotyp>"]
-	phaenotyp = scene.phaenotyp
-	calculation_type = phaenotyp.calculation_type
-	members = data["members"]
-	quads = data["quads"]
+	global daemon, batch_location
 
-	frame = str(frame)
-	model = basics.feas[frame]
-	basics.timer.start()
-
-	for id in members:
-		member = members[id]
-		model_member = model.members[id]
+	# free the models of an unfinished batch
+	if batch_location is not None:
+		mp.release_payload(batch_location)
+		batch_location = None
 
-		L = model_member.L() # Member length
-		T = model_member.T() # Member local transformation matrix
+	# the workers reading the template are stopped as well
+	release_template()
 
-		axial = []
-		moment_y = []
-		moment_z = []
-		shear_y = []
-		shear_z = []
-		torque = []
-
-		for i in range(11): # get the forces at 11 positions and
-			x = L/10*i
-
-			axial_pos = model_member.axial(x) * (-1) # Druckkraft minus
-			axial.append(axial_pos)
-			
-			# flip z und y
-			moment_y_pos = model_member.moment("Mz", x)
-			moment_y.append(moment_y_pos)
-			
-			# flip z und y
-			moment_z_pos = model_member.moment("My", x)
-			moment_z.append(moment_z_pos)
-			
-			# flip z und y
-			shear_y_pos = model_member.shear("Fz", x)
-			shear_y.append(shear_y_pos)
-			
-			# flip z und y
-			shear_z_pos = model_member.shear("Fy", x)
-			shear_z.append(shear_z_pos)
-
-			torque_pos = model_member.torque(x)
-			torque.append(torque_pos)
-
-		member["axial"][frame] = axial
-		member["moment_y"][frame] = moment_y
-		member["moment_z"][frame] = moment_z
-		member["shear_y"][frame] = shear_y
-		member["shear_z"][frame] = shear_z
-		member["torque"][frame] = torque
-		
-		# access variables once
-		profile_type = member["profile_type"]
-		height = member["height"][frame]
-		width = member["width"][frame]
-		wall_thickness = member["wall_thickness"][frame]
-		A = member["A"][frame]
-		J = member["J"][frame]
-		Do = member["height"][frame]
-		Iy = member["Iy"][frame]
-		Iz = member["Iz"][frame]
-		
-		if profile_type in ["round_hollow", "round_solid"]:
-			# buckling
-			member["ir_y"][frame] = sqrt(J/A) # für runde Querschnitte, in  cm
-			member["ir_z"][frame] = sqrt(J/A) # für runde Querschnitte, in  cm
-
-			# bucklng resolution
-			buckling_resolution = member["buckling_resolution"]
-
-			# modulus from the moments of area
-			# Wy and Wz are the same within a pipe
-			member["Wy"][frame] = member["Iy"][frame]/(Do/2)
-
-			# polar modulus of torsion
-			WJ = J/(Do/2)
-
-			# calculation of the longitudinal stresses
-			long_stress = []
-			for i in range(11): # get the stresses at 11 positions and
-				moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				if axial[i] > 0:
-					s = axial[i]/A + moment_h/member["Wy"][frame]
-				else:
-					s = axial[i]/A - moment_h/member["Wy"][frame]
-				long_stress.append(s)
-
-			# get max stress of the beam
-			# (can be positive or negative)
-			member["long_stress"][frame] = long_stress
-			member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-			# calculation of the shear stresses from shear force
-			# (always positive)
-			tau_shear = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				s_h = sqrt(shear_y[i]**2+shear_z[i]**2)
-				tau = 1.333 * s_h/A # for pipes
-				tau_shear.append(tau) # Schubspannung
-
-			# get max shear stress of shear force of the beam
-			# shear stress is mostly small compared to longitudinal
-			# in common architectural usage and only importand with short beam length
-			member["tau_shear_y"][frame] = tau_shear  # Schubspannung
-			member["tau_shear_z"][frame] = tau_shear
-			member["max_tau_shear_y"][frame] = max(tau_shear)  # max Schubspannung
-			member["max_tau_shear_z"][frame] = max(tau_shear)  # max Schubspannung
-
-			# Calculation of the torsion stresses
-			# (always positiv)
-			Do = height
-			if wall_thickness == None:	Di = 0
-			else: Di = Do - wall_thickness
-			
-			s = Do - Di # Wandstärke
-			Dm = (Do - Di) / 2  # mittlere Dicke
-			Wjd = 0.5 * pi * Dm * s  # Formel für dünnwandige Rohrquerschnitte nach Preussler
-
-			tau_torsion = []
-			if Di/Do < 0.85:  # für Vollquerschnitte wie gehabt, gilt auch für dickwandige Rohrquerschnitte
-				for i in range(11): # get the stresses at 11 positions and
-					tau = abs(torque[i]/WJ)
-					tau_torsion.append(tau)
-			
-			else: # für dünnwandige Hohlquerschnitte neue Formel
-				for i in range(11): # get the stresses at 11 positions and
-					tau = abs(torque[i]/Wjd)
-					tau_torsion.append(tau)
-
-			# get max torsion stress of the beam
-			member["tau_torsion"][frame] = tau_torsion  # Torsionsspannungen
-			member["max_tau_torsion"][frame] = max(tau_torsion)  # max Torsionsspannungen
-
-			# torsion stress is mostly small compared to longitudinal
-			# combine shear and torque
-			# (always positiv)
-			sum_tau = []  # Schub und Torsion überlagerbar
-			for i in range(11): # get the stresses at 11 positions and
-				tau = tau_shear[i] + tau_torsion[i]
-				sum_tau.append(tau)
-
-			member["sum_tau"][frame] = sum_tau
-			member["max_sum_tau"][frame] = max(sum_tau)
-
-			member["sigma"][frame] = member["long_stress"][frame]
-			member["max_sigma"][frame] = member["max_long_stress"][frame]
-
-			# overstress
-			member["overstress"][frame] = False
-
-			# check overstress and add 1.05 savety factor
-			safety_factor = 1.05
-			
-			# prüft nur y, da gleich wie z
-			if abs(member["max_tau_shear_y"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# buckling
-			if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-				member["lamda"][frame] = L*buckling_resolution*0.5/member["ir_y"][frame] # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-				if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-					kn = member["knick_model"]
-					function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-					member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-					if member["lamda"][frame] > 250: # Schlankheit zu schlank
-						member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-						member["overstress"][frame] = True
-					if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-						member["overstress"][frame] = True
-
-				else:
-					member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-
-			# without buckling
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-				member["lamda"][frame] = None # to avoid missing KeyError
-
-
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# lever_arm
-			lever_arm = []
-			moment_h = []
-			for i in range(11):
-				# moment_h
-				m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				moment_h.append(m_h)
-
-				# to avoid division by zero
-				if member["axial"][frame][i] < 0.1: # überprüfen ev kleiner
-					lv = m_h / 0.1
-				else:
-					lv = m_h / member["axial"][frame][i]
-
-				lv = abs(lv) # absolute highest value within member
-				lever_arm.append(lv)
-
-			member["moment_h"][frame] = moment_h
-			member["lever_arm"][frame] = lever_arm
-			member["max_lever_arm"][frame] = max(lever_arm)
-
-			# Ausnutzungsgrad
-			member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
-
-			# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-			normalkraft_energy=[]
-			moment_energy=[]
-			strain_energy = []
-
-			for i in range(10): # get the energie at 10 positions for 10 section
-				# Berechnung der strain_energy für Normalkraft
-				ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-				normalkraft_energy.append(ne)
-
-				# Berechnung der strain_energy für Moment
-				moment_hq = moment_y[i]**2 + moment_z[i]**2 # hier ist das quadrat
-				# me = (moment_hq * L/10) / (member["E"] * member["Wy"][frame] * Do) # meue Formel nun, noch überprüfen ob gleich (2 statt Do)
-				me = (moment_hq * L/10) / (member["E"] * member["Iy"][frame] * 2) # laut https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
-				moment_energy.append(me)
-
-				# Summe von Normalkraft und Moment-Verzerrunsenergie
-				value = ne + me
-				strain_energy.append(value)
-
-			member["strain_energy"][frame] = strain_energy
-			member["normal_energy"][frame] = normalkraft_energy
-			member["moment_energy"][frame] = moment_energy
-
-		if profile_type == "rect_hollow":			
-			# buckling
-			member["ir_y"][frame] = sqrt(Iy/A)
-			member["ir_z"][frame] = sqrt(Iz/A)
-			
-			# bucklng resolution
-			buckling_resolution = member["buckling_resolution"]
+	if daemon is None:
+		return
 
-			# modulus from the moments of area
+	if daemon.poll() is None:
+		try:
+			daemon.stdin.write(json.dumps(["quit"]) + "\n")
+			daemon.stdin.flush()
+			daemon.wait(timeout=10)
 
-			member["Wy"][frame] = member["Iy"][frame]/(height/2)
-			member["Wz"][frame] = member["Iz"][frame]/(width/2)
+		except Exception:
+			basics.log_exception("mp daemon not stopped, killing it")
+			daemon.kill()
 
-			# calculation of the longitudinal stresses
-			long_stress = []
-			for i in range(11): # get the stresses at 11 positions and
-				# moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				if axial[i] > 0:
-					s = axial[i]/A + abs(moment_y[i]/member["Wy"][frame]) + abs(moment_z[i]/member["Wz"][frame])
-				else:
-					s = axial[i]/A - abs(moment_y[i]/member["Wy"][frame]) - abs(moment_z[i]/member["Wz"][frame])
-				long_stress.append(s)
-
-			# get max stress of the beam
-			# (can be positive or negative)
-			member["long_stress"][frame] = long_stress
-			member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-			# calculation of the shear stresses from shear force
-			tau_shear_y = [] # nun zwei Scherspannungen
-			tau_shear_z = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				# in y Richrtung
-				s_y = member["shear_y"][frame][i]
-				s_z = member["shear_z"][frame][i]
-				
-				tau_y = abs(1.0 * s_y/A) # for hollow rectangle, maximale tritt in Mitte auf,
-				tau_shear_y.append(tau_y)
-				tau_z = abs( 1.0 * s_z/A) # for hollow rectangle, maximale tritt in Mitte auf wird maßgebend sein, ev die größere für Schubbemessun nehmen
-				tau_shear_z.append(tau_z)
-
-			# get max shear stress of shear force of the beam
-			# shear stress is mostly small compared to longitudinal, in common architectural usage and only importand with short beam lenght
-			member["tau_shear_y"][frame] = tau_shear_y  # jetzt x und z
-			member["tau_shear_z"][frame] = tau_shear_z # wird maßgebend sein
-			member["max_tau_shear_y"][frame] = max(tau_shear_y)
-			member["max_tau_shear_z"][frame] = max(tau_shear_z) # wird maßgebend sein, ev nur das größere ausweisen
-
-			# Calculation of the torsion stresses
-			tau_torsion = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				tau = abs(torque[i]/(2 * height-wall_thickness)*(width-wall_thickness))*wall_thickness  #### Formel nach Wandinger-Torsion, Trägheitsmoment nicht erforderlich, sondern direkt mit Am =mittlere Fläche und Wanddicke errechnet
-				# Torsionsspannung in senkrechten und horizontalen Steg gleich, daher nur tau und nicht tau_z und tau_y
-				# muss height und width und t noch übernommen werden?
-				tau_torsion.append(tau)
-
-			# get max torsion stress of the beam
-			member["tau_torsion"][frame] = tau_torsion
-			member["max_tau_torsion"][frame] = max(tau_torsion)
-
-			# calculation of the shear stresses from shear force and torsion
-			# (always positiv)
-			sum_tau = []  # Schub und Torsion überlagerbar
-			for i in range(11): # get the stresses at 11 positions and
-				tau = tau_shear_z[i] + tau_torsion[i] # nur Schub aus Qz und Torsionsspannung an der Längsseite überlagert, da maßgebden
-				sum_tau.append(tau)
-
-			member["sum_tau"][frame] = sum_tau
-			member["max_sum_tau"][frame] = max(sum_tau)
-			
-			# check out: http://www.bs-wiki.de/mediawiki/index.php?title=Festigkeitsberechnung
-			member["sigma"][frame] = member["long_stress"][frame]
-			member["max_sigma"][frame] = member["max_long_stress"][frame]
-
-			# overstress
-			member["overstress"][frame] = False
-
-			# check overstress and add 1.05 savety factor
-			safety_factor = 1.05
-			if abs(member["max_tau_shear_y"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_shear_z"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-				member["overstress"][frame] = True
-
-			# Ist das korrekt?
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# buckling
-			if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-				# hier als ir das kleinere von ir_z und ir_y nehmen
-				if member["ir_y"][frame] < member["ir_z"][frame]: ir = member["ir_y"][frame]
-				else: ir = member["ir_z"][frame]
-
-				member["lamda"][frame] = L*buckling_resolution*0.5/ir # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-				if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-					kn = member["knick_model"]
-					function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-					member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-					if member["lamda"][frame] > 250: # zu schlank
-						member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-						member["overstress"][frame] = True
-					if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-						member["overstress"][frame] = True
+	daemon = None
+	basics.print_data("mp daemon stopped")
 
-				else:
-					member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
+def run_mp(models):
+	'''
+	Is passing the given models to mp without waiting for the results.
+	The results are streamed back frame by frame and read with receive_results.
+	:param models: Needs a list of models from any prepare_fea as dict with frame as key.
+	'''
+	global batch_location
 
-			# without buckling
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-				member["lamda"][frame] = None # to avoid missing KeyError
-
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# lever_arm
-			lever_arm = []  # noch nicht überarbeitet
-			moment_h = []  # noch nicht überarbeitet
-			for i in range(11):
-				# moment_h
-				m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				moment_h.append(m_h)
-
-				# to avoid division by zero
-				if member["axial"][frame][i] < 0.1:
-					lv = m_h / 0.1
-				else:
-					lv = m_h / member["axial"][frame][i]
+	# finish the last batch if not read completely
+	receive_results()
+	basics.feas = {}
 
-				lv = abs(lv) # absolute highest value within member
-				lever_arm.append(lv)
+	# pass models via shared memory or temp file
+	# the name is unique to avoid conflicts between several instances of blender
+	location = mp.write_payload(models, mp.unique_name())
 
-			member["moment_h"][frame] = moment_h
-			member["lever_arm"][frame] = lever_arm
-			member["max_lever_arm"][frame] = max(lever_arm)
+	# scipy_available to pass forward
+	if bpy.context.scene["<Phaenotyp>"]["scipy_available"]:
+		scipy_available = "True" # as string
+	else:
+		scipy_available = "False" # as string
 
-			# Ausnutzungsgrad
-			member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
+	# calculation_type
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	calculation_type = phaenotyp.calculation_type
 
-			# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-			normalkraft_energy = []
-			moment_energy = []
-			strain_energy = []
+	# sparse solver and ordering of superlu
+	solver = phaenotyp.solver
+	permc_spec = phaenotyp.permc_spec
 
-			for i in range(10): # get the energie at 10 positions for 10 section
-				# Berechnung der strain_energy für Normalkraft
-				ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-				normalkraft_energy.append(ne)
+	# solver and tolerance for the geometric stiffness of second order
+	pdelta_solver = phaenotyp.pdelta_solver
+	pdelta_tol = 10.0 ** phaenotyp.pdelta_tol
 
-				# Berechnung der strain_energy für Moment
-				# moment_hq = moment_y[i]**2+moment_z[i]**2
-				moment_y = member["moment_y"][frame][i]
-				moment_z = member["moment_z"][frame][i]
-				me = (moment_y**2 * L/10) / (2 * member["E"] * member["Iy"][frame]) + (moment_z**2 * L/10) / (2 * member["E"] * member["Iz"][frame]) # KD 2025-09_26
-				#  nach https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
-				moment_energy.append(me)
+	# the models of PyNite are passed as patches of the template
+	if calculation_type != "force_distribution":
+		template_location = pass_template_pn()
+	else:
+		template_location = None
 
-				# Summe von Normalkraft und Moment-Verzerrunsenergie
-				value = ne + me
-				strain_energy.append(value)
+	# pass the batch to the running daemon
+	p = start_daemon()
+	command = ["run", location, scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template_location]
+	p.stdin.write(json.dumps(command) + "\n")
+	p.stdin.flush()
 
-			member["strain_energy"][frame] = strain_energy
-			member["normal_energy"][frame] = normalkraft_energy
-			member["moment_energy"][frame] = moment_energy
+	batch_location = location
 
-		if profile_type == "rect_solid":
-			# buckling
-			member["ir_y"][frame] = sqrt(Iy/A)
-			member["ir_z"][frame] = sqrt(Iz/A)
-			# bucklng resolution
-			buckling_resolution = member["buckling_resolution"]
+def receive_results(frame=None):
+	'''
+	Is reading the results streamed back from mp into basics.feas.
+	Results of other frames that are finished earlier are kept as well.
+	:param frame: Is waiting until this frame is available. Is waiting for the whole batch if None.
+	'''
+	global batch_location
 
-			# modulus from the moments of area
-			member["Wy"][frame] = member["Iy"][frame]/(height/2)
-			member["Wz"][frame] = member["Iz"][frame]/(width/2)
+	if frame is not None:
+		frame = str(frame)
 
-			# b = längere Seite, t = kürzere Seite
-			b = max(width, height)
-			t = min(width, height)
+	while batch_location is not None:
+		if frame is not None and frame in basics.feas:
+			break
 
-			c1 = (1 - 0.63/(height/width) + 0.052/(height/width)**5)/3   # nach Torsion nicht kreisförmiger Querschnitte/Springer Vergleichsspannung
-			c2 = 1-0.65/(1+(height/width)**3)
-			Wt = c1*height*width**2/c2
-			
-			# calculation of the longitudinal stresses
-			long_stress = []
-			for i in range(11): # get the stresses at 11 positions and
-				# moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				if axial[i] > 0:
-					s = axial[i]/A + abs(moment_y[i]/member["Wy"][frame]) + abs(moment_z[i]/member["Wz"][frame])
-				else:
-					s = axial[i]/A - abs(moment_y[i]/member["Wy"][frame]) - abs(moment_z[i]/member["Wz"][frame])
-				long_stress.append(s)
-
-			# get max stress of the beam
-			# (can be positive or negative)
-			member["long_stress"][frame] = long_stress
-			member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-			# calculation of the shear stresses from shear force
-
-			tau_shear_y = []
-			tau_shear_z = []
-			for i in range(11): # get the stresses at 11 positions and
-				# in y Richrtung
-				s_y = member["shear_y"][frame][i]
-				s_z = member["shear_z"][frame][i]
-
-				tau_y = abs(1.5 * s_y/A) # for solid rectangle, maximale tritt in Mitte auf
-				tau_shear_y.append(tau_y)
-				tau_z = abs(1.5 * s_z/A) # for solid rectangle, maximale tritt in Mitte auf
-				tau_shear_z.append(tau_z)
-
-			# get max shear stress of shear force of the beam
-			# shear stress is mostly small compared to longitudinal, in common architectural usage and only importand with short beam lenght
-			member["tau_shear_y"][frame] = tau_shear_y  # jetzt y und z
-			member["tau_shear_z"][frame] = tau_shear_z # wird maßgebend sein, ev die größere für Schubbemessun nehmen
-			member["max_tau_shear_y"][frame] = max(tau_shear_y) # jetzt y und z
-			member["max_tau_shear_z"][frame] = max(tau_shear_z) # jetzt y und z, ev nur das größere ausweisen
-
-			# Calculation of the torsion stresses
-			tau_torsion = []
-			for i in range(11): # get the stresses at 11 positions and
-				tau = abs(torque[i]/Wt) # die größte Torsionsspannung ist am Rand der längeren Seite, nur diese wird berechnet
-				tau_torsion.append(tau)
-
-			# get max torsion stress of the beam
-			member["tau_torsion"][frame] = tau_torsion
-			member["max_tau_torsion"][frame] = max(tau_torsion)
-			
-			sum_tau = []  # Schub und Torsion überlagerbar
-			for i in range(11): # get the stresses at 11 positions and
-				tau = tau_shear_z[i] + tau_torsion[i] # nur Schub aus Qz und Torsionsspannung an der Längsseite überlagert, da maßgebden
-				sum_tau.append(tau)
+		line = daemon.stdout.readline()
 
-			member["sum_tau"][frame] = sum_tau
-			member["max_sum_tau"][frame] = max(sum_tau)
-			
-			member["sigma"][frame] = member["long_stress"][frame]
-			member["max_sigma"][frame] = member["max_long_stress"][frame]
+		# the daemon stopped unexpectedly and is restarted with the next batch
+		if line == "":
+			stop_daemon()
+			raise RuntimeError("mp daemon stopped while calculating")
 
-			# overstress
-			member["overstress"][frame] = False
+		nline = line.rstrip()
 
-			# check overstress and add 1.05 savety factor
-			safety_factor = 1.05
-			if abs(member["max_tau_shear_y"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
+		# get result of a single frame
+		# the daemon is freeing it with the next command
+		if nline.startswith(mp.frame_done):
+			frame_done, location = json.loads(nline[len(mp.frame_done):])
+			basics.feas[frame_done] = mp.read_payload(location)
 
-			if abs(member["max_tau_shear_z"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
+		# the models are read by the daemon
+		elif nline == mp.batch_done:
+			mp.release_payload(batch_location)
+			batch_location = None
 
-			if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-				member["overstress"][frame] = True
-				
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# buckling
-			if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-				# hier als ir das kleinere von ir_z und ir_y nehmen
-				if member["ir_y"][frame] < member["ir_z"][frame]: ir = member["ir_y"][frame]
-				else: ir = member["ir_z"][frame]
-
-				member["lamda"][frame] = L*buckling_resolution*0.5/ir # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-				if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-					kn = member["knick_model"]
-					function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-					member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-					if member["lamda"][frame] > 250: # zu schlank
-						member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-						member["overstress"][frame] = True
-					if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-						member["overstress"][frame] = True
+	if frame is not None and frame not in basics.feas:
+		raise RuntimeError("mp daemon failed to calculate frame " + frame)
 
-				else:
-					member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
+def buckling_sigma(knick_model, lamda):
+	'''
+	Acceptable stress from the buckling curves for an array of slenderness.
+	Each distinct curve is evaluated once for all elements using it.
+	:param knick_model: Buckling curves of the elements shaped (n, len(material.kn_lamda)).
+	:param lamda: Slenderness of the elements as array, values above 250 are evaluated at 250.
+	:return sigma: Acceptable stress of the elements as array.
+	'''
+	curves, curve_ids = np.unique(knick_model, axis=0, return_inverse=True)
+	curve_ids = curve_ids.ravel()
+	lamda = np.minimum(lamda, 250)
 
-			# without buckling
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-				member["lamda"][frame] = None # to avoid missing KeyError
-				
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# lever_arm
-			lever_arm = []  # noch nicht überarbeitet
-			moment_h = []  # noch nicht überarbeitet
-			for i in range(11):
-				# moment_h
-				m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				moment_h.append(m_h)
-
-				# to avoid division by zero
-				if member["axial"][frame][i] < 0.1:
-					lv = m_h / 0.1
-				else:
-					lv = m_h / member["axial"][frame][i]
+	sigma = np.empty(len(lamda))
+	for curve_id, curve in enumerate(curves):
+		uses_curve = curve_ids == curve_id
+		sigma[uses_curve] = material.knick_polynomial(curve)(lamda[uses_curve])
 
-				lv = abs(lv) # absolute highest value within member
-				lever_arm.append(lv)
+	return sigma
 
-			member["moment_h"][frame] = moment_h
-			member["lever_arm"][frame] = lever_arm
-			member["max_lever_arm"][frame] = max(lever_arm)
+# profile types checked by member_stresses
+member_profile_types = ["round_hollow", "round_solid", "rect_hollow", "rect_solid", "standard_profile", "large_steel_hollow"]
 
-			# Ausnutzungsgrad
-			member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
+def member_stresses(profile_type, forces, L, section, knick_model):
+	'''
+	Stresses, buckling and utilization of all members of one profile type at once.
+	The formulas are the same as for a single member, but each quantity is calculated
+	for all members and positions with one array operation.
+	:param profile_type: Profile type of the members, one of member_profile_types.
+	:param forces: Forces from mp.pack_results_pn shaped (n, 6, 11) as axial, Fy, Fz, My, Mz, torque.
+	:param L: Lengths of the members as array.
+	:param section: Dict of arrays with height, width, wall_thickness (nan if not available), A, J, Iy, Iz,
+		E, buckling_resolution, acceptable_sigma, acceptable_shear, acceptable_torsion.
+		Standard profiles need the flange dimensions h, b and d in addition.
+	:param knick_model: Buckling curves of the members shaped (n, len(material.kn_lamda)).
+	:return stresses: Dict of arrays with the name of the member property as key.
+	'''
+	# properties of the members as columns to combine them with the 11 positions
+	height, width, wall_thickness, A, J, Iy, Iz, E = (
+		section[key][:, np.newaxis] for key in ["height", "width", "wall_thickness", "A", "J", "Iy", "Iz", "E"]
+		)
+	L = L[:, np.newaxis]
 
-			# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-			normalkraft_energy=[]
-			moment_energy=[]
-			strain_energy = []
+	axial = forces[:, 0] * (-1) # Druckkraft minus
 
-			for i in range(10): # get the energie at 10 positions for 10 section
-				# Berechnung der strain_energy für Normalkraft
-				ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-				normalkraft_energy.append(ne)
+	# flip z und y
+	moment_y = forces[:, 4]
+	moment_z = forces[:, 3]
+	shear_y = forces[:, 2]
+	shear_z = forces[:, 1]
+	torque = forces[:, 5]
 
-				# Berechnung der strain_energy für Moment
-				# moment_hq = moment_y[i]**2+moment_z[i]**2
-				moment_y = member["moment_y"][frame][i]
-				moment_z = member["moment_z"][frame][i]
+	stresses = {}
 
-				me = (moment_y**2 * L/10) / (2 * member["E"] * member["Iy"][frame]) + (moment_z**2 * L/10) / (2 * member["E"] * member["Iz"][frame]) # KD 2025-09_26
-				#  nach https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
-				moment_energy.append(me)
+	moment_h = np.sqrt(moment_y**2 + moment_z**2)
 
-				# Summe von Normalkraft und Moment-Verzerrunsenergie
-				value = ne + me
-				strain_energy.append(value)
+	if profile_type in ["round_hollow", "round_solid"]:
+		# buckling
+		ir_y = np.sqrt(J/A) # für runde Querschnitte, in  cm
+		ir_z = ir_y
+		ir = ir_y
 
-			member["strain_energy"][frame] = strain_energy
-			member["normal_energy"][frame] = normalkraft_energy
-			member["moment_energy"][frame] = moment_energy
+		# modulus from the moments of area
+		# Wy and Wz are the same within a pipe
+		Wy = Iy/(height/2)
+		stresses["Wy"] = Wy[:, 0]
 
-		if profile_type == "standard_profile":
-			# noch Höhe, Breite und Flanschdicke notwendig
-			# Torsionsträgheitsmoment nicht notwendig, da direkt mit Formel berechnet
-			# buckling
-			member["ir_y"][frame] = sqrt(Iy/A)
-			member["ir_z"][frame] = sqrt(Iz/A)
-			
-			# bucklng resolution
-			buckling_resolution = member["buckling_resolution"]
-
-			# modulus from the moments of area
-			member["Wy"][frame] = member["Iy"][frame]/(height/2)
-			member["Wz"][frame] = member["Iz"][frame]/(width/2)
-
-			# calculation of the longitudinal stresses
-			long_stress = []
-			for i in range(11): # get the stresses at 11 positions and
-				# moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				if axial[i] > 0:
-					s = axial[i]/A + abs(moment_y[i]/member["Wy"][frame]) + abs(moment_z[i]/member["Wz"][frame])
-				else:
-					s = axial[i]/A - abs(moment_y[i]/member["Wy"][frame]) - abs(moment_z[i]/member["Wz"][frame])
-				long_stress.append(s)
-
-			# get max stress of the beam
-			# (can be positive or negative)
-			member["long_stress"][frame] = long_stress
-			member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-			tau_shear_y = []
-			tau_shear_z = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				s_y = member["shear_y"][frame][i]
-				s_z = member["shear_z"][frame][i]
-
-				tau_y = abs(1.0 * s_y/A) # for I-Traeger maximale tritt in Steg auf, wegen Horizontallwirkung kaum massgebend
-				tau_shear_y.append(tau_y)
-				tau_z = abs(1.0 * s_z/A) # ev noch korrigieren,
-				tau_shear_z.append(tau_z)
-
-			# get max shear stress of shear force of the beam
-			# shear stress is mostly small compared to longitudinal, in common architectural usage and only importand with short beam lenght
-			member["tau_shear_y"][frame] = tau_shear_y  # jetzt x und z
-			member["tau_shear_z"][frame] = tau_shear_z #  wid maßgebend sein
-			member["max_tau_shear_y"][frame] = max(tau_shear_y)
-			member["max_tau_shear_z"][frame] = max(tau_shear_z) # ev nur dieses ausweisen
-
-			# Calculation of the torsion stresses
-			tau_torsion = []
-
-			current_profile = None
-			for i in material.profiles:
-				if i[0] == member["profile"][frame]:
-					current_profile = i
-
-			h = current_profile[2]*0.1  # Höhe
-			b = current_profile[3]*0.1  # Breite
-			d = current_profile[5]*0.1  # Flanschdicke
-
-			for i in range(11): # get the stresses at 11 positions and
-				tau = abs(torque[i]*1.5/((h-d) * b * d)) # Sttps://www.tugraz.at/institute/isb/lehre/e-learning/spannungen-aus-torsion-311-antwort
-				# größte tritt in beiden Flanschen in der MItte auf, keine Überlagerung mit Querkraftschub
-				tau_torsion.append(tau)
-
-			# get max torsion stress of the beam
-			member["tau_torsion"][frame] = tau_torsion
-			member["max_tau_torsion"][frame] = max(tau_torsion)
-
-			# calculation of the shear stresses from shear force and torsion
-			# (always positiv)
-			sum_tau = []  # Schub und Torsion überlagerbar
-			for i in range(11): # get the stresses at 11 positions and
-				tau = tau_shear_z[i]  # nur Schub aus Qz, keine Torsion, da an anderer Stelle
-				sum_tau.append(tau)
-
-			member["sum_tau"][frame] = sum_tau
-			member["max_sum_tau"][frame] = max(sum_tau)
-
-			member["sigma"][frame] = member["long_stress"][frame]
-			member["max_sigma"][frame] = member["max_long_stress"][frame]
-
-			# overstress
-			member["overstress"][frame] = False
-
-			# check overstress and add 1.05 savety factor
-			safety_factor = 1.05
-			if abs(member["max_tau_shear_y"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_shear_z"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-				member["overstress"][frame] = True
-
-			# ist sigma hier richtig?
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# buckling
-			if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-				# hier als ir das kleinere von ir_z und ir_y nehmen
-				if member["ir_y"][frame] < member["ir_z"][frame]: ir = member["ir_y"][frame]
-				else: ir = member["ir_z"][frame]
-
-				member["lamda"][frame] = L*buckling_resolution*0.5/ir # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-				if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-					kn = member["knick_model"]
-					function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-					member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-					if member["lamda"][frame] > 250: # zu schlank
-						member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-						member["overstress"][frame] = True
-					if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-						member["overstress"][frame] = True
+		# polar modulus of torsion
+		WJ = J/(height/2)
 
-				else:
-					member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
+		# calculation of the longitudinal stresses
+		long_stress = np.where(axial > 0, axial/A + moment_h/Wy, axial/A - moment_h/Wy)
 
-			# without buckling
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-				member["lamda"][frame] = None # to avoid missing KeyError
+		# calculation of the shear stresses from shear force
+		# (always positive)
+		tau_shear_y = 1.333 * np.sqrt(shear_y**2 + shear_z**2)/A # for pipes
+		tau_shear_z = tau_shear_y
 
+		# Calculation of the torsion stresses
+		# (always positiv)
+		Do = height
+		Di = np.where(np.isnan(wall_thickness), 0, Do - wall_thickness)
 
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
+		s = Do - Di # Wandstärke
+		Dm = (Do - Di) / 2  # mittlere Dicke
+		Wjd = 0.5 * pi * Dm * s  # Formel für dünnwandige Rohrquerschnitte nach Preussler
 
-			# lever_arm
-			lever_arm = []  # noch nicht überarbeitet
-			moment_h = []  # noch nicht überarbeitet
-			for i in range(11):
-				# moment_h
-				m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				moment_h.append(m_h)
+		# für Vollquerschnitte wie gehabt, gilt auch für dickwandige Rohrquerschnitte
+		# für dünnwandige Hohlquerschnitte neue Formel
+		tau_torsion = np.abs(torque/np.where(Di/Do < 0.85, WJ, Wjd))
 
-				# to avoid division by zero
-				if member["axial"][frame][i] < 0.1:
-					lv = m_h / 0.1
-				else:
-					lv = m_h / member["axial"][frame][i]
+		# combine shear and torque
+		sum_tau = tau_shear_y + tau_torsion
 
-				lv = abs(lv) # absolute highest value within member
-				lever_arm.append(lv)
+		# strain energy for the moment, laut https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
+		moment_hq = moment_y[:, :10]**2 + moment_z[:, :10]**2 # hier ist das quadrat
+		moment_energy = (moment_hq * L/10) / (E * Iy * 2)
 
-			member["moment_h"][frame] = moment_h
-			member["lever_arm"][frame] = lever_arm
-			member["max_lever_arm"][frame] = max(lever_arm)
+	else:
+		# buckling
+		ir_y = np.sqrt(Iy/A)
+		ir_z = np.sqrt(Iz/A)
 
-			# Ausnutzungsgrad
-			member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
+		# hier als ir das kleinere von ir_z und ir_y nehmen
+		ir = np.minimum(ir_y, ir_z)
 
-			# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-			normalkraft_energy=[]
-			moment_energy=[]
-			strain_energy = []
+		# modulus from the moments of area
+		Wy = Iy/(height/2)
+		Wz = Iz/(width/2)
+		stresses["Wy"] = Wy[:, 0]
+		stresses["Wz"] = Wz[:, 0]
+
+		# calculation of the longitudinal stresses
+		long_stress = np.where(
+			axial > 0,
+			axial/A + np.abs(moment_y/Wy) + np.abs(moment_z/Wz),
+			axial/A - np.abs(moment_y/Wy) - np.abs(moment_z/Wz)
+			)
+
+		# calculation of the shear stresses from shear force
+		if profile_type == "rect_solid":
+			shear_factor = 1.5 # for solid rectangle, maximale tritt in Mitte auf
+		else:
+			shear_factor = 1.0 # for hollow rectangle and I-Traeger
 
-			for i in range(10): # get the energie at 10 positions for 10 section
-				# Berechnung der strain_energy für Normalkraft
-				ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-				normalkraft_energy.append(ne)
+		tau_shear_y = np.abs(shear_factor * shear_y/A)
+		tau_shear_z = np.abs(shear_factor * shear_z/A)
 
-				# Berechnung der strain_energy für Moment
-				# moment_hq = moment_y[i]**2+moment_z[i]**2
-				moment_y = member["moment_y"][frame][i]
-				moment_z = member["moment_z"][frame][i]
-				me = (moment_y**2 * L/10) / (2 * member["E"] * member["Iy"][frame]) + (moment_z**2 * L/10) / (2 * member["E"] * member["Iz"][frame]) # KD 2025-09_26
+		# Calculation of the torsion stresses
+		if profile_type in ["rect_hollow", "large_steel_hollow"]:
+			# Formel nach Wandinger-Torsion, mit Am = mittlere Fläche und Wanddicke errechnet
+			tau_torsion = np.abs(torque/(2 * height-wall_thickness)*(width-wall_thickness))*wall_thickness
 
-				#  nach https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
-				moment_energy.append(me)
+		if profile_type == "rect_solid":
+			# nach Torsion nicht kreisförmiger Querschnitte/Springer Vergleichsspannung
+			c1 = (1 - 0.63/(height/width) + 0.052/(height/width)**5)/3
+			c2 = 1-0.65/(1+(height/width)**3)
+			Wt = c1*height*width**2/c2
 
-				# Summe von Normalkraft und Moment-Verzerrunsenergie
-				value = ne + me
-				strain_energy.append(value)
+			# die größte Torsionsspannung ist am Rand der längeren Seite, nur diese wird berechnet
+			tau_torsion = np.abs(torque/Wt)
 
-			member["strain_energy"][frame] = strain_energy
-			member["normal_energy"][frame] = normalkraft_energy
-			member["moment_energy"][frame] = moment_energy
+		if profile_type == "standard_profile":
+			h = section["h"][:, np.newaxis] # Höhe
+			b = section["b"][:, np.newaxis] # Breite
+			d = section["d"][:, np.newaxis] # Flanschdicke
 
-		if profile_type == "large_steel_hollow":			
-			# buckling
-			member["ir_y"][frame] = sqrt(Iy/A)
-			member["ir_z"][frame] = sqrt(Iz/A)
-			
-			# bucklng resolution
-			buckling_resolution = member["buckling_resolution"]
+			# größte tritt in beiden Flanschen in der MItte auf, keine Überlagerung mit Querkraftschub
+			tau_torsion = np.abs(torque*1.5/((h-d) * b * d))
 
-			# modulus from the moments of area
+		# nur Schub aus Qz und Torsionsspannung an der Längsseite überlagert, da maßgebden
+		if profile_type == "standard_profile":
+			sum_tau = tau_shear_z.copy() # nur Schub aus Qz, keine Torsion, da an anderer Stelle
+		else:
+			sum_tau = tau_shear_z + tau_torsion
+
+		# strain energy for the moment, nach https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
+		moment_energy = (
+			(moment_y[:, :10]**2 * L/10) / (2 * E * Iy)
+			+ (moment_z[:, :10]**2 * L/10) / (2 * E * Iz)
+			)
+
+	# get max stress of the beam
+	# (can be positive or negative, like basics.return_max_diff_to_zero)
+	smallest_minus = long_stress.min(axis=1)
+	biggest_plus = long_stress.max(axis=1)
+	max_long_stress = np.where(np.abs(smallest_minus) > np.abs(biggest_plus), smallest_minus, biggest_plus)
+
+	# overstress with 1.05 savety factor
+	safety_factor = 1.05
+	acceptable_sigma = section["acceptable_sigma"]
+
+	overstress = np.abs(tau_shear_y.max(axis=1)) > safety_factor*section["acceptable_shear"]
+	if profile_type not in ["round_hollow", "round_solid"]: # prüft bei runden nur y, da gleich wie z
+		overstress |= np.abs(tau_shear_z.max(axis=1)) > safety_factor*section["acceptable_shear"]
+	overstress |= np.abs(tau_torsion.max(axis=1)) > safety_factor*section["acceptable_torsion"]
+	overstress |= np.abs(max_long_stress) > safety_factor*acceptable_sigma
+
+	# buckling only for members under compression
+	# für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L
+	compressed = axial[:, 0] < 0
+	lamda = np.where(compressed, L[:, 0]*section["buckling_resolution"]*0.5/ir[:, 0], np.nan)
+
+	# für lamda < 20 (kurze Träger) gelten die default-Werte
+	acceptable_sigma_buckling = acceptable_sigma.copy()
+	slender = compressed & (lamda > 20)
+	if slender.any():
+		acceptable_sigma_buckling[slender] = buckling_sigma(knick_model[slender], lamda[slender])
+
+		overstress |= slender & (lamda > 250) # zu schlank
+		overstress |= slender & (safety_factor*np.abs(acceptable_sigma_buckling) > np.abs(max_long_stress))
+
+	# lever arm, to avoid division by zero with 0.1 as smallest axial force
+	lever_arm = np.abs(moment_h / np.where(axial < 0.1, 0.1, axial))
+
+	# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
+	# strain energy at 10 positions for 10 sections
+	normal_energy = (axial[:, :10]**2)*(L/10)/(2*E*A)
+
+	stresses["ir_y"] = ir_y[:, 0]
+	stresses["ir_z"] = ir_z[:, 0]
+	stresses["long_stress"] = long_stress
+	stresses["max_long_stress"] = max_long_stress
+	stresses["tau_shear_y"] = tau_shear_y
+	stresses["tau_shear_z"] = tau_shear_z
+	stresses["max_tau_shear_y"] = tau_shear_y.max(axis=1)
+	stresses["max_tau_shear_z"] = tau_shear_z.max(axis=1)
+	stresses["tau_torsion"] = tau_torsion
+	stresses["max_tau_torsion"] = tau_torsion.max(axis=1)
+	stresses["sum_tau"] = sum_tau
+	stresses["max_sum_tau"] = sum_tau.max(axis=1)
+	stresses["sigma"] = long_stress
+	stresses["max_sigma"] = max_long_stress
+	stresses["overstress"] = overstress
+	stresses["lamda"] = lamda
+	stresses["acceptable_sigma_buckling"] = acceptable_sigma_buckling
+	stresses["moment_h"] = moment_h
+	stresses["lever_arm"] = lever_arm
+	stresses["max_lever_arm"] = lever_arm.max(axis=1)
+	stresses["utilization"] = np.abs(max_long_stress / acceptable_sigma_buckling)
+	stresses["strain_energy"] = normal_energy + moment_energy
+	stresses["normal_energy"] = normal_energy
+	stresses["moment_energy"] = moment_energy
+
+	return stresses
+
+def quad_stresses(quad_results, thickness, corner_displacements, initial_positions, acceptable_sigma, acceptable_sigmav, knick_model):
+	'''
+	Stresses, principal stresses, buckling and utilization of all quads at once.
+	:param quad_results: Results from mp.pack_results_pn shaped (n, 8) as Qx, Qy, Mx, My, Mxy, Sx, Sy, Txy.
+	:param thickness: Thickness of the quads as array.
+	:param corner_displacements: Displacements of the corners shaped (n, 4, 6) as DX, DY, DZ, RX, RY, RZ.
+	:param initial_positions: Initial positions of the corners shaped (n, 4, 3).
+	:param acceptable_sigma: Acceptable stress of the quads as array.
+	:param acceptable_sigmav: Acceptable equivalent stress of the quads as array.
+	:param knick_model: Buckling curves of the quads shaped (n, len(material.kn_lamda)).
+	:return stresses: Dict of arrays with the name of the quad property as key.
+	'''
+	Qx, Qy, Mx, My, Mxy, Sx, Sy, Txy = quad_results.T
+
+	# deflection added to the initial position, flip y and z
+	deflection = corner_displacements[:, :, [0, 2, 1]]*0.1 + initial_positions
+
+	# get average lengthes to calculate force by unit
+	v_0, v_1, v_2, v_3 = initial_positions.transpose(1, 0, 2)
+
+	# as descripted in quad example
+	length_x = (np.linalg.norm(v_1 - v_0, axis=1) + np.linalg.norm(v_3 - v_2, axis=1)) * 0.5 * 100 # to convert into cm
+	length_y = (np.linalg.norm(v_2 - v_1, axis=1) + np.linalg.norm(v_3 - v_0, axis=1)) * 0.5 * 100 # to convert into cm
+
+	# Schnittkräfte in unit-cm
+	membrane_x = Sx * thickness  # Spannung in kN/cm
+	membrane_y = Sy * thickness  # Spannung in kN/cm
+	membrane_xy = Txy * thickness  #  Schubspannung in kN/cm
+
+	# die Querschnittswerte sind jetzt auf 1 cm Schalenbreite bezogen
+	A = thickness * 1 # Dicke in cm² pro cm Schalenbreite
+
+	# für buckling, Breite kürzt sich weg, es bleibt 1/wurzel aus 12
+	ir = thickness * 0.28867 # in cm
+
+	# modulus from the moments of area
+	Wy = (thickness**2)/6  # auf 1 cm Schalenbreite
+
+	stresses = {
+		"shear_x": Qx, "shear_y": Qy,
+		"moment_x": Mx, "moment_y": My, "moment_xy": Mxy,
+		"membrane_x": membrane_x, "membrane_y": membrane_y, "membrane_xy": membrane_xy,
+		"length_x": length_x, "length_y": length_y,
+		"deflection": deflection,
+		"ir": ir, "A": A, "Wy": Wy
+		}
+
+	# Spannungen in x und y Richrtung an den Oberflächen 1 und 2
+	# Hauptspannungen 1 und 2 an den Oberflächen 1 und 2
+	# based on:
+	# https://www.umwelt-campus.de/fileadmin/Umwelt-Campus/User/TPreussler/Download/Festigkeitslehre/Foliensaetze/01_Spannungszustand.pdf
+	# https://technikermathe.de/tm2-hauptnormalspannung-berechnen
+	sigmav_sides = []
+	for side, sign in [("1", -1), ("2", 1)]:
+		s_x = membrane_x + sign*Mx/Wy
+		s_y = membrane_y + sign*My/Wy
+		T_xy = membrane_xy + sign*Mxy/Wy
+
+		# avoid div zero
+		difference = s_x - s_y
+		no_difference = difference == 0
+		alpha = np.where(no_difference, 0, np.degrees(0.5 * np.arctan((2 * T_xy) / np.where(no_difference, 1, difference))))
+
+		radius = np.sqrt(((s_x - s_y)/2)**2 + T_xy**2)
+		s_1 = (s_x + s_y)/2 + radius
+		s_2 = (s_x + s_y)/2 - radius
+		s_xi = (s_x + s_y)/2 + (s_x - s_y)/2 * np.cos(2*np.radians(alpha)) + T_xy * np.sin(2*np.radians(alpha))
+
+		# the principal stress with the larger amount first
+		first = np.abs(s_1) > np.abs(s_2)
+		s_1, s_2 = np.where(first, s_1, s_2), np.where(first, s_2, s_1)
+
+		stresses["s_x_" + side] = s_x
+		stresses["s_y_" + side] = s_y
+		stresses["T_xy_" + side] = T_xy
+		stresses["s_1_" + side] = s_1
+		stresses["s_2_" + side] = s_2
+		stresses["alpha_" + side] = np.where(np.abs(np.round(s_1, 2)) == np.abs(np.round(s_xi, 2)), alpha + 90, alpha)
+
+		# Vergleichsspannung an der Oberfläche
+		sigmav_sides.append(np.sqrt(s_x**2 + s_y**2 - s_x*s_y + 3*T_xy**2))
+
+	# der größere Wert wird für die weitere Optimierung verwendet
+	sigmav1, sigmav2 = sigmav_sides
+	sigmav = np.where(sigmav2 > sigmav1, sigmav2, sigmav1)
+
+	# check overstress and add 1.05 safety factor
+	safety_factor = 1.05
+	overstress = sigmav > safety_factor*acceptable_sigmav
+
+	# buckling in x- und y-Richtung, nur für Druck
+	# es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
+	acceptable_sigma_buckling = []
+	for membrane, length in [(membrane_x, length_x), (membrane_y, length_y)]:
+		compressed = membrane < 0
+		lamda = np.where(compressed, length*5/ir, np.nan)
+
+		# für lamda < 20 (kurze Träger) gelten die default-Werte
+		sigma_buckling = acceptable_sigma.copy()
+		slender = compressed & (lamda > 20)
+		if slender.any():
+			sigma_buckling[slender] = buckling_sigma(knick_model[slender], lamda[slender])
+
+			overstress |= slender & (lamda > 250) # Schlankheit zu schlank
+			overstress |= slender & (safety_factor*np.abs(sigma_buckling) > np.abs(sigmav))
+
+		acceptable_sigma_buckling.append(sigma_buckling)
+
+	# lamda of the y-direction is kept
+	stresses["lamda"] = lamda
+
+	# das kleinere ist maßgbend
+	acceptable_sigma_buckling_x, acceptable_sigma_buckling_y = acceptable_sigma_buckling
+	acceptable_sigma_buckling = np.where(acceptable_sigma_buckling_x < acceptable_sigma_buckling_y, acceptable_sigma_buckling_x, acceptable_sigma_buckling_y)
+
+	overstress |= np.abs(sigmav) > safety_factor*acceptable_sigma
+
+	stresses["sigmav"] = sigmav
+	stresses["acceptable_sigma_buckling"] = acceptable_sigma_buckling
+	stresses["overstress"] = overstress
+
+	# Ausnutzungsgrad
+	stresses["utilization"] = np.abs(sigmav / acceptable_sigma_buckling)
+
+	return stresses
 
-			member["Wy"][frame] = member["Iy"][frame]/(height/2)
-			member["Wz"][frame] = member["Iz"][frame]/(width/2)
+def interweave_results_pn(frame):
+	'''
+	Function to integrate the results of PyNite.
+	The results are read from basics.feas as arrays packed by mp.pack_results_pn.
+	:param frame: Frame to integrate the results for.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	phaenotyp = scene.phaenotyp
+	calculation_type = phaenotyp.calculation_type
+	members = data["members"]
+	quads = data["quads"]
 
-			# calculation of the longitudinal stresses
-			long_stress = []
-			for i in range(11): # get the stresses at 11 positions and
-				# moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				if axial[i] > 0:
-					s = axial[i]/A + abs(moment_y[i]/member["Wy"][frame]) + abs(moment_z[i]/member["Wz"][frame])
-				else:
-					s = axial[i]/A - abs(moment_y[i]/member["Wy"][frame]) - abs(moment_z[i]/member["Wz"][frame])
-				long_stress.append(s)
-
-			# get max stress of the beam
-			# (can be positive or negative)
-			member["long_stress"][frame] = long_stress
-			member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-			# calculation of the shear stresses from shear force
-			tau_shear_y = [] # nun zwei Scherspannungen
-			tau_shear_z = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				# in y Richrtung
-				s_y = member["shear_y"][frame][i]
-				s_z = member["shear_z"][frame][i]
-				
-				tau_y = abs(1.0 * s_y/A) # for hollow rectangle, maximale tritt in Mitte auf,
-				tau_shear_y.append(tau_y)
-				tau_z = abs( 1.0 * s_z/A) # for hollow rectangle, maximale tritt in Mitte auf wird maßgebend sein, ev die größere für Schubbemessun nehmen
-				tau_shear_z.append(tau_z)
-
-			# get max shear stress of shear force of the beam
-			# shear stress is mostly small compared to longitudinal, in common architectural usage and only importand with short beam lenght
-			member["tau_shear_y"][frame] = tau_shear_y  # jetzt x und z
-			member["tau_shear_z"][frame] = tau_shear_z # wird maßgebend sein
-			member["max_tau_shear_y"][frame] = max(tau_shear_y)
-			member["max_tau_shear_z"][frame] = max(tau_shear_z) # wird maßgebend sein, ev nur das größere ausweisen
-
-			# Calculation of the torsion stresses
-			tau_torsion = []
-
-			for i in range(11): # get the stresses at 11 positions and
-				tau = abs(torque[i]/(2 * height-wall_thickness)*(width-wall_thickness))*wall_thickness  #### Formel nach Wandinger-Torsion, Trägheitsmoment nicht erforderlich, sondern direkt mit Am =mittlere Fläche und Wanddicke errechnet
-				# Torsionsspannung in senkrechten und horizontalen Steg gleich, daher nur tau und nicht tau_z und tau_y
-				# muss height und width und t noch übernommen werden?
-				tau_torsion.append(tau)
-
-			# get max torsion stress of the beam
-			member["tau_torsion"][frame] = tau_torsion
-			member["max_tau_torsion"][frame] = max(tau_torsion)
-
-			# calculation of the shear stresses from shear force and torsion
-			# (always positiv)
-			sum_tau = []  # Schub und Torsion überlagerbar
-			for i in range(11): # get the stresses at 11 positions and
-				tau = tau_shear_z[i] + tau_torsion[i] # nur Schub aus Qz und Torsionsspannung an der Längsseite überlagert, da maßgebden
-				sum_tau.append(tau)
-
-			member["sum_tau"][frame] = sum_tau
-			member["max_sum_tau"][frame] = max(sum_tau)
-			
-			# check out: http://www.bs-wiki.de/mediawiki/index.php?title=Festigkeitsberechnung
-			member["sigma"][frame] = member["long_stress"][frame]
-			member["max_sigma"][frame] = member["max_long_stress"][frame]
-
-			# overstress
-			member["overstress"][frame] = False
-
-			# check overstress and add 1.05 savety factor
-			safety_factor = 1.05
-			if abs(member["max_tau_shear_y"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_shear_z"][frame]) > safety_factor*member["acceptable_shear"]:
-				member["overstress"][frame] = True
-
-			if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-				member["overstress"][frame] = True
-
-			# Ist das korrekt?
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# buckling
-			if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-				# hier als ir das kleinere von ir_z und ir_y nehmen
-				if member["ir_y"][frame] < member["ir_z"][frame]: ir = member["ir_y"][frame]
-				else: ir = member["ir_z"][frame]
-
-				member["lamda"][frame] = L*buckling_resolution*0.5/ir # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-				if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-					kn = member["knick_model"]
-					function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-					member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-					if member["lamda"][frame] > 250: # zu schlank
-						member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-						member["overstress"][frame] = True
-					if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-						member["overstress"][frame] = True
+	# wait for this frame if mp is still running
+	receive_results(frame)
 
-				else:
-					member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
+	frame = str(frame)
+	results = basics.feas[frame] # arrays from mp.pack_results_pn
+	basics.timer.start()
 
-			# without buckling
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-				member["lamda"][frame] = None # to avoid missing KeyError
-
-			if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-				member["overstress"][frame] = True
-
-			# lever_arm
-			lever_arm = []  # noch nicht überarbeitet
-			moment_h = []  # noch nicht überarbeitet
-			for i in range(11):
-				# moment_h
-				m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-				moment_h.append(m_h)
-
-				# to avoid division by zero
-				if member["axial"][frame][i] < 0.1:
-					lv = m_h / 0.1
-				else:
-					lv = m_h / member["axial"][frame][i]
+	# rows of the members in the results
+	member_rows = {}
+	for row, id in enumerate(results["member_ids"]):
+		member_rows[id] = row
 
-				lv = abs(lv) # absolute highest value within member
-				lever_arm.append(lv)
+	ids = list(members)
+	rows = array([member_rows[id] for id in ids], dtype=int)
 
-			member["moment_h"][frame] = moment_h
-			member["lever_arm"][frame] = lever_arm
-			member["max_lever_arm"][frame] = max(lever_arm)
+	L = results["member_lengths"][rows] # Member length
+	T = results["member_cosines"][rows] # Direction cosines of the members
+	forces = results["member_forces"][rows] # axial, Fy, Fz, My, Mz, torque at 11 positions
 
-			# Ausnutzungsgrad
-			member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
+	# flip z und y
+	internal_forces = {
+		"axial": (forces[:, 0] * (-1)).tolist(), # Druckkraft minus
+		"moment_y": forces[:, 4].tolist(),
+		"moment_z": forces[:, 3].tolist(),
+		"shear_y": forces[:, 2].tolist(),
+		"shear_z": forces[:, 1].tolist(),
+		"torque": forces[:, 5].tolist()
+		}
 
-			# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-			normalkraft_energy = []
-			moment_energy = []
-			strain_energy = []
+	# deflection
+	# --> taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
+	scale_factor = 10.0
 
-			for i in range(10): # get the energie at 10 positions for 10 section
-				# Berechnung der strain_energy für Normalkraft
-				ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-				normalkraft_energy.append(ne)
+	cos_x = T[:, np.newaxis, 0, 0:3] # Direction cosines of local x-axis
+	cos_y = T[:, np.newaxis, 1, 0:3] # Direction cosines of local y-axis
+	cos_z = T[:, np.newaxis, 2, 0:3] # Direction cosines of local z-axis
 
-				# Berechnung der strain_energy für Moment
-				# moment_hq = moment_y[i]**2+moment_z[i]**2
-				moment_y = member["moment_y"][frame][i]
-				moment_z = member["moment_z"][frame][i]
-				me = (moment_y**2 * L/10) / (2 * member["E"] * member["Iy"][frame]) + (moment_z**2 * L/10) / (2 * member["E"] * member["Iz"][frame]) # KD 2025-09_26
-				#  nach https://roymech.org/Useful_Tables/Beams/Strain_Energy.html
-				moment_energy.append(me)
+	# local dx, dy, dz at 11 positions
+	member_deflection = results["member_deflections"][rows]
 
-				# Summe von Normalkraft und Moment-Verzerrunsenergie
-				value = ne + me
-				strain_energy.append(value)
+	# Calculate the scaled displacement in global coordinates
+	DY_plot = member_deflection[:, 1, :, np.newaxis]*cos_y*scale_factor
+	DZ_plot = member_deflection[:, 2, :, np.newaxis]*cos_z*scale_factor
 
-			member["strain_energy"][frame] = strain_energy
-			member["normal_energy"][frame] = normalkraft_energy
-			member["moment_energy"][frame] = moment_energy
+	# Calculate the local x-axis displacements at 11 points along the member's length
+	i_nodes = results["member_i_nodes"][rows][:, np.newaxis, :]
+	positions = L[:, np.newaxis]/10*np.arange(11)
+	DX_plot = i_nodes + (positions + member_deflection[:, 0]*scale_factor)[:, :, np.newaxis]*cos_x
 
-		# deflection
-		deflection = []
+	# Sum the component displacements to obtain overall displacement
+	D_plot = DY_plot + DZ_plot + DX_plot
 
-		# --> taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
-		scale_factor = 10.0
+	# <-- taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
 
-		cos_x = array([T[0,0:3]]) # Direction cosines of local x-axis
-		cos_y = array([T[1,0:3]]) # Direction cosines of local y-axis
-		cos_z = array([T[2,0:3]]) # Direction cosines of local z-axis
+	# flip y und z
+	deflections = (D_plot[:, :, [0, 2, 1]] * 0.01).tolist()
 
-		DY_plot = empty((0, 3))
-		DZ_plot = empty((0, 3))
+	for k, id in enumerate(ids):
+		member = members[id]
+		for key, values in internal_forces.items():
+			member[key][frame] = values[k]
 
-		for i in range(11):
-			# Calculate the local y-direction displacement
-			dy_tot = model_member.deflection('dy', L/10*i)
+		member["deflection"][frame] = deflections[k]
 
-			# Calculate the scaled displacement in global coordinates
-			DY_plot = append(DY_plot, dy_tot*cos_y*scale_factor, axis=0)
+	# group the members by profile type to check all members of a type at once
+	groups = {}
+	for k, id in enumerate(ids):
+		profile_type = members[id]["profile_type"]
+		if profile_type in member_profile_types:
+			groups.setdefault(profile_type, []).append(k)
 
-			# Calculate the local z-direction displacement
-			dz_tot = model_member.deflection('dz', L/10*i)
+	# dimensions of the standard profiles by name
+	profiles = {profile[0]: profile for profile in material.profiles}
 
-			# Calculate the scaled displacement in global coordinates
-			DZ_plot = append(DZ_plot, dz_tot*cos_z*scale_factor, axis=0)
+	for profile_type, group in groups.items():
+		group_members = [members[ids[k]] for k in group]
 
-		# Calculate the local x-axis displacements at 20 points along the member's length
-		DX_plot = empty((0, 3))
+		# access variables once
+		section = {}
+		for key in ["height", "width", "wall_thickness", "A", "J", "Iy", "Iz"]:
+			section[key] = array([member[key][frame] for member in group_members], dtype=float)
 
-		Xi = model_member.i_node.X
-		Yi = model_member.i_node.Y
-		Zi = model_member.i_node.Z
+		for key in ["E", "buckling_resolution", "acceptable_sigma", "acceptable_shear", "acceptable_torsion"]:
+			section[key] = array([member[key] for member in group_members], dtype=float)
 
-		for i in range(11):
-			# Displacements in local coordinates
-			dx_tot = [[Xi, Yi, Zi]] + (L/10*i + model_member.deflection('dx', L/10*i)*scale_factor)*cos_x
+		if profile_type == "standard_profile":
+			current_profiles = [profiles[member["profile"][frame]] for member in group_members]
+			section["h"] = array([profile[2]*0.1 for profile in current_profiles]) # Höhe
+			section["b"] = array([profile[3]*0.1 for profile in current_profiles]) # Breite
+			section["d"] = array([profile[5]*0.1 for profile in current_profiles]) # Flanschdicke
 
-			# Magnified displacements in global coordinates
-			DX_plot = append(DX_plot, dx_tot, axis=0)
+		knick_model = array([member["knick_model"] for member in group_members], dtype=float)
 
-		# Sum the component displacements to obtain overall displacement
-		D_plot = DY_plot + DZ_plot + DX_plot
+		stresses = member_stresses(profile_type, forces[group], L[group], section, knick_model)
 
-		# <-- taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
+		# write all results back at once
+		stresses = {key: value.tolist() for key, value in stresses.items()}
+		stresses["lamda"] = [None if isnan(lamda) else lamda for lamda in stresses["lamda"]] # to avoid missing KeyError
 
-		# add to results
-		for i in range(11):
-			# flip y und z
-			x = D_plot[i, 0] * 0.01
-			y = D_plot[i, 2] * 0.01
-			z = D_plot[i, 1] * 0.01
+		for j, member in enumerate(group_members):
+			for key, values in stresses.items():
+				member[key][frame] = values[j]
 
-			deflection.append([x,y,z])
+	# rows of the nodes and quads in the results
+	node_rows = {}
+	for row, id in enumerate(results["node_ids"]):
+		node_rows[id] = row
 
-		member["deflection"][frame] = deflection
+	quad_rows = {}
+	for row, id in enumerate(results["quad_ids"]):
+		quad_rows[id] = row
 
-	nodes = model.nodes
+	node_displacements = results["node_displacements"] # DX, DY, DZ, RX, RY, RZ
 
-	for id in quads:
-		quad = quads[id]
+	quad_ids = list(quads)
+	if quad_ids:
+		quad_list = [quads[id] for id in quad_ids]
 
 		# read results from PyNite
-		result = model.quads[id]
-
-		# only take highest value to zero
-		shear = result.shear()
-		moment = result.moment()
-		membrane = result.membrane()
-
-		# from PyNite
-		Qx = float(shear[0])
-		Qy = float(shear[1])
-
-		Mx = float(moment[0])
-		My = float(moment[1])
-		Mxy = float(moment[2])
-
-		Sx = float(membrane[0])
-		Sy = float(membrane[1])
-		Txy = float(membrane[2])
-
-		#print("Qx:", Qx, "Qy:", Qy, "Mx:", Mx, "My:", My, "Mxy:", Mxy, "Sx:", Sx, "Sy:", Sy, "Txy:", Txy)
-
-		# get deflection
-		node_ids = quad["vertices_ids_structure"]
-		deflection = []
-		for i in range(4):
-			# deflection only
-			x = nodes[str(node_ids[i])].DX["Combo 1"]*0.1
-			y = nodes[str(node_ids[i])].DZ["Combo 1"]*0.1
-			z = nodes[str(node_ids[i])].DY["Combo 1"]*0.1
+		# Qx, Qy, Mx, My, Mxy, Sx, Sy, Txy at the center of the quads
+		quad_results = results["quad_results"][array([quad_rows[id] for id in quad_ids], dtype=int)]
 
-			# add deflection to initial position
-			initial = quad["initial_positions"][frame][i]
-			x += initial[0]
-			y += initial[1]
-			z += initial[2]
+		# displacements of the corners
+		corner_rows = [[node_rows[str(node_id)] for node_id in quad["vertices_ids_structure"]] for quad in quad_list]
+		corner_displacements = node_displacements[array(corner_rows, dtype=int)]
 
-			deflection.append([x,y,z])
+		initial_positions = array([quad["initial_positions"][frame] for quad in quad_list], dtype=float)
+		thickness = array([quad["thickness"][frame] for quad in quad_list], dtype=float)
+		acceptable_sigma = array([quad["acceptable_sigma"] for quad in quad_list], dtype=float)
+		acceptable_sigmav = array([quad["acceptable_sigmav"] for quad in quad_list], dtype=float)
+		knick_model = array([quad["knick_model"] for quad in quad_list], dtype=float)
 
-		# get average lengthes to calculate force by unit
-		initial = quad["initial_positions"][frame]
-		v_0 = array(initial[0])
-		v_1 = array(initial[1])
-		v_2 = array(initial[2])
-		v_3 = array(initial[3])
+		stresses = quad_stresses(
+			quad_results, thickness, corner_displacements, initial_positions,
+			acceptable_sigma, acceptable_sigmav, knick_model
+			)
 
-		x_0 = v_1 - v_0 # first edge x
-		x_1 = v_3 - v_2 # second edge x
-		y_0 = v_2 - v_1 # first edge y
-		y_1 = v_3 - v_0 # second edge y
+		# write all results back at once
+		stresses = {key: value.tolist() for key, value in stresses.items()}
+		stresses["lamda"] = [None if isnan(lamda) else lamda for lamda in stresses["lamda"]] # to avoid missing KeyError
 
-		# as descripted in quad example
-		length_x = (linalg.norm(x_0) + linalg.norm(x_1)) * 0.5 * 100 # to convert into cm
-		length_y = (linalg.norm(y_0) + linalg.norm(y_1)) * 0.5 * 100 # to convert into cm
-
-		# Schnittkräfte in unit-cm
-
-		shear_x = Qx # Querkraft in kN  # für Darstellung
-		shear_y = Qy # Querkraft in kN  # für Darstellung
-
-		moment_x = Mx  # Moment in kNcm   # für Darstellung
-		moment_y = My  # Moment in kNcm   # für Darstellung
-		moment_xy = Mxy  # Drillmoment in kNcm   # für Darstellung
-
-		thickness = quad["thickness"][frame]
-
-		membrane_x = Sx * thickness  # Spannung in kN/cm   # für Darstellung
-		membrane_y = Sy * thickness  # Spannung in kN/cm   # für Darstellung
-		membrane_xy = Txy * thickness  #  Schubspannung in kN/cm   # für Darstellung
-
-		# die Querschnittswerte sind jetzt auf 1 cm Schalenbreite bezogen
-		# area of the section, not the face
-		A = thickness * 1 # Dicke in cm² pro cm Schalenbreite
-
-		# J = 1 * (thickness)**3 / 12
-
-		# für buckling
-		ir = thickness * 0.28867 # in cm  - Breite kürzt sich weg, es bleibt 1/wurzel aus 12
-		# ir = sqrt(J/A) # in cm
-		# modulus from the moments of area
-		Wy = (thickness**2)/6  # auf 1 cm Schalenbreite
-
-		# Spannungen in x und y Richrtung an den Oberflächen 1 und 2
-		'''
-		s_x_1 = membrane_x + moment_x/Wy  # für Darstellung
-		s_x_2 = membrane_x - moment_x/Wy  # für Darstellung
-		s_y_1 = membrane_y + moment_y/Wy  # für Darstellung
-		s_y_2 = membrane_y - moment_y/Wy  # für Darstellung
-		T_xy_1 = membrane_xy +  moment_xy/Wy # am Plattenrand, für Darstellung
-		T_xy_2 = membrane_xy -  moment_xy/Wy # am Plattenrand, für Darstellung
-		'''
-
-		s_x_1 = membrane_x - moment_x/Wy  # für Darstellung
-		s_x_2 = membrane_x + moment_x/Wy  # für Darstellung
-		s_y_1 = membrane_y - moment_y/Wy  # für Darstellung
-		s_y_2 = membrane_y + moment_y/Wy  # für Darstellung
-		T_xy_1 = membrane_xy -  moment_xy/Wy # am Plattenrand, für Darstellung
-		T_xy_2 = membrane_xy +  moment_xy/Wy # am Plattenrand, für Darstellung
-
-
-		# Schubspannungen in x und y Richtung  infolge Querkraft in Plattenmitte
-		T_x = 1.5 * shear_x/A   # in Plattenmitte
-		T_y = 1.5 * shear_y/A   # in Plattenmitte
-
-		# Hauptspannungen 1 und 2 an den Oberflächen 1 und 2
-		# based on:
-		# https://www.umwelt-campus.de/fileadmin/Umwelt-Campus/User/TPreussler/Download/Festigkeitslehre/Foliensaetze/01_Spannungszustand.pdf
-		# https://technikermathe.de/tm2-hauptnormalspannung-berechnen
-		# midpoint
-
-		# first side
-		if s_x_1 - s_y_1 == 0: # avoid div zero
-			alpha = 0
-		else:
-			alpha = degrees(0.5 * arctan((2 * T_xy_1) / (s_x_1 - s_y_1)))
-
-		s_1 = (s_x_1 + s_y_1)/2 + sqrt(((s_x_1 - s_y_1)/2)**2 + T_xy_1**2)
-		s_2 = (s_x_1 + s_y_1)/2 - sqrt(((s_x_1 - s_y_1)/2)**2 + T_xy_1**2)
-		s_xi = (s_x_1 + s_y_1)/2 + (s_x_1 - s_y_1)/2 * cos(2*radians(alpha)) + T_xy_1 * sin(2*radians(alpha))
-
-		#if abs(s_1) > abs(s_2):
-		if abs(s_1) > abs(s_2):
-			s_1_1 = s_1
-			s_2_1 = s_2
-		else:
-			s_1_1 = s_2
-			s_2_1 = s_1
-
-		if abs(round(s_1_1,2)) == abs(round(s_xi,2)):
-			alpha_1 = alpha + 90
-		else:
-			alpha_1 = alpha
-
-		# second side
-		if s_x_2 - s_y_2 == 0: # avoid div zero
-			alpha = 0
-		else:
-			alpha = degrees(0.5 * arctan((2 * T_xy_2) / (s_x_2 - s_y_2)))
-
-		s_1 = (s_x_2 + s_y_2)/2 + sqrt(((s_x_2 - s_y_2)/2)**2 + T_xy_2**2)
-		s_2 = (s_x_2 + s_y_2)/2 - sqrt(((s_x_2 - s_y_2)/2)**2 + T_xy_2**2)
-		s_xi = (s_x_2 + s_y_2)/2 + (s_x_2 - s_y_2)/2 * cos(2*radians(alpha)) + T_xy_2 * sin(2*radians(alpha))
-
-		if abs(s_1) > abs(s_2):
-			s_1_2 = s_1
-			s_2_2 = s_2
-		else:
-			s_1_2 = s_2
-			s_2_2 = s_1
-
-		if abs(round(s_1_2,2)) == abs(round(s_xi,2)):
-			alpha_2 = alpha + 90
-		else:
-			alpha_2 = alpha
-
-		# long_stress_x = s_x
-		# sigma = s_x
-		# long_stress_y = s_y
-		# sigma_y = s_y
-		# shear_xy = membrane_xy
-		# tau_shear_xy = 1.5 * shear_x/A # for quads
-		# tau_shear_y = 1.5 * shear_y/A # for quads
-		# tau_shear_y = 1.5 * shear_y/A # for quads
-
-		# Vergleichsspannung an den beiden Oberflächen 1 und 2
-		sigmav1 = sqrt(s_x_1**2 + s_y_1**2 - s_x_1*s_y_1 + 3*T_xy_1**2)
-		sigmav2 = sqrt(s_x_2**2 + s_y_2**2 - s_x_2*s_y_2 + 3*T_xy_2**2)
-
-		# der größere Wert wird für die weitere Optimierung verwendet
-		if sigmav2 > sigmav1:
-			sigmav = sigmav2
-		else:
-			sigmav = sigmav1
-
-		# Vergleichsspannung in Plattenmitte
-		sigmav_m = sqrt(abs((membrane_x/A)**2 + (membrane_y/A)**2 - (membrane_x/A) * (membrane_y/A) + 3 * T_x * T_y))  # falls notwendig
-
-		overstress = False
-		# check overstress and add 1.05 safety factor
-		safety_factor = 1.05
-		#if abs(tau_shear) > safety_factor*quad["acceptable_shear"]:
-		#	overstress = True
-
-		if sigmav > safety_factor*quad["acceptable_sigmav"]:
-			overstress = True
-
-		# buckling in x-Richtung
-		if membrane_x < 0: # nur für Druckstäbe, axial kann nicht flippen?
-			quad["lamda"][frame] = length_x*5/ir # es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
-			if quad["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-				kn = quad["knick_model"]
-				function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-				acceptable_sigma_buckling_x = function_to_run(quad["lamda"][frame])
-				if quad["lamda"][frame] > 250: # Schlankheit zu schlank
-					acceptable_sigma_buckling_x = function_to_run(250)
-					overstress = True
-				if safety_factor*abs(acceptable_sigma_buckling_x) > abs(sigmav): # Sigma
-					overstress = True
-
-			else:
-				acceptable_sigma_buckling_x = quad["acceptable_sigma"]
-		# without buckling
-		else:
-			acceptable_sigma_buckling_x = quad["acceptable_sigma"]
-			quad["lamda"][frame] = None # to avoid missing KeyError
-
-
-		# buckling in y-Richtung
-		if membrane_y < 0: # nur für Druckstäbe, axial kann nicht flippen?
-			quad["lamda"][frame] = length_y*5/ir # es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
-			if quad["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-				kn = quad["knick_model"]
-				function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-				acceptable_sigma_buckling_y = function_to_run(quad["lamda"][frame])
-				if quad["lamda"][frame] > 250: # Schlankheit zu schlank
-					acceptable_sigma_buckling_y = function_to_run(250)
-					overstress = True
-				if safety_factor*abs(acceptable_sigma_buckling_y) > abs(sigmav): # Sigma
-					overstress = True
-
-			else:
-				acceptable_sigma_buckling_y = quad["acceptable_sigma"]
-
-		# without buckling
-		else:
-			acceptable_sigma_buckling_y = quad["acceptable_sigma"]
-			quad["lamda"][frame] = None # to avoid missing KeyError
-
-		# das kleinere ist maßgbend
-		if acceptable_sigma_buckling_x < acceptable_sigma_buckling_y:
-			quad["acceptable_sigma_buckling"][frame] = acceptable_sigma_buckling_x
-		else:
-			quad["acceptable_sigma_buckling"][frame] = acceptable_sigma_buckling_y
-
-		if abs(sigmav) > safety_factor*quad["acceptable_sigma"]:
-			overstress = True
-
-		# Ausnutzungsgrad
-		utilization = abs(sigmav / quad["acceptable_sigma_buckling"][frame])
-
-		# vorerst noch weglassen
-		# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-		# Berechnung der strain_energy für Normalkraft
-		# normalkraft_energie = (long_stress**2)*(length_x)/(2*quad["E"]*A)
-
-		# Berechnung der strain_energy für Moment
-		# moment_hq = moment_x**2+moment_y**2
-		# moment_energie = (moment_hq * length_x) / (quad["E"] * Wy * thickness)
-
-		# Summe von Normalkraft und Moment-Verzerrunsenergie
-		# strain_energy = normalkraft_energie + moment_energie
-
-		# save to dict
-		quad["shear_x"][frame] = shear_x
-		quad["shear_y"][frame] = shear_y
-
-		quad["moment_x"][frame] = moment_x
-		quad["moment_y"][frame] = moment_y
-		quad["moment_xy"][frame] = moment_xy
-
-		quad["membrane_x"][frame] = membrane_x
-		quad["membrane_y"][frame] = membrane_y
-		quad["membrane_xy"][frame] = membrane_xy
-
-		quad["length_x"][frame] = length_x
-		quad["length_y"][frame] = length_y
-
-		quad["deflection"][frame] = deflection
-
-		quad["ir"][frame] = ir
-		quad["A"][frame] = A
-		#quad["J"][frame] = J
-		quad["Wy"][frame] = Wy
-		#quad["moment_h"][frame] = moment_h
-		#quad["long_stress"][frame] = long_stress
-		#quad["shear_h"][frame] = shear_h
-		#quad["tau_shear"][frame] = tau_shear
-		quad["sigmav"][frame] = sigmav
-		#quad["sigma"][frame] = quad["long_stress"][frame]
-
-		quad["s_x_1"][frame] = s_x_1
-		quad["s_x_2"][frame] = s_x_2
-		quad["s_y_1"][frame] = s_y_1
-		quad["s_y_2"][frame] = s_y_2
-		quad["T_xy_1"][frame] = T_xy_1
-		quad["T_xy_2"][frame] = T_xy_2
-
-		quad["s_1_1"][frame] = s_1_1
-		quad["s_2_1"][frame] = s_2_1
-		quad["s_1_2"][frame] = s_1_2
-		quad["s_2_2"][frame] = s_2_2
-
-		quad["alpha_1"][frame] = alpha_1
-		quad["alpha_2"][frame] = alpha_2
-
-		quad["overstress"][frame] = overstress
-		quad["utilization"][frame] = utilization
-
-		#quad["strain_energy"][frame] = strain_energy
-		#quad["normal_energy"][frame] = normalkraft_energie
-		#quad["moment_energy"][frame] = moment_energie
+		for j, quad in enumerate(quad_list):
+			for key, values in stresses.items():
+				quad[key][frame] = values[j]
 
 	# get duration
 	text = calculation_type + " involvement for frame " + str(frame) + " done"
@@ -2070,10 +1404,19 @@ def interweave_results_fd(frame):
 	phaenotyp = scene.phaenotyp
 	calculation_type = phaenotyp.calculation_type
 
+	# wait for this frame if mp is still running
+	receive_results(frame)
+
 	frame = str(frame)
-	model = basics.feas[frame]
+	results = basics.feas[frame] # arrays from mp.run_fea_fd
 	basics.timer.start()
 
+	forces = results["forces"].tolist()
+
+	# reactions of the supports
+	reactions = results["reactions"].tolist()
+	data["frames"][frame]["reactions"] = {str(id): reaction for id, reaction in zip(results["supports_ids"], reactions)}
+
 	for id, member in members.items():
 		id = int(id)
 		# shorten
@@ -2083,7 +1426,7 @@ def interweave_results_fd(frame):
 		acceptable_sigma = member["acceptable_sigma"]
 		L = member["length"][str(frame)] * 100
 
-		force = model[id]
+		force = forces[id]
 		sigma = force / A
 
 		# with 500 cm, Do 60, Di 50, -10 kN
@@ -2156,10 +1499,11 @@ def calculate_frames(start, end):
 	for frame in range(start, end):
 		basics.jobs.append([prepare_fea, frame])
 
-	# run mp and get results
+	# run mp, the results are streamed back while calculating
 	basics.jobs.append([run_mp, basics.models])
 
-	# wait for it and interweave results to data
+	# wait for every single frame and interweave results to data
+	# the first frames are available while mp is still running
 	for frame in range(start, end):
 		basics.jobs.append([interweave_results, frame])
 
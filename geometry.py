@@ -3,6 +3,7 @@ import bmesh
 from math import sqrt, radians, degrees, pi, atan2
 from phaenotyp import basics, operators, material
 from mathutils import Color, Vector, Matrix
+from numpy import add, arange, array, cross, cumsum, dot, empty, float32, inf, int32, linalg, newaxis, repeat, roll
 import os
 
 c = Color()
@@ -188,15 +189,28 @@ def delete_selected_faces():
 	#support_ids = selected_faces[0].vertices
 	bpy.ops.mesh.delete(type='EDGE_FACE')
 
-def volume(mesh):
+def volume(positions, faces):
 	'''
-	Volume of the structure via bmesh at current frame.
-	:param mesh: Mesh of the structure as basis.
+	Volume of the structure at current frame. The faces are split into
+	triangles around their first vertex, which span a tetrahedron each
+	with the origin.
+	:param positions: Positions of all vertices as (n, 3) array.
+	:param faces: Faces as returned by mesh_arrays.
 	:return frame_volume: Volume as float.
 	'''
-	bm = bmesh.new()
-	bm.from_mesh(mesh)
-	frame_volume = bm.calc_volume()
+	loop_start, loop_total, loop_vertices = faces
+
+	triangles = loop_total - 2
+	first = repeat(loop_start, triangles)
+
+	# second loop of each triangle, counted from the first loop of its face
+	second = first + 1 + arange(len(first)) - repeat(cumsum(triangles) - triangles, triangles)
+
+	p_0 = positions[loop_vertices[first]]
+	p_1 = positions[loop_vertices[second]]
+	p_2 = positions[loop_vertices[second + 1]]
+
+	frame_volume = abs(float((p_0 * cross(p_1, p_2)).sum())) / 6
 
 	return frame_volume
 
@@ -213,139 +227,256 @@ def area(faces):
 
 	return frame_area
 
-def area_projected(face, vertices):
+def area_of_faces(positions, faces):
+	'''
+	Area of the frame as overall sum of faces at current frame.
+	:param positions: Positions of all vertices as (n, 3) array.
+	:param faces: Faces as returned by mesh_arrays.
+	:return frame_area: Area as float.
+	'''
+	loop_start, loop_total, loop_vertices = faces
+
+	if len(loop_start) == 0:
+		return 0.0
+
+	# the next loop in each face, the last one is followed by the first
+	following = arange(len(loop_vertices)) + 1
+	following[loop_start + loop_total - 1] = loop_start
+
+	# twice the area as length of the normal (Newell's method)
+	co = positions[loop_vertices]
+	normals = add.reduceat(cross(co, co[following]), loop_start, axis=0)
+	frame_area = float(linalg.norm(normals, axis=1).sum()) / 2
+
+	return frame_area
+
+def area_projected(face, positions):
 	'''
 	Get projected area of a given face. Based on answer from Nikos Athanasiou:
 	https://stackoverflow.com/questions/24467972/calculate-area-of-polygon-given-x-y-coordinates
 	:param face: Face to work with.
-	:param vertices: Vertices of the face to work with.
+	:param positions: Positions of all vertices as (n, 3) array.
 	:return area_projected: Projected area as float.
 	'''
-	vertex_ids = face.vertices
-	vertices_temp = []
-	for vertex_id in vertex_ids:
-		vertex = vertices[vertex_id]
-		vertices_temp.append(vertex.co)
+	vertices_co = positions[list(face.vertices)]
+	x = vertices_co[:, 0]
+	y = vertices_co[:, 1]
 
-	n = len(vertices_temp)
-	a = 0.0
-	for i in range(n):
-		j = (i + 1) % n
-		v_i = vertices_temp[i]
-		v_j = vertices_temp[j]
+	a = dot(x, roll(y, -1)) - dot(roll(x, -1), y)
 
-		a += v_i[0] * v_j[1]
-		a -= v_j[0] * v_i[1]
-
-	area_projected = abs(a) / 2.0
+	area_projected = abs(float(a)) / 2.0
 
 	return area_projected
 
-def perimeter(edge_keys, vertices):
+def perimeter(edge_keys, positions):
 	'''
 	Get distances and perimeter of the given face.
 	:param edge_keys: Edge_keys from the face as list.
-	:param vertices: Vertices of the face.
+	:param positions: Positions of all vertices as (n, 3) array.
 	:return distances: Distance as list of floats.
 	:return perimeter: Perimeter as float.
 	'''
-	distances = []
-	for edge_key in edge_keys:
-		vertex_0_id = edge_key[0]
-		vertex_1_id = edge_key[1]
-
-		vertex_0_co = vertices[vertex_0_id].co
-		vertex_1_co = vertices[vertex_1_id].co
+	edge_keys = array(edge_keys)
 
-		dist_vector = vertex_0_co - vertex_1_co
-		dist = dist_vector.length
-		distances.append(dist)
+	dist_vectors = positions[edge_keys[:, 0]] - positions[edge_keys[:, 1]]
+	distances = linalg.norm(dist_vectors, axis=1).tolist()
 
 	perimeter = sum(distances)
 
 	return distances, perimeter
 
-def rise(vertices):
+def rise(positions):
 	'''
-	Rise of the structure as fitness. The function is iterating through
-	all vertices and returns the distance between the highest and lowest
-	point.
-	:param vertices: Vertices of the given structure.
+	Rise of the structure as fitness. Returns the distance between the
+	highest and lowest point. The ground at zero is always included.
+	:param positions: Positions of all vertices as (n, 3) array.
 	:return frame_rise: Rise as float
 	'''
-	highest = 0
-	lowest = 0
+	highest = positions[:, 2].max(initial=0)
+	lowest = positions[:, 2].min(initial=0)
 
-	for vertex in vertices:
-		z = vertex.co[2]
+	frame_rise = float(highest - lowest)
+	return frame_rise
 
-		# find highest
-		if z > highest:
-			highest = z
+def span(positions, supports):
+	'''
+	Span of the structure as fitness. Returns the highest distance
+	between all supports.
+	:param positions: Positions of all vertices as (n, 3) array.
+	:param supports: Supports of the given structure.
+	:return frame_span: Span as float
+	'''
+	supports_co = positions[[int(id) for id in supports]]
 
-		# find lowest
-		if z < lowest:
-			lowest = z
+	dist_v = supports_co[:, newaxis] - supports_co[newaxis]
+	dist = linalg.norm(dist_v, axis=2)
 
-	frame_rise = highest-lowest
-	return frame_rise
+	frame_span = float(dist.max(initial=0))
+	return frame_span
 
-def span(vertices, supports):
+def cantilever(positions, supports):
 	'''
-	Span of the structure as fitness. The function is iterating through
-	all vertices and returns the highest distance between all supports.
-	:param vertices: Vertices of the given structure.
+	Cantilever of the structure as fitness. Returns the highest distance
+	of all vertices to their closest support. Supports at the position of
+	the vertex itself are ignored.
+	:param positions: Positions of all vertices as (n, 3) array.
 	:param supports: Supports of the given structure.
-	:return frame_span: Span as float
+	:return frame_cantilever: Cantilever as float
 	'''
-	highest = 0
+	supports_co = positions[[int(id) for id in supports]]
 
-	for current in supports:
-		for other in supports:
-			if current != other:
-				current_co = vertices[int(current)].co
-				other_co = vertices[int(other)].co
+	dist_v = supports_co[newaxis] - positions[:, newaxis]
+	dist = linalg.norm(dist_v, axis=2)
+	dist[dist == 0] = inf
 
-				dist_v = other_co - current_co
-				dist = dist_v.length
+	to_closest_support = dist.min(axis=1, initial=inf)
+	frame_cantilever = float(to_closest_support.max(initial=0))
 
-				# find highest
-				if dist > highest:
-					highest = dist
+	# return 0 if there is only one support
+	if frame_cantilever == float('inf'):
+		frame_cantilever = 0
 
-	frame_span = highest
-	return frame_span
+	return frame_cantilever
 
-def cantilever(vertices, supports):
-	# get cantilever of frame
-	# (lowest distance from all vertices to all supports)
-	highest = 0
+def topology(structure_obj, members, quads):
+	'''
+	Is indexing the topology of the structure. The index is created when
+	members or quads are set and is used to prepare every frame without
+	searching through all members, quads and edges again.
+	:param structure_obj: Blender object of the structure.
+	:param members: Dict of all members.
+	:param quads: Dict of all quads.
+	:return topology: Dict with the sorted ids of the vertices used by members
+	or quads as "nodes", the ids of members and quads at each vertex as
+	"incidence" and the id of each edge by its key as "edges".
+	'''
+	incidence = {}
 
-	for vertex in vertices:
-		to_closest_support = float('inf')
-		for support in supports:
-			vertex_co = vertex.co
-			support_co = vertices[int(support)].co
+	for id, member in members.items():
+		for vertex_id in [member["vertex_0_id"], member["vertex_1_id"]]:
+			node = incidence.setdefault(str(vertex_id), {"members": [], "quads": []})
+			node["members"].append(int(id))
 
-			if vertex_co != support_co:
-				dist_v = support_co - vertex_co
-				dist = dist_v.length
+	for id, quad in quads.items():
+		for vertex_id in quad["vertices_ids_structure"]:
+			node = incidence.setdefault(str(vertex_id), {"members": [], "quads": []})
+			node["quads"].append(int(id))
 
-				# find highest
-				if dist < to_closest_support:
-					to_closest_support = dist
+	# edge_keys of the faces are sorted like the keys of the edges
+	edges = {}
+	for edge in structure_obj.data.edges:
+		key = edge.key
+		edges[str(key[0]) + "_" + str(key[1])] = edge.index
 
-		# find highest
-		if to_closest_support > highest:
-			highest = to_closest_support
+	topology = {
+		"nodes": sorted(int(vertex_id) for vertex_id in incidence),
+		"incidence": incidence,
+		"edges": edges
+		}
 
-	frame_cantilever = highest
+	return topology
 
-	# return 0 if there is only one support
-	if frame_cantilever == float('inf'):
-		frame_cantilever = 0
+def shape_keys_only(structure_obj):
+	'''
+	Checks if the vertices of the structure are only changed by shape-keys.
+	Modifiers, constraints, parents, animation and drivers need the
+	evaluation of the depsgraph. Relative shape-keys can be mixed directly.
+	:param structure_obj: Blender object of the structure.
+	:return: True if the positions can be mixed from the shape-keys.
+	'''
+	if structure_obj.modifiers or structure_obj.constraints or structure_obj.parent:
+		return False
 
-	return frame_cantilever
+	shape_keys = structure_obj.data.shape_keys
+
+	for id_data in [structure_obj, structure_obj.data, shape_keys]:
+		animation_data = getattr(id_data, "animation_data", None)
+		if animation_data and (animation_data.action or animation_data.drivers):
+			return False
+
+	if shape_keys:
+		if not shape_keys.use_relative or structure_obj.show_only_shape_key:
+			return False
+
+		reference_key = shape_keys.reference_key
+		for key_block in shape_keys.key_blocks[1:]:
+			if key_block.relative_key != reference_key or key_block.vertex_group:
+				return False
+
+	return True
+
+def mesh_arrays(mesh):
+	'''
+	Is reading the coordinates and the faces of the mesh as arrays.
+	:param mesh: Mesh to read.
+	:return co: Local coordinates of the vertices as (n, 3) array.
+	:return faces: The first loop and the amount of loops of each face and
+	the vertex of each loop as arrays.
+	'''
+	co = empty(len(mesh.vertices)*3, dtype=float32)
+	mesh.vertices.foreach_get("co", co)
+
+	loop_start = empty(len(mesh.polygons), dtype=int32)
+	loop_total = empty(len(mesh.polygons), dtype=int32)
+	loop_vertices = empty(len(mesh.loops), dtype=int32)
+	mesh.polygons.foreach_get("loop_start", loop_start)
+	mesh.polygons.foreach_get("loop_total", loop_total)
+	mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+	faces = (loop_start, loop_total, loop_vertices)
+
+	return co.reshape(-1, 3).astype(float), faces
+
+def shape_key_co(key_block):
+	'''
+	Is reading the coordinates of a shape-key as array.
+	:param key_block: The shape-key.
+	:return co: Local coordinates of the shape-key as (n, 3) array.
+	'''
+	co = empty(len(key_block.data)*3, dtype=float32)
+	key_block.data.foreach_get("co", co)
+
+	return co.reshape(-1, 3).astype(float)
+
+def vertex_positions(structure_obj):
+	'''
+	Is returning the positions of all vertices in world space. If the
+	structure is only changed by shape-keys, the positions are mixed from
+	the basis and the weighted difference of each key. The depsgraph is
+	only evaluated for modifiers, animation et cetera.
+	:param structure_obj: Blender object of the structure.
+	:return positions: Positions of all vertices in m as (n, 3) array.
+	:return faces: Faces as returned by mesh_arrays.
+	'''
+	if shape_keys_only(structure_obj):
+		mesh = structure_obj.data
+		co, faces = mesh_arrays(mesh)
+
+		shape_keys = mesh.shape_keys
+		if shape_keys:
+			basis = shape_key_co(shape_keys.reference_key)
+			co = basis.copy()
+			for key_block in shape_keys.key_blocks[1:]:
+				if not key_block.mute and key_block.value != 0:
+					co += key_block.value * (shape_key_co(key_block) - basis)
+
+		matrix = array(structure_obj.matrix_world)
+
+	else:
+		bpy.context.view_layer.update()
+		dg = bpy.context.evaluated_depsgraph_get()
+		obj = structure_obj.evaluated_get(dg)
+
+		mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
+		co, faces = mesh_arrays(mesh)
+		matrix = array(obj.matrix_world)
+		obj.to_mesh_clear()
+
+	# like suggested here by Gorgious and CodeManX, but for all at once:
+	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
+	positions = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+	return positions, faces
 
 def set_shape_keys(shape_keys, chromosome):
 	for id, key in enumerate(shape_keys):
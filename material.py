@@ -2,6 +2,7 @@ import warnings # to ignore poly1d or polyfit warnings
 warnings.filterwarnings('ignore')
 
 from math import pi, sqrt
+from numpy import poly1d, polyfit
 
 # Material properties:
 # https://www.johannes-strommer.com/formeln/flaechentraegheitsmoment-widerstandsmoment/
@@ -50,6 +51,24 @@ masonry_old = [0.4, 0.38, 0.37, 0.36, 0.34, 0.33, 0.31, 0.29, 0.26, 0.23, 0.20,
 masonry_new = [1.0, 0.96, 0.93, 0.90, 0.86, 0.82, 0.77, 0.72, 0.65, 0.58, 0.50, 0.42, 0.36, 0.31, 0.27, 0.24, 0.21, 0.19, 0.16, 0.15, 0.13, 0.12, 0.12, 0.10, 0.10]
 kncustom = [16.5,15.8,15.3,14.8,14.2,13.5,12.7,11.8,10.7,9.5,8.2,6.9,5.9,5.1,4.4,3.9,3.4,3.1,2.7,2.5,2.2,2,1.9,1.7,1.6]
 
+# polynomials of 6th order fitted to the buckling curves, with the curve as key
+# the curves of the library are fitted once at import, custom curves with the first use
+knick_polynomials = {}
+
+def knick_polynomial(knick_model):
+	'''
+	Returns the polynomial fitted to a buckling curve.
+	:param knick_model: Buckling curve with a value for each entry of kn_lamda.
+	:return polynomial: numpy.poly1d, can be evaluated for a single lamda or an array of lamdas.
+	'''
+	key = tuple(knick_model)
+	polynomial = knick_polynomials.get(key)
+	if polynomial is None:
+		polynomial = poly1d(polyfit(kn_lamda, knick_model, 6))
+		knick_polynomials[key] = polynomial
+
+	return polynomial
+
 library = [
 	# name, name in dropdown, E, G, d, acceptable_sigma, acceptable_shear, acceptable_torsion, acceptable_sigmav, knick_model
 	# diese gelten nach ÖNORM B 4600 für den Erhöhungsfall und entsprechen 100 % beim Knicken (lamda<20)
@@ -297,6 +316,10 @@ for material in library_quads:
 # (because a property can not be set in gui)
 current_quads = {}
 
+# fit the buckling curves of the library once
+for material in library + library_quads:
+	knick_polynomial(material[-1])
+
 profiles = [
 	#  0 = ID
 	#  1 = Name
@@ -1,8 +1,7 @@
 # coding-utf8
-from multiprocessing import Manager, Value, cpu_count, Pool
-from numpy import array, empty, append, poly1d, polyfit, linalg, zeros, intersect1d
-from math import sqrt
-from math import tanh
+from multiprocessing import cpu_count, Pool
+from numpy import array, linalg, zeros
+from numpy import add, arange, concatenate, flatnonzero, full, isfinite, newaxis, repeat, searchsorted, unique
 
 import sys
 from time import time
@@ -17,11 +16,23 @@ currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentfram
 parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir)
 from Pynite import FEModel3D
+from Pynite import Solvers
+from Pynite.Member3D import Member3D
+from Pynite.Quad3D import Quad3D
 
 import pickle
+import json
+import tempfile
+import traceback
 import gc
 gc.disable()
 
+try:
+	from multiprocessing import shared_memory, resource_tracker
+	shared_memory_available = True
+except ImportError:
+	shared_memory_available = False
+
 def print_data(text):
 	"""
 	Print data for debugging
@@ -29,30 +40,207 @@ def print_data(text):
 	"""
 	print("Phaenotyp |", text)
 
-# get arguments
-directory_blend = sys.argv[1]
-path_import = directory_blend + "/Phaenotyp-export_mp.p"
-scipy_available = sys.argv[2]
-calculation_type = sys.argv[3]
+# line printed by the daemon for every calculated frame
+# followed by the frame and the location of the result as json
+frame_done = "Phaenotyp | frame done"
+
+# line printed by the daemon when all frames of a batch are done
+batch_done = "Phaenotyp | batch done"
+
+# tolerance of lsmr for grids of force distribution with more or fewer edges than equations
+lsmr_tol = 1e-12
+
+# largest number of linear frames in one chunk
+# larger chunks are sharing more factorizations
+# smaller chunks are passed back to blender earlier
+linear_chunk = 8
+
+# solver backends of this process by name and ordering
+# auto is keeping the fastest backend it found for the next frames
+worker_solvers = {}
+
+def get_solver(solver, permc_spec):
+	"""
+	Get the sparse solver backend chosen in the panel.
+	:param solver: Name of the backend in Pynite.Solvers.
+	:param permc_spec: Ordering of superlu, is ignored by the other backends.
+	:return: Returns the backend.
+	"""
+	if (solver, permc_spec) in worker_solvers:
+		return worker_solvers[(solver, permc_spec)]
+
+	name = solver
+
+	# cholmod needs scikit-sparse, which is not part of blender
+	if name not in Solvers.available():
+		print_data(name + " is not available, using superlu instead")
+		name = "superlu"
+
+	if name == "superlu":
+		backend = Solvers.get(name, permc_spec=permc_spec)
+	else:
+		backend = Solvers.get(name)
+
+	worker_solvers[(solver, permc_spec)] = backend
+	return backend
+
+# open shared memory blocks of this process by name
+blocks = {}
+blocks_created = 0
+
+def unique_name():
+	"""
+	Create a name for a shared memory block or temp file.
+	The pid keeps several blender instances and the daemon apart.
+	The name is short because macOS allows only 31 characters.
+	:return name: Returns the name as string.
+	"""
+	global blocks_created
+	blocks_created += 1
+	return "Phaenotyp_" + str(os.getpid()) + "_" + str(blocks_created)
+
+def write_payload(payload, name):
+	"""
+	Pass the payload to another process without writing next to the blend file.
+	The payload is pickled into shared memory. If shared memory is not
+	available, a file in the temp directory is used instead.
+	The block or file is kept until release_payload is called by this process.
+	:param payload: Needs the object to pass.
+	:param name: Needs a unique name from unique_name.
+	:return location: Returns [transport, name, size] to pass to read_payload.
+	"""
+	data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+	return write_bytes(data, name)
 
-# start timer
-start_time = time()
+def write_bytes(data, name):
+	"""
+	Pass pickled data to another process like write_payload.
+	:param data: Needs the pickled object as bytes.
+	:param name: Needs a unique name from unique_name.
+	:return location: Returns [transport, name, size] to pass to read_payload or read_bytes.
+	"""
+	size = len(data)
 
-def import_models():
-	# get models stored as dict with frame as key
-	file = open(path_import, 'rb')
-	imported_models = pickle.load(file)
+	if shared_memory_available:
+		try:
+			block = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+			block.buf[:size] = data
+			blocks[name] = block
+			return ["shm", name, size]
+
+		except Exception:
+			print_data("shared memory failed, using temp file instead")
+
+	path = os.path.join(tempfile.gettempdir(), name + ".p")
+	file = open(path, 'wb')
+	file.write(data)
 	file.close()
 
-	return imported_models
+	return ["file", path, size]
+
+def read_payload(location):
+	"""
+	Read the payload written by another process with write_payload.
+	:param location: Needs [transport, name, size] from write_payload.
+	:return payload: Returns the unpickled object.
+	"""
+	return pickle.loads(read_bytes(location))
+
+def read_bytes(location):
+	"""
+	Read the pickled data written by another process without unpickling it.
+	:param location: Needs [transport, name, size] from write_payload or write_bytes.
+	:return data: Returns the pickled object as bytes.
+	"""
+	transport, name, size = location
+
+	if transport == "shm":
+		block = shared_memory.SharedMemory(name=name)
+		data = bytes(block.buf[:size])
+		block.close()
+
+		# the block is owned by the writing process
+		# avoid that the tracker of this process is unlinking it on exit
+		if os.name == "posix":
+			resource_tracker.unregister(block._name, "shared_memory")
+
+	else:
+		file = open(name, 'rb')
+		data = file.read()
+		file.close()
+
+	return data
 
-# run one single fea and save result into feas (multiprocessing manager dict)
-def run_fea_pn(scipy_available, calculation_type, feas, model, frame):
+def release_payload(location):
+	"""
+	Free the shared memory block or delete the temp file of write_payload.
+	Is called by the writing process when the other process has read the payload.
+	:param location: Needs [transport, name, size] from write_payload.
+	"""
+	transport, name, size = location
+
+	if transport == "shm":
+		block = blocks.pop(name)
+		block.close()
+		block.unlink()
+
+	else:
+		os.remove(name)
+
+# location and pickled model of the template read by this worker
+worker_template = [None, None]
+
+def model_from_template(location, patch):
+	"""
+	Create the model of a frame from the template of the structure.
+	The template is read once by every worker and unpickled for each frame.
+	:param location: Location of the template from calculation.pass_template_pn.
+	:param patch: Values of the frame from calculation.prepare_fea_pn.
+	:return model: Returns the FEModel3D of the frame.
+	"""
+	global worker_template
+
+	if worker_template[0] != location:
+		worker_template = [location, read_bytes(location)]
+
+	model = pickle.loads(worker_template[1])
+
+	# the patch has to be prepared for the structure of the template
+	sizes = [
+		(len(model.nodes), len(patch["nodes"])),
+		(len(model.sections), len(patch["sections"])),
+		(len(model.members), len(patch["angles"])),
+		(len(model.quads), len(patch["thickness"]))
+		]
+	if any(expected != given for expected, given in sizes):
+		raise ValueError("The frame does not match the template of the structure: " + str(sizes))
+
+	for node, (x, y, z) in zip(model.nodes.values(), patch["nodes"]):
+		node.X, node.Y, node.Z = x, y, z
+
+	for section, (A, Iy, Iz, J) in zip(model.sections.values(), patch["sections"]):
+		section.A, section.Iy, section.Iz, section.J = A, Iy, Iz, J
+
+	for member, angle in zip(model.members.values(), patch["angles"]):
+		member.rotation = angle
+
+	for quad, t in zip(model.quads.values(), patch["thickness"]):
+		quad.t = t
+
+	for load in patch["node_loads"]:
+		model.add_node_load(*load)
+
+	for load in patch["member_loads"]:
+		model.add_member_dist_load(*load)
+
+	return model
+
+# run one single fea and return the result
+def run_fea_pn(scipy_available, calculation_type, solver, pdelta_solver, pdelta_tol, model, frame):
 	# the variables model, and frame are passed to mp
-	# this variables can not be returned with multiprocessing
-	# instead of this a dict with multiprocessing.Manager is created
-	# the dict feas stores one anlysis for each frame
-	# the dict fea is created temporarily in run_fea and is wirrten to feas
+	# the result is returned to the pool directly
+	# and collected in the main process with imap_unordered
 	# analyze the model
 	
 	# start time
@@ -60,13 +248,16 @@ def run_fea_pn(scipy_available, calculation_type, feas, model, frame):
 	
 	if scipy_available == "True":
 		if calculation_type == "first_order":
-			model.analyze(check_statics=False, sparse=True)
+			model.analyze(check_statics=False, sparse=True, solver=solver)
 
 		elif calculation_type == "first_order_linear":
-			model.analyze_linear(check_statics=False, sparse=True)
+			model.analyze_linear(check_statics=False, sparse=True, solver=solver)
 
+		# the elastic stiffness is factorized once and used as preconditioner
+		# of the iterative solver for the geometric stiffness
 		else:
-			model.analyze_PDelta(check_stability=False, sparse=True)
+			iterative = None if pdelta_solver == "direct" else pdelta_solver
+			model.analyze_PDelta(check_stability=True, sparse=True, iterative=iterative, tol=pdelta_tol, solver=solver)
 
 	if scipy_available == "False":
 		if calculation_type == "first_order":
@@ -76,18 +267,149 @@ def run_fea_pn(scipy_available, calculation_type, feas, model, frame):
 			model.analyze_linear(check_statics=False, sparse=False)
 
 		else:
-			model.analyze_PDelta(check_stability=False, sparse=False)
-
-	feas[str(frame)] = model
+			model.analyze_PDelta(check_stability=True, sparse=False)
 
 	# get duration
 	elapsed = time() - start_time
 	text = calculation_type + " calculation for frame " + str(frame) + " done"
+
+	# iterations and largest residual of the iterative p-delta solver
+	steps = [step for steps in model.PDelta_iterations.values() for step in steps]
+	if len(steps) > 0:
+		text += " | " + pdelta_solver + " iterations: " + str(sum(step[0] for step in steps))
+		text += ", residual: " + "{:.1e}".format(max(step[1] for step in steps))
+
+		# steps the iterative solver did not converge for are solved directly
+		fallbacks = sum(step[2] for step in steps)
+		if fallbacks > 0:
+			text += ", not converged and solved directly: " + str(fallbacks)
+
 	text +=  " | " + str(timedelta(seconds=elapsed))
 	print_data(text)
 	sys.stdout.flush()
 
-def run_fea_fd(feas, model, frame):
+	return pack_results_pn(model)
+
+def pack_results_pn(model):
+	"""
+	Extract the results needed by interweave_results_pn from the solved model.
+	Only arrays are returned to avoid pickling the whole model back to blender.
+	:param model: Needs a solved FEModel3D.
+	:return results: Returns the results as dict of numpy arrays.
+	"""
+	n_stations = 11
+
+	# members
+	# forces are axial, Fy, Fz, My, Mz, torque at the stations
+	# deflections are dx, dy, dz in local coordinates at the stations
+	member_ids = list(model.members.keys())
+	members = list(model.members.values())
+	n_members = len(member_ids)
+	member_lengths = array([member.L() for member in members])
+	member_i_nodes = array([[member.i_node.X, member.i_node.Y, member.i_node.Z] for member in members]).reshape(n_members, 3)
+
+	# transformation matrices and end forces of all members at once
+	T = Member3D.T_batch(members)
+	member_cosines = T[:, 0:3, 0:3]
+	member_local_forces = Member3D.f_batch(members, T=T)
+
+	# all forces and deflections at the stations of all members with one call
+	member_results = model.member_results(n_points=n_stations)
+	member_forces = member_results[:, 0:6]
+	member_deflections = member_results[:, 6:9]
+
+	# nodes
+	# displacements are DX, DY, DZ, RX, RY, RZ in global coordinates
+	node_ids = list(model.nodes.keys())
+	node_displacements = zeros((len(node_ids), 6))
+
+	for i, id in enumerate(node_ids):
+		node = model.nodes[id]
+		node_displacements[i] = [
+			node.DX["Combo 1"], node.DY["Combo 1"], node.DZ["Combo 1"],
+			node.RX["Combo 1"], node.RY["Combo 1"], node.RZ["Combo 1"]
+			]
+
+	# quads
+	# results are Qx, Qy, Mx, My, Mxy, Sx, Sy, Txy at the center
+	quad_ids = list(model.quads.keys())
+	quad_results = Quad3D.results_batch(list(model.quads.values()))
+
+	results = {
+		"member_ids": member_ids,
+		"member_lengths": member_lengths,
+		"member_cosines": member_cosines,
+		"member_i_nodes": member_i_nodes,
+		"member_local_forces": member_local_forces,
+		"member_forces": member_forces,
+		"member_deflections": member_deflections,
+		"node_ids": node_ids,
+		"node_displacements": node_displacements,
+		"quad_ids": quad_ids,
+		"quad_results": quad_results
+		}
+
+	return results
+
+def solve_equilibrium(scipy_available, row, col, value, shape, b):
+	"""
+	Solve the equilibrium of force distribution A @ F = b for the forces F of the edges.
+	Grids with as many edges as equations are solved directly. Statically indeterminate
+	grids with more edges get the forces with the smallest norm, grids with fewer edges
+	the forces with the smallest residual.
+	:param scipy_available: Sparse matrices are used if "True", dense numpy arrays otherwise.
+	:param row: Row of each term of A.
+	:param col: Column of each term of A.
+	:param value: Value of each term of A.
+	:param shape: Shape of A as amount of equations and edges.
+	:param b: Right hand side.
+	:return F: Returns the forces of the edges.
+	"""
+	n_equation, n_edges = shape
+
+	# edges between two supports are not part of the equilibrium and keep a force of zero
+	edges = unique(col)
+	col = searchsorted(edges, col)
+	shape = (n_equation, len(edges))
+
+	if scipy_available == "True":
+		from scipy.sparse import coo_matrix
+		from scipy.sparse.linalg import spsolve, lsmr
+
+		A = coo_matrix((value, (row, col)), shape=shape).tocsc()
+
+		if n_equation == len(edges):
+			F = spsolve(A, b)
+
+		# statically indeterminate grids get the smallest norm, the others the smallest residual
+		# lsmr is solving both without squaring the condition of A as the normal equations do
+		else:
+			F = lsmr(A, b, atol=lsmr_tol, btol=lsmr_tol, maxiter=10*max(shape))[0]
+
+	else:
+		A = zeros(shape)
+		add.at(A, (row, col), value)
+
+		if n_equation == len(edges):
+			F = linalg.solve(A, b)
+		else:
+			F = linalg.lstsq(A, b, rcond=None)[0]
+
+	# spsolve is returning nan for singular matrices instead of raising
+	if not isfinite(F).all():
+		raise linalg.LinAlgError("Singular matrix, the grid is not stable")
+
+	forces = zeros(n_edges)
+	forces[edges] = F
+
+	return forces
+
+def run_fea_fd(scipy_available, calculation_type, model, frame):
+	"""
+	Run a force distribution of one frame.
+	:param model: Needs points_array, supports_ids, edges_array and forces_array as list.
+	:return results: Returns the forces of the edges and the reactions of the supports as dict of arrays.
+	"""
 	# based on:
 	# Oliver Natt
 	# Physik mit Python
@@ -106,43 +428,47 @@ def run_fea_fd(feas, model, frame):
 	edges_array = model[2]
 	forces_array = model[3]
 
-	# amount of points, edges, supports, verts
+	# amount of points, edges
 	n_points_array = points_array.shape[0]
 	n_edges_array = edges_array.shape[0]
-	n_supports = len(supports_ids)
-	n_verts = n_points_array - n_supports
-	n_equation = n_verts * dim
 
 	# create list of indicies
-	verts_id = list(set(range(n_points_array)) - set(supports_ids))
+	is_support = zeros(n_points_array, dtype=bool)
+	is_support[array(supports_ids, dtype=int)] = True
+	verts_id = flatnonzero(~is_support)
+	n_equation = len(verts_id) * dim
 
-	def vector(vertices, edge):
-		v_0, v_1 = edges_array[edge]
-		if vertices == v_0:
-			vec = points_array[v_1] - points_array[v_0]
-		else:
-			vec = points_array[v_0] - points_array[v_1]
-		return vec / linalg.norm(vec)
+	# first equation of each vertex, supports have no equations
+	first_row = full(n_points_array, -1)
+	first_row[verts_id] = arange(len(verts_id)) * dim
 
+	# unit vectors of the edges, pointing from the first to the second vertex
+	v_0 = edges_array[:, 0]
+	v_1 = edges_array[:, 1]
+	vectors = points_array[v_1] - points_array[v_0]
+	vectors = vectors / linalg.norm(vectors, axis=1)[:, newaxis]
 
 	# create equation
-	model = zeros((n_equation, n_equation))
-	for id, edge in enumerate(edges_array):
-		for k in intersect1d(edge, verts_id):
-			n = verts_id.index(k)
-			model[n * dim:(n + 1) * dim, id] = vector(k, id)
+	# the force of an edge is pulling its first vertex towards the second one and vice versa
+	ends = concatenate((v_0, v_1))
+	ends_edge = concatenate((arange(n_edges_array), arange(n_edges_array)))
+	ends_vector = concatenate((vectors, -vectors))
+	free = first_row[ends] >= 0
+
+	row = (first_row[ends[free]][:, newaxis] + arange(dim)).reshape(-1)
+	col = repeat(ends_edge[free], dim)
+	value = ends_vector[free].reshape(-1)
 
 	# Löse das Gleichungssystem A @ F = -forces_array nach den Kräften F.
 	b = -forces_array[verts_id].reshape(-1)
-	F = linalg.solve(model, b)
+	F = solve_equilibrium(scipy_available, row, col, value, (n_equation, n_edges_array), b)
 
 	# Berechne die äußeren Kräfte.
-	for id, edge in enumerate(edges_array):
-		for k in intersect1d(edge, supports_ids):
-			forces_array[k] -= F[id] * vector(k, id)
+	# the forces of all edges are scattered to their supported ends at once
+	supported = is_support[ends]
+	reactions = forces_array.copy()
+	add.at(reactions, ends[supported], -F[ends_edge[supported], newaxis] * ends_vector[supported])
 
-	feas[str(frame)] = F
-	
 	# get duration
 	elapsed = time() - start_time
 	text = calculation_type + " calculation for frame " + str(frame) + " done"
@@ -150,55 +476,208 @@ def run_fea_fd(feas, model, frame):
 	print_data(text)
 	sys.stdout.flush()
 
-def mp_pool():
-	global scipy_available
+	results = {
+		"forces": F,
+		"supports_ids": list(supports_ids),
+		"reactions": reactions[array(supports_ids, dtype=int)]
+		}
 
-	manager = Manager() # needed for mp
-	feas = manager.dict() # is saving all calculations by frame
+	return results
 
-	cores = cpu_count()
-	'''
-	text = "rendering with " + str(cores) + " cores."
+def run_fea_pn_linear(scipy_available, calculation_type, solver, models, frames):
+	"""
+	Run a linear fea for a chunk of frames at once.
+	Frames with the same stiffness, as in animations of loads only,
+	are sharing one factorization of the stiffness matrix.
+	Unstable frames are missing in the results,
+	the other frames of the chunk are calculated anyway.
+	:return: Returns a list of frame as string and the result.
+	"""
+	# start time
+	start_time = time()
+
+	try:
+		if scipy_available == "True":
+			factorizations = FEModel3D.analyze_linear_batch(models, check_statics=False, sparse=True, solver=solver)
+		else:
+			factorizations = FEModel3D.analyze_linear_batch(models, check_statics=False, sparse=False)
+
+		text = " with " + str(factorizations) + " factorization(s)"
+
+	except Exception:
+		traceback.print_exc()
+		text = " with unstable frames"
+
+	# get duration
+	elapsed = time() - start_time
+	text = calculation_type + " calculation for frames " + str(frames[0]) + " to " + str(frames[-1]) + " done" + text
+	text +=  " | " + str(timedelta(seconds=elapsed))
 	print_data(text)
-	'''
+	sys.stdout.flush()
 
-	pool = Pool(processes=cores)
+	results = []
+	for model, frame in zip(models, frames):
+		if model.solution is not None:
+			results.append((str(frame), pack_results_pn(model)))
 
-	# for PyNite
-	if calculation_type != "force_distribution":
-		for frame, model in imported_models.items():
-			pool.apply_async(run_fea_pn, args=(scipy_available, calculation_type, feas, model, frame,))
+	return results
+
+def run_fea(task):
+	"""
+	Run the fea of one frame or a chunk of frames in the pool.
+	:param task: Needs scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template, model and frame as tuple.
+	For chunks model and frame are lists. For PyNite model is the patch of the template.
+	:return: Returns a list of frame as string and the result.
+	"""
+	results = calculate_task(task)
+
+	# the models are referencing each other (nodes, members, model)
+	# the workers inherit the disabled gc, therefore the cycles of the
+	# models of this task are collected by hand after they are released
+	gc.collect()
+
+	return results
+
+def calculate_task(task):
+	"""
+	Calculate the frame or the chunk of frames of a task for run_fea.
+	:param task: Needs the task of run_fea.
+	:return: Returns a list of frame as string and the result.
+	"""
+	scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template, model, frame = task
+
+	try:
+		if scipy_available == "True":
+			solver = get_solver(solver, permc_spec)
+
+		# create the models of PyNite from the template
+		if template is not None:
+			if calculation_type == "first_order_linear":
+				model = [model_from_template(template, patch) for patch in model]
+			else:
+				model = model_from_template(template, model)
+
+		# for PyNite with linear chunks
+		if calculation_type == "first_order_linear":
+			return run_fea_pn_linear(scipy_available, calculation_type, solver, model, frame)
+
+		# for PyNite
+		elif calculation_type != "force_distribution":
+			result = run_fea_pn(scipy_available, calculation_type, solver, pdelta_solver, pdelta_tol, model, frame)
+
+		# for force distribution
+		else:
+			result = run_fea_fd(scipy_available, calculation_type, model, frame)
+
+	except Exception:
+		# the frames are missing in the results
+		# but the other frames of the batch are calculated anyway
+		traceback.print_exc()
+		sys.stdout.flush()
+		return []
+
+	return [(str(frame), result)]
+
+def mp_pool(pool, imported_models, scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template):
+	"""
+	Calculate the models with the pool.
+	Is yielding frame and result in the order the frames are finished.
+	The pool is not closed to be used for the next batch.
+	"""
+	tasks = []
+
+	# linear frames are passed in chunks of neighbouring frames
+	# they are likely to share the same stiffness
+	# the chunks are small enough to pass the frames back while running
+	if calculation_type == "first_order_linear":
+		frames = list(imported_models.keys())
+		size = -(-len(frames) // cpu_count()) # rounded up
+		size = max(1, min(size, linear_chunk))
+		for i in range(0, len(frames), size):
+			chunk = frames[i:i+size]
+			models = [imported_models[frame] for frame in chunk]
+			tasks.append((scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template, models, chunk))
 
-	# for force distribution
 	else:
 		for frame, model in imported_models.items():
-			pool.apply_async(run_fea_fd, args=(feas, model, frame,))
+			tasks.append((scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template, model, frame))
 
-	pool.close()
-	pool.join()
+	for results in pool.imap_unordered(run_fea, tasks):
+		for frame, result in results:
+			yield frame, result
 
-	return feas
+def run_batch(pool, returned, location, scipy_available, calculation_type, solver="superlu", permc_spec="MMD_AT_PLUS_A", pdelta_solver="gmres", pdelta_tol=1e-8, template=None):
+	"""
+	Calculate the models passed by blender.
+	Every frame is passed back to blender as soon as it is done.
+	:param returned: List to append the locations of the results to.
+	:param location: Location of the models from write_payload.
+	:param solver: Name of the sparse solver in Pynite.Solvers.
+	:param permc_spec: Ordering of superlu.
+	:param pdelta_solver: Iterative solver of second order, cg, gmres or direct.
+	:param pdelta_tol: Relative residual of the iterative solver.
+	:param template: Location of the template if the models are patches of it.
+	"""
+	imported_models = read_payload(location)
 
-def export_models():
-	# export back to blender
-	path_export = directory_blend + "/Phaenotyp-return_mp.p"
-	file = open(path_export, 'wb')
-	pickle.dump(dict(feas), file) # use dict() to convert mp_dict to dict
-	file.close()
+	for frame, result in mp_pool(pool, imported_models, scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template):
+		frame_location = write_payload(result, unique_name())
+		returned.append(frame_location)
+
+		print(frame_done, json.dumps([frame, frame_location]))
+		sys.stdout.flush()
+
+	# the models are referencing each other (nodes, members, model)
+	# gc is disabled, therefore the cycles need to be collected by hand
+	# otherwise the daemon is growing with every batch
+	del imported_models
+	gc.collect()
+
+def init_worker():
+	"""
+	The workers print their progress to stderr.
+	Stdout is reserved for the lines of the daemon to blender.
+	"""
+	sys.stdout = sys.stderr
+
+def run_daemon():
+	"""
+	Keep the pool alive and wait for batches from blender.
+	Every line on stdin is a command as json list:
+	["run", location, scipy_available, calculation_type, solver, permc_spec, pdelta_solver, pdelta_tol, template] or ["quit"]
+	"""
+	pool = Pool(processes=cpu_count(), initializer=init_worker)
+
+	# results of the last batch
+	returned = []
+
+	for line in sys.stdin:
+		command = json.loads(line)
+
+		# blender has read the last results with sending the next command
+		for location in returned:
+			release_payload(location)
+		returned = []
+
+		if command[0] == "run":
+			try:
+				run_batch(pool, returned, *command[1:])
+			except Exception:
+				# keep the daemon running for the next batch
+				traceback.print_exc()
+
+			print(batch_done)
+			sys.stdout.flush()
+
+		elif command[0] == "quit":
+			break
+
+	pool.close()
+	pool.join()
 
 if __name__ == "__main__":
-	imported_models = import_models()
-	feas = mp_pool()
-	export_models()
-	# give feedback to user
-	end_time = time()
-
-	# print only frames to make progress.http work correctly
-	'''
-	elapsed_time = end_time - start_time
-	text = "time elapsed: " + str(elapsed_time) + " s"
-	print_data(text)
-	'''
+	# run as daemon started from blender
+	run_daemon()
 
 	# exit
 	sys.exit()
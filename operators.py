@@ -950,6 +950,9 @@ def set_support():
 			# create one mesh for all
 			geometry.create_supports(data["structure"], data["supports"])
 
+			# the template of PyNite is created again with the next calculation
+			calculation.invalidate_template()
+
 		# leave signs of support, structure and go to edit-mode
 		# (in order to let the user define more supports)
 		bpy.ops.object.mode_set(mode="OBJECT")
@@ -1164,6 +1167,10 @@ def set_member():
 	# create one mesh for all
 	geometry.create_members(data["structure"], data["members"])
 
+	# index the topology to prepare every frame without searching
+	data["topology"] = geometry.topology(data["structure"], data["members"], data["quads"])
+	calculation.invalidate_template()
+
 	# leave membersand go to edit-mode
 	# (in order to let the user define more supports)
 	bpy.ops.object.mode_set(mode="OBJECT")
@@ -1297,6 +1304,10 @@ def set_quad():
 	geometry.create_quads(data["structure"], data["quads"])
 	geometry.create_stresslines(data["structure"], data["quads"])
 
+	# index the topology to prepare every frame without searching
+	data["topology"] = geometry.topology(data["structure"], data["members"], data["quads"])
+	calculation.invalidate_template()
+
 	# leave membersand go to edit-mode
 	# (in order to let the user define more supports)
 	bpy.ops.object.mode_set(mode="OBJECT")
@@ -3085,6 +3096,10 @@ def reset():
 	except:
 		pass
 
+	# stop the solver, is started again with the next calculation
+	calculation.stop_daemon()
+	calculation.invalidate_template()
+
 	# create / recreate data
 	basics.create_data()
 
@@ -219,6 +219,16 @@ def scipy(layout):
 				box_scipy.label(text = "Sparse matrix:")
 				box_scipy.prop(phaenotyp, "use_scipy", text="Use scipy")
 
+				if phaenotyp.use_scipy:
+					box_scipy.prop(phaenotyp, "solver", text="Solver")
+					if phaenotyp.solver == "superlu":
+						box_scipy.prop(phaenotyp, "permc_spec", text="Ordering")
+
+					if phaenotyp.calculation_type == "second_order":
+						box_scipy.prop(phaenotyp, "pdelta_solver", text="P-Delta")
+						if phaenotyp.pdelta_solver != "direct":
+							box_scipy.prop(phaenotyp, "pdelta_tol", text="Tolerance (10^x)")
+
 				# disable box
 				if data["panel_grayed"]["scipy"]:
 					box_scipy.enabled = False
@@ -333,16 +333,15 @@ def fill_matrix_members(matrix, result_type, frame, length):
 
 	highest = 0
 	lowest = 0
-	for member_id, member in members.items():
+	for index_in_list, (member_id, member) in enumerate(members.items()):
 		forces = member[result_type][str(frame)]
 
 		if length > 1:
+			# force, overstress and utilization
+			overstress = member["overstress"][str(frame)]
+			utilization = False # utilization is always one value
+
 			for pos_id, force in enumerate(forces):
-				# force, overstress and utilization
-				overstress = member["overstress"][str(frame)]
-				utilization = False # utilization is always one value
-				
-				index_in_list = list(members).index(member_id)
 				matrix[index_in_list][int(pos_id)] = [force, overstress, utilization]
 
 				# find highest